@@ -1,9 +1,37 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import math
-from collections import deque
+import os
+import time
+from edge_editor import SparseEdgeEditor, label_key
+from graph_arrays import CSR, BitsetRows
+from trace_cache import Trace, TraceCache
+from dynamic_bfs import DynamicBFS
+from force_layout import fit
+from layout_cache import LayoutSlot
+from viewport import CulledScene
+import bfs_engine
+from frontier import FifoFrontier, search_steps
+import graph_generators
 
 class BreadthFirstSearchTab(ttk.Frame):
+    # (visited, completed) node colors, one pair per start node in multi-source BFS
+    SOURCE_COLORS = [("lightgreen", "darkgreen"), ("lightblue", "steelblue"),
+                     ("khaki", "darkgoldenrod"), ("plum", "purple"),
+                     ("lightsalmon", "chocolate"), ("aquamarine", "teal")]
+    # The goal side of a bidirectional search
+    BACKWARD_COLORS = ("pink", "mediumvioletred")
+    # BFS tree edges of a finished run (kept up to date as edges are toggled)
+    TREE_EDGE_COLOR = "navy"
+    # Largest graph "Precompute All Pairs" accepts (the table has n² entries)
+    ALL_PAIRS_MAX_NODES = 4000
+    # From this many nodes the circle gives way to a force-directed layout
+    FORCE_LAYOUT_MIN_NODES = 30
+    FORCE_LAYOUT_SECONDS = 5.0
+    # Most canvas items the graph may use; past it edges are bundled (viewport.py)
+    CANVAS_ITEM_BUDGET = 3000
+    ARRAY_LABEL_ROOM = 80       # Pixels left beside an array strip for its label
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -50,17 +78,33 @@ class BreadthFirstSearchTab(ttk.Frame):
         #######################################################################
         self.num_nodes = 0
         self.node_labels = []        # Possibly duplicated user labels
-        self.node_label_entries = [] # The text fields for node names
 
         self.adj_type_var = tk.StringVar(value="matrix")
-        self.adjacency_matrix_vars = []   # 2D of BooleanVar
-        self.adjacency_list_entries = []  # 2D of Entries
+        self.edge_editor = None           # SparseEdgeEditor (edges kept as row -> set)
         self.adjacency_indexed = {}       # int -> list(int) (directed edges)
 
         # BFS
         self.current_delay = 2000  # Slower BFS for clarity
         self.paused = False
         self.bfs_generator = None
+        self.level_sync_var = tk.BooleanVar(value=False)  # One whole BFS level per step
+        self.start_nodes = [0]      # Several start nodes = multi-source BFS
+        self.goal_node = None       # Set = bidirectional search from the starts to it
+        self.source_of = {}         # node -> position in start_nodes of the start that reached it
+        self.touched = set()        # Every node either search direction reached
+        self.path = None            # Bidirectional result (list of nodes, [] if none)
+        self.touched_var = tk.StringVar(value="")
+        self.all_pairs = None       # bfs_engine.DistanceMatrix for all_pairs_adjacency
+        self.all_pairs_adjacency = None
+        # Recorded runs per (graph digest, mode, starts, goal); cleared on any edit
+        self.trace_cache = TraceCache()
+        self.replayed = False       # The current run came out of trace_cache
+        # Finished multi-source run kept up to date through edge edits
+        self.dynamic = None         # DynamicBFS, or None while animating / after a reset
+        self.tree_parent = {}       # node -> parent whose tree edge is drawn highlighted
+        # Force-directed layout for big graphs, cached per graph and box shape
+        self.layout = LayoutSlot(self, self._layout_ready,
+                                 self.FORCE_LAYOUT_MIN_NODES, self.FORCE_LAYOUT_SECONDS)
         self.pre_order_list = []
         self.post_order_list = []
 
@@ -98,13 +142,13 @@ class BreadthFirstSearchTab(ttk.Frame):
         # adjacency type
         ttk.Radiobutton(
             input_top, text="Adjacency Matrix", variable=self.adj_type_var,
-            value="matrix", command=self.clear_adjacency_fields,
+            value="matrix", command=self.switch_adjacency_mode,
             style="Dark.TRadiobutton"
         ).grid(row=1, column=0, columnspan=2, sticky="w", padx=5)
 
         ttk.Radiobutton(
             input_top, text="Adjacency List", variable=self.adj_type_var,
-            value="list", command=self.clear_adjacency_fields,
+            value="list", command=self.switch_adjacency_mode,
             style="Dark.TRadiobutton"
         ).grid(row=2, column=0, columnspan=2, sticky="w", padx=5)
 
@@ -113,16 +157,36 @@ class BreadthFirstSearchTab(ttk.Frame):
                              style="Dark.TButton")
         gen_btn.grid(row=3, column=0, columnspan=2, padx=5, pady=5)  # Span both columns now
 
+        # Seeded random graphs (sized by "Number of nodes")
+        ttk.Label(input_top, text="Random graph:", style="Dark.TLabel")\
+            .grid(row=4, column=0, padx=5, pady=5, sticky="e")
+        self.generator_var = tk.StringVar(value=next(iter(graph_generators.GENERATORS)))
+        ttk.Combobox(input_top, textvariable=self.generator_var, state="readonly", width=18,
+                     values=list(graph_generators.GENERATORS))\
+            .grid(row=4, column=1, padx=5, pady=5)
+
+        ttk.Label(input_top, text="Seed:", style="Dark.TLabel")\
+            .grid(row=5, column=0, padx=5, pady=5, sticky="e")
+        self.seed_entry = ttk.Entry(input_top, width=8)
+        self.seed_entry.grid(row=5, column=1, padx=5, pady=5, sticky="w")
+        self.seed_entry.insert(0, "1")
+
+        ttk.Button(input_top, text="Generate Random Graph", command=self.generate_random_graph,
+                   style="Dark.TButton").grid(row=6, column=0, columnspan=2, padx=5, pady=5)
+
         self.adjacency_frame = ttk.Frame(self.left_frame, style="Dark.TFrame")
         self.adjacency_frame.pack(anchor="nw", fill="both", expand=True, pady=5)
 
     def clear_adjacency_fields(self):
-        """Remove adjacency widgets so we can rebuild them."""
+        """Remove the adjacency editor so we can rebuild it."""
         for child in self.adjacency_frame.winfo_children():
             child.destroy()
-        self.node_label_entries.clear()
-        self.adjacency_matrix_vars.clear()
-        self.adjacency_list_entries.clear()
+        self.edge_editor = None
+
+    def switch_adjacency_mode(self):
+        """Show the same edges as a matrix or as a list."""
+        if self.edge_editor is not None:
+            self.edge_editor.set_mode(self.adj_type_var.get())
 
     def generate_adjacency_fields(self):
         self.clear_adjacency_fields()
@@ -134,115 +198,61 @@ class BreadthFirstSearchTab(ttk.Frame):
         if self.num_nodes < 1:
             return
 
-        # Node label row
-        label_frame = ttk.Frame(self.adjacency_frame, style="Dark.TFrame")
-        label_frame.pack(anchor="nw", pady=5)
+        self.build_edge_editor()
+        self.edge_editor.reset(self.num_nodes, self.adj_type_var.get())
+        self.node_labels = self.edge_editor.labels()
 
-        tk.Label(label_frame, text="Enter each node label:", font=("Arial", 10, "bold"),
-                 bg="#424242", fg="white").pack(anchor="w")
+    def generate_random_graph(self):
+        """Load a seeded random graph of the chosen kind into the editor."""
+        try:
+            n = int(self.num_nodes_entry.get())
+        except ValueError:
+            n = 0
+        if n < 1:
+            return
 
-        row_label_frame = ttk.Frame(label_frame, style="Dark.TFrame")
-        row_label_frame.pack(side="top", anchor="w")
+        seed_text = self.seed_entry.get().strip()
+        try:
+            seed = int(seed_text)
+        except ValueError:
+            seed = seed_text  # Any string is a valid (reproducible) seed too
 
-        for i in range(self.num_nodes):
-            ent = ttk.Entry(row_label_frame, width=7)
-            ent.pack(side="left", padx=5)
-            self.node_label_entries.append(ent)
-        
-        # Add refresh button below the labels
-        ref_btn = ttk.Button(label_frame, text="Refresh Labels", command=self.refresh_labels_only,
-                             style="Dark.TButton")
-        ref_btn.pack(anchor="w", pady=5)
+        adjacency = graph_generators.generate(self.generator_var.get(), n, seed)
 
-        # Build adjacency portion
-        if self.adj_type_var.get() == "matrix":
-            self.build_matrix_inputs()
-        else:
-            self.build_list_inputs()
-
-        self.refresh_labels_only()
-
-    def build_matrix_inputs(self):
-        lbl = tk.Label(self.adjacency_frame, text="Adjacency Matrix", font=("Arial", 14, "bold"),
-                       bg="#424242", fg="white")
-        lbl.pack(anchor="center", pady=5)
-
-        container = ttk.Frame(self.adjacency_frame, style="Dark.TFrame")
-        container.pack(anchor="center")
-
-        # 2D Booleans
-        for r in range(self.num_nodes):
-            row_vars = []
-            for c in range(self.num_nodes):
-                row_vars.append(tk.BooleanVar(value=False))
-            self.adjacency_matrix_vars.append(row_vars)
-
-        # single grid approach
-        corner = tk.Label(container, text="", width=7, bg="#424242")
-        corner.grid(row=0, column=0, padx=5, pady=5)
-
-        self.matrix_col_labels = []
-        for c in range(self.num_nodes):
-            lbl_c = tk.Label(container, text="", width=7, bg="#424242", fg="white",
-                             font=("Arial", 9, "bold"), anchor="center")
-            lbl_c.grid(row=0, column=c+1, padx=5, pady=5)
-            self.matrix_col_labels.append(lbl_c)
-
-        self.matrix_row_labels = []
-        for r in range(self.num_nodes):
-            lbl_r = tk.Label(container, text="", width=7, bg="#424242", fg="white",
-                             font=("Arial", 9, "bold"), anchor="e")
-            lbl_r.grid(row=r+1, column=0, padx=5, pady=5)
-            self.matrix_row_labels.append(lbl_r)
-
-            for c in range(self.num_nodes):
-                var = self.adjacency_matrix_vars[r][c]
-                cb = ttk.Checkbutton(container, variable=var, style="Dark.TCheckbutton")
-                cb.grid(row=r+1, column=c+1, padx=5, pady=5)
-
-    def build_list_inputs(self):
-        lbl = tk.Label(self.adjacency_frame, text="Adjacency List", font=("Arial", 10, "bold"),
-                       bg="#424242", fg="white")
-        lbl.pack(anchor="w", pady=5)
-
-        container = ttk.Frame(self.adjacency_frame, style="Dark.TFrame")
-        container.pack()
-
-        heading_lbl = tk.Label(container, text="Edges", font=("Arial", 9, "bold"),
-                               bg="#424242", fg="white")
-        heading_lbl.grid(row=0, column=1, padx=5, pady=5)
-
-        for r in range(self.num_nodes):
-            row_lbl = tk.Label(container, text="", width=7, bg="#424242", fg="white",
-                               font=("Arial", 9, "bold"), anchor="e")
-            row_lbl.grid(row=r+1, column=0, padx=5, pady=5, sticky="e")
-
-            row_frame = ttk.Frame(container, style="Dark.TFrame")
-            row_frame.grid(row=r+1, column=1, sticky="w")
-
-            row_entries = []
-            for c in range(self.num_nodes):
-                ent = tk.Entry(row_frame, width=7)
-                ent.grid(row=0, column=c, padx=5, pady=5)
-                row_entries.append(ent)
-            self.adjacency_list_entries.append(row_entries)
-
-    def refresh_labels_only(self):
-        self.node_labels = [ent.get().strip() for ent in self.node_label_entries]
-        if self.adj_type_var.get() == "matrix" and hasattr(self, 'matrix_row_labels'):
-            for r, lbl_w in enumerate(self.matrix_row_labels):
-                textval = self.node_labels[r] if r < len(self.node_labels) else ""
-                lbl_w.config(text=textval)
-            for c, lbl_w in enumerate(self.matrix_col_labels):
-                textval = self.node_labels[c] if c < len(self.node_labels) else ""
-                lbl_w.config(text=textval)
-        elif self.adj_type_var.get() == "list" and self.adjacency_list_entries:
-            container = self.adjacency_list_entries[0][0].master.master
-            for r in range(self.num_nodes):
-                label_list = container.grid_slaves(row=r+1, column=0)
-                if label_list:
-                    lbl = label_list[0]
-                    lbl.config(text=self.node_labels[r] if r < len(self.node_labels) else "")
+        self.clear_adjacency_fields()
+        self.num_nodes = len(adjacency)
+        self.num_nodes_entry.delete(0, tk.END)   # The grid rounds n to a rectangle
+        self.num_nodes_entry.insert(0, str(self.num_nodes))
+        self.build_edge_editor()
+        self.edge_editor.set_graph(adjacency)
+        self.node_labels = self.edge_editor.labels()
+
+    def build_edge_editor(self):
+        """Sparse editor: labels in the row headers, widgets only for visible rows."""
+        tk.Label(self.adjacency_frame, text="Node labels and edges (row -> column)",
+                 font=("Arial", 10, "bold"), bg="#424242", fg="white").pack(anchor="w", pady=5)
+
+        self.edge_editor = SparseEdgeEditor(self.adjacency_frame, mode=self.adj_type_var.get())
+        self.edge_editor.pack(anchor="nw", fill="both", expand=True)
+        self.edge_editor.add_listener(self._on_graph_edit)
+
+    def _on_graph_edit(self, change):
+        """
+        Any edit makes every recorded trace stale. After a finished run, an
+        edge toggle also repairs the BFS tree in place (dynamic_bfs) and
+        redraws just the nodes whose distance or tree parent changed.
+        """
+        self.trace_cache.clear()
+        if change[0] == "graph":
+            # A new graph needs a new layout; single edge edits keep the current one
+            self.layout.reset()
+        if self.dynamic is None:
+            return
+        if change[0] == "edge":
+            _, u, v, present = change
+            self._repair(u, v, present)
+        elif change[0] != "weight":
+            self.dynamic = None     # Relabelled or replaced; start again from scratch
 
     ###########################################################################
     # RIGHT: BFS + White Canvas
@@ -259,10 +269,18 @@ class BreadthFirstSearchTab(ttk.Frame):
         start_frame = ttk.Frame(top_frame, style="Dark.TFrame")
         start_frame.pack(side="left", padx=5)
         
-        ttk.Label(start_frame, text="Starting Index:", style="Dark.TLabel").pack(side="left")
-        self.start_index_entry = ttk.Entry(start_frame, width=5)
+        # One or more start labels (several = multi-source BFS)
+        ttk.Label(start_frame, text="Start Label(s):", style="Dark.TLabel").pack(side="left")
+        self.start_index_entry = ttk.Entry(start_frame, width=10)
         self.start_index_entry.pack(side="left", padx=5)
         self.start_index_entry.insert(0, "0")  # Default to 0
+        # Enter: distances for the new start(s) straight from the all-pairs table
+        self.start_index_entry.bind("<Return>", self.show_all_pairs_distances)
+
+        # Optional goal: bidirectional point-to-point search
+        ttk.Label(start_frame, text="Goal:", style="Dark.TLabel").pack(side="left")
+        self.goal_entry = ttk.Entry(start_frame, width=5)
+        self.goal_entry.pack(side="left", padx=5)
         
         start_btn = ttk.Button(start_frame, text="Start Search", command=self.start_bfs,
                                style="Dark.TButton")
@@ -270,6 +288,7 @@ class BreadthFirstSearchTab(ttk.Frame):
 
         order_frame = ttk.Frame(top_frame, style="Dark.TFrame")
         order_frame.pack(side="left", padx=20)
+        ttk.Label(order_frame, textvariable=self.touched_var, style="Dark.TLabel").pack(side="left")
 
         # row1: speed & pause
         control_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
@@ -286,10 +305,26 @@ class BreadthFirstSearchTab(ttk.Frame):
                                             style="Dark.TButton")
         self.pause_play_button.pack(side='left', padx=5)
 
+        ttk.Checkbutton(control_frame, text="Whole level per step", variable=self.level_sync_var,
+                        style="Dark.TCheckbutton").pack(side='left', padx=5)
+
+        ttk.Button(control_frame, text="Precompute All Pairs", command=self.precompute_all_pairs,
+                   style="Dark.TButton").pack(side='left', padx=5)
+
         # row2: White canvas
         self.canvas = tk.Canvas(self.right_frame, bg="white", width=700, height=500, highlightthickness=0)
         self.canvas.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
 
+        # Graph items live in a zoomable scene; only the ones in view are real canvas items
+        self.scene = CulledScene(self.canvas, overlay_tags=("distance_array", "order_arrays", "initial_nodes"),
+                                 item_budget=self.CANVAS_ITEM_BUDGET)
+        self.canvas.bind("<MouseWheel>", lambda e: self._zoom_at(e, 1.2 if e.delta > 0 else 1 / 1.2))
+        self.canvas.bind("<Button-4>", lambda e: self._zoom_at(e, 1.2))
+        self.canvas.bind("<Button-5>", lambda e: self._zoom_at(e, 1 / 1.2))
+        self.canvas.bind("<ButtonPress-1>", self._pan_start)
+        self.canvas.bind("<B1-Motion>", self._pan_drag)
+        self.canvas.bind("<Double-Button-1>", lambda e: self.scene.reset_view())
+
         # Add canvas resize event to update array positions
         self.canvas.bind("<Configure>", self._on_canvas_resize)
         
@@ -309,101 +344,262 @@ class BreadthFirstSearchTab(ttk.Frame):
     # BFS Start
     ###########################################################################
     def start_bfs(self):
-        # Reset BFS data
-        self.pre_order_list.clear()
-        self.post_order_list.clear()  # Keep this to reset the list, but not the label
-        
-        self.canvas.delete("all")
-        self.node_positions.clear()
-        self.node_circles.clear()
-        self.node_halo = None
-        self.halo_node = None
-        self.edge_lines.clear()
+        self._clear_drawing()
 
         # Build adjacency from matrix or list
         if not self.build_indexed_adjacency():
             return
 
+        # Start labels (one or more) and optional goal
+        self._read_starts()
+        try:
+            goals = self._parse_nodes(self.goal_entry.get())
+        except ValueError as e:
+            messagebox.showerror("Invalid Goal", str(e))
+            return
+        if len(goals) > 1:
+            messagebox.showerror("Invalid Goal", "Give a single goal label.")
+            return
+        self.goal_node = goals[0] if goals else None
+        self.source_of = {}
+        self.touched = set()
+        self.path = None
+        self.touched_var.set("")
+
         # Draw
         self.draw_graph_initial()
 
-        # Get starting index from entry
-        try:
-            start_idx = int(self.start_index_entry.get())
-            if start_idx < 0 or start_idx >= self.num_nodes:
-                messagebox.showwarning("Invalid Start Index", 
-                                      f"Start index must be between 0 and {self.num_nodes-1}. Using 0 instead.")
-                start_idx = 0
-                self.start_index_entry.delete(0, tk.END)
-                self.start_index_entry.insert(0, "0")
-        except ValueError:
-            messagebox.showwarning("Invalid Start Index", 
-                                  "Start index must be a number. Using 0 instead.")
-            start_idx = 0
-            self.start_index_entry.delete(0, tk.END)
-            self.start_index_entry.insert(0, "0")
-
-        # BFS from specified start node
+        # BFS from the start node(s)
         if self.num_nodes > 0:
             # Initialize distances
             self.distances = {i: float('inf') for i in range(self.num_nodes)}
-            self.distances[start_idx] = 0
-            
+            for idx in self.start_nodes:
+                self.distances[idx] = 0
+
             # Draw distance array
             self._draw_distance_array()
-            
-            # Start BFS
-            self.bfs_generator = self.bfs_steps(start_idx)
+
+            # Start BFS (edge by edge, or a whole level at a time; the matrix
+            # input is dense, so its levels are expanded with row bitsets).
+            # A run recorded earlier on this graph is replayed instead.
+            if self.goal_node is not None:
+                mode = "bidirectional"
+            elif self.level_sync_var.get() and self.adj_type_var.get() == "matrix":
+                mode = "bitset levels"
+            elif self.level_sync_var.get():
+                mode = "levels"
+            else:
+                mode = "edges"
+            digest = self.edge_editor.digest() if self.edge_editor is not None else None
+            key = (digest, mode, tuple(self.start_nodes), self.goal_node)
+            trace = self.trace_cache.get(key)
+            self.replayed = trace is not None
+            if trace is None:
+                trace = self._record(mode)
+                self.trace_cache.put(key, trace)
+            self.bfs_generator = self._replay(trace)
             self.after(self.current_delay, self.visualize_step)
         else:
             self.bfs_generator = None
 
-    def build_indexed_adjacency(self):
-        """Read adjacency; treat each row->col check as a directed edge r->c."""
-        self.node_labels = [ent.get().strip() for ent in self.node_label_entries]
-        self.adjacency_indexed = {i: [] for i in range(self.num_nodes)}
-
-        if self.adj_type_var.get() == "matrix":
-            if len(self.adjacency_matrix_vars) != self.num_nodes:
-                return True
-            for r in range(self.num_nodes):
-                for c in range(self.num_nodes):
-                    if self.adjacency_matrix_vars[r][c].get():
-                        self.adjacency_indexed[r].append(c)
+    def _record(self, mode):
+        """Run the search for mode to the end and keep its events and final state."""
+        if mode == "bidirectional":
+            steps = self.bfs_bidirectional_steps(self.start_nodes, self.goal_node)
+        elif mode == "bitset levels":
+            steps = self.bfs_bitset_level_steps(self.start_nodes)
+        elif mode == "levels":
+            steps = self.bfs_level_steps(self.start_nodes)
         else:
-            if len(self.adjacency_list_entries) != self.num_nodes:
-                return True
-            for r in range(self.num_nodes):
-                row_ents = self.adjacency_list_entries[r]
-                for c in range(len(row_ents)):
-                    typed = row_ents[c].get().strip()
-                    if typed:
-                        # find index with that label
-                        matches = [idx for idx, lab in enumerate(self.node_labels) if lab == typed]
-                        if not matches:
-                            messagebox.showerror(
-                                "Invalid Label",
-                                f"Node {r} typed '{typed}' but no node has that label."
-                            )
-                            return False
-                        # take first match
-                        self.adjacency_indexed[r].append(matches[0])
+            steps = self.bfs_steps(self.start_nodes)
+        events = list(steps)
+        return Trace(events, {"distances": self.distances, "source_of": self.source_of,
+                              "touched": self.touched})
+
+    def _replay(self, trace):
+        """
+        Yield a recorded run's events, redoing the generator's side effects
+        (pre-order, distances) as it did them, one event at a time.
+        """
+        final = trace.state["distances"]
+        self.pre_order_list.clear()
+        self.distances = {i: float('inf') for i in range(self.num_nodes)}
+        for idx in self.start_nodes:
+            self.distances[idx] = 0
+        self.source_of = trace.state["source_of"]
+        self.touched = trace.state["touched"]
+        for event in trace.events:
+            if event[0] == "visit":
+                self.distances[event[1]] = final[event[1]]
+                self.pre_order_list.append(self.node_labels[event[1]])
+            elif event[0] == "level":
+                for idx in event[3]:
+                    self.distances[idx] = final[idx]
+                self.pre_order_list.extend(self.node_labels[idx] for idx in event[3])
+            yield event
+
+    def _clear_drawing(self):
+        """Reset BFS data and the canvas."""
+        self.bfs_generator = None
+        self.dynamic = None
+        self.tree_parent = {}
+        self.pre_order_list.clear()
+        self.post_order_list.clear()  # Keep this to reset the list, but not the label
 
+        self.canvas.delete("all")
+        self.scene.clear()
+        self.node_positions.clear()
+        self.node_circles.clear()
+        self.node_halo = None
+        self.halo_node = None
+        self.edge_lines.clear()
+
+    def _read_starts(self):
+        try:
+            self.start_nodes = self._parse_nodes(self.start_index_entry.get()) or [0]
+        except ValueError as e:
+            messagebox.showwarning("Invalid Start", f"{e} Using node 0 instead.")
+            self.start_nodes = [0]
+            self.start_index_entry.delete(0, tk.END)
+            self.start_index_entry.insert(0, "0")
+
+    def _parse_nodes(self, text):
+        """Node indexes for the labels in text (commas or spaces); a plain index also works."""
+        nodes = []
+        for token in text.replace(",", " ").split():
+            if token in self.node_labels:
+                idx = self.node_labels.index(token)
+            else:
+                try:
+                    idx = int(token)
+                except ValueError:
+                    raise ValueError(f"No node is labelled '{token}'.")
+                if idx < 0 or idx >= self.num_nodes:
+                    raise ValueError(f"Start index must be between 0 and {self.num_nodes-1}.")
+            if idx not in nodes:
+                nodes.append(idx)
+        return nodes
+
+    ###########################################################################
+    # All-pairs table: switch start nodes without running the search again
+    ###########################################################################
+    def precompute_all_pairs(self):
+        """BFS from every node once (on a process pool for bigger graphs) into a uint16/uint32 table."""
+        if not self.build_indexed_adjacency() or self.num_nodes < 1:
+            return
+        if self.num_nodes > self.ALL_PAIRS_MAX_NODES:
+            messagebox.showwarning("Graph Too Large",
+                                   f"The all-pairs table is kept for up to {self.ALL_PAIRS_MAX_NODES} "
+                                   f"nodes ({self.num_nodes} given).")
+            return
+        began = time.perf_counter()
+        workers = (os.cpu_count() or 1) if self.num_nodes > 500 else 1
+        self.all_pairs = bfs_engine.all_pairs(CSR.from_adjacency(self.adjacency_indexed), workers)
+        self.all_pairs_adjacency = {i: sorted(nbrs) for i, nbrs in self.adjacency_indexed.items()}
+        seconds = time.perf_counter() - began
+        kind = "uint16" if self.all_pairs.data.typecode == "H" else "uint32"
+        self.show_all_pairs_distances()
+        self.touched_var.set(f"All pairs: {self.num_nodes}x{self.num_nodes} {kind} table, "
+                             f"{self.all_pairs.nbytes() / 1024:.0f} KB in {seconds:.2f} s. "
+                             f"Press Enter in the start box to switch starts.")
+
+    def show_all_pairs_distances(self, event=None):
+        """
+        Fill the distance array for the start label(s) from the all-pairs
+        table (the smallest row entry when there are several starts). If
+        the graph was edited since the table was built, run the search.
+        """
+        if not self.build_indexed_adjacency():
+            return
+        current = {i: sorted(nbrs) for i, nbrs in self.adjacency_indexed.items()}
+        if self.all_pairs is None or current != self.all_pairs_adjacency:
+            self.all_pairs = None
+            self.start_bfs()
+            return
+
+        self._clear_drawing()
+        self._read_starts()
+        self.goal_node = None
+        self.path = None
+        unreached = self.all_pairs.unreached
+        rows = [self.all_pairs.row(idx) for idx in self.start_nodes]
+        self.distances = {}
+        for i in range(self.num_nodes):
+            d = min(row[i] for row in rows)
+            self.distances[i] = float('inf') if d == unreached else d
+
+        self.draw_graph_initial()
+        self.update_distance_visualization()
+        for i, d in self.distances.items():
+            if d != float('inf'):
+                self._color_node(i, "darkgreen" if d == 0 else "lightgreen")
+        reached = sum(1 for d in self.distances.values() if d != float('inf'))
+        self.touched_var.set(f"From the all-pairs table: {reached} of {self.num_nodes} nodes reachable.")
+
+    def build_indexed_adjacency(self):
+        """Read adjacency; treat each row->col check as a directed edge r->c."""
+        if self.edge_editor is None:
+            self.node_labels = []
+            self.adjacency_indexed = {}
+            return True
+
+        self.node_labels = self.edge_editor.labels()
+        self.adjacency_indexed = self.edge_editor.adjacency()
+
+        # List mode: a typed label that matches no node is an error
+        for r in sorted(self.edge_editor.unresolved):
+            typed = self.edge_editor.unresolved[r][0]
+            messagebox.showerror(
+                "Invalid Label",
+                f"Node {r} typed '{typed}' but no node has that label."
+            )
+            return False
         return True
 
     ###########################################################################
     # Drawing: White Canvas
     ###########################################################################
     def draw_graph_initial(self):
-        """Draw nodes in a circle, color them gray. 
+        """Draw nodes in a circle (or the force-directed layout), color them gray. 
            Store each directed edge in edge_lines so we can highlight them.
         """
-        w = self.canvas.winfo_width() or 700
-        h = self.canvas.winfo_height() or 500
-        
         # Draw the initial node array at the top
         self._draw_initial_nodes_array()
+
+        n = self.num_nodes
+        if n < 1:
+            return
+
+        # place nodes (in a circle until a force-directed layout is ready)
+        self.layout.set_graph(self.adjacency_indexed)
+        self.node_positions = self._node_placement()
+
+        # draw edges
+        for i in range(n):
+            for j in self.adjacency_indexed[i]:
+                line_id = self._draw_directed_edge(i, j, color="black")  
+                # store in dictionary
+                self.edge_lines[(i, j)] = line_id
+
+        # draw nodes (gray)
+        for i, (nx, ny) in self.node_positions.items():
+            c_id = self.scene.create_oval(nx-20, ny-20, nx+20, ny+20,
+                                          fill="gray", outline="black", width=2)
+            label = self.node_labels[i] if i < len(self.node_labels) else str(i)
+            t_id = self.scene.create_text(nx, ny, text=label, font=("Arial", 10, "bold"))
+            self.node_circles[i] = (c_id, t_id)
+
+        # Create empty boxes for pre-order and post-order
+        self._draw_order_arrays()
         
+        # Create distance array visualization
+        self._draw_distance_array()
+
+    def _graph_circle(self):
+        """(cx, cy, radius) of the graph area, between the arrays drawn around it."""
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+
         # Center coordinates, adjust to account for the distance array on the left
         # Move down to account for the initial nodes array at top
         cx = w//2 + 30  # Shift right by 30 pixels to account for the distance array
@@ -418,45 +614,61 @@ class BreadthFirstSearchTab(ttk.Frame):
         
         # Adjust radius to ensure graph fits within available space
         radius = min(cx - 60, available_height//2 - 20) - 30
+        return cx, cy, radius
 
-        n = self.num_nodes
-        if n < 1:
-            return
+    def _graph_box(self):
+        """(x0, y0, x1, y1) a laid-out graph may fill, clear of the arrays around it."""
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+        return 150, 80 + 20, w - 40, h - 80 - 20
 
-        # place nodes in circle
+    def _node_placement(self):
+        """index -> (x, y): the force-directed layout once there is one, else a circle."""
+        x0, y0, x1, y1 = self._graph_box()
+        found = self.layout.coords(x1 - x0, y1 - y0)
+        if found is not None:
+            coords, aspect = found
+            return dict(enumerate(fit(coords, x0, y0, x1, y1, aspect)))
+
+        cx, cy, radius = self._graph_circle()
+        n = self.num_nodes
+        positions = {}
         if n == 1:
-            self.node_positions[0] = (cx, cy)
+            positions[0] = (cx, cy)
         else:
             angle_step = 2*math.pi / n
             for i in range(n):
                 angle = i * angle_step
                 x = cx + radius * math.cos(angle)
                 y = cy + radius * math.sin(angle)
-                self.node_positions[i] = (x, y)
-
-        # draw edges
-        for i in range(n):
-            for j in self.adjacency_indexed[i]:
-                line_id = self._draw_directed_edge(i, j, color="black")  
-                # store in dictionary
-                self.edge_lines[(i, j)] = line_id
-
-        # draw nodes (gray)
-        for i, (nx, ny) in self.node_positions.items():
-            c_id = self.canvas.create_oval(nx-20, ny-20, nx+20, ny+20,
-                                           fill="gray", outline="black", width=2)
-            label = self.node_labels[i] if i < len(self.node_labels) else str(i)
-            t_id = self.canvas.create_text(nx, ny, text=label, font=("Arial", 10, "bold"))
-            self.node_circles[i] = (c_id, t_id)
-
-        # Create empty boxes for pre-order and post-order
-        self._draw_order_arrays()
-        
-        # Create distance array visualization
-        self._draw_distance_array()
+                positions[i] = (x, y)
+        return positions
+
+    def _layout_ready(self):
+        """A layout for this graph just arrived: move whatever is drawn onto it."""
+        if self.num_nodes and len(self.node_circles) == self.num_nodes:
+            self._move_nodes(self._node_placement())
+
+    def _move_nodes(self, positions):
+        """Move the drawn nodes and their edges, keeping every color."""
+        self.node_positions = positions
+        for i, (x, y) in positions.items():
+            c_id, t_id = self.node_circles[i]
+            self.scene.coords(c_id, x-20, y-20, x+20, y+20)
+            self.scene.coords(t_id, x, y)
+        for (i, j), line_id in self.edge_lines.items():
+            self.scene.coords(line_id, *self._edge_points(i, j))
+        if self.halo_node is not None:
+            self._halo_node(self.halo_node)
 
     def _draw_directed_edge(self, i, j, color="black"):
         """Draw arrow from i->j in the given color, return line_id."""
+        return self.scene.create_line(
+            *self._edge_points(i, j), fill=color, width=2, arrow=tk.LAST
+        )
+
+    def _edge_points(self, i, j):
+        """(x1, y1, x2, y2) of the arrow i->j, from rim to rim of the node circles."""
         x1, y1 = self.node_positions[i]
         x2, y2 = self.node_positions[j]
         
@@ -470,35 +682,32 @@ class BreadthFirstSearchTab(ttk.Frame):
             # Adjust endpoints to stop at the circle edge (radius 20)
             x2, y2 = x2 - udx*20, y2 - udy*20
             x1, y1 = x1 + udx*20, y1 + udy*20
-        
-        return self.canvas.create_line(
-            x1, y1, x2, y2, fill=color, width=2, arrow=tk.LAST
-        )
+        return x1, y1, x2, y2
 
     def _draw_order_arrays(self):
-        """Draw empty boxes for pre-order at the bottom of the canvas."""
+        """Draw empty boxes for pre-order at the bottom of the canvas.
+
+        Only as many boxes as fit across the canvas are drawn; once the
+        pre-order outgrows them they show its newest labels.
+        """
         # Clear any existing arrays
         self.canvas.delete("order_arrays")
         
         w = self.canvas.winfo_width() or 700
         h = self.canvas.winfo_height() or 500
         
-        # Initialize arrays to store the box IDs for updating later
-        self.pre_order_boxes = []
-        # self.post_order_boxes = []  # Comment out post-order boxes
-        
         # Set dimensions for the boxes
         box_width = 30
         box_height = 30
         margin = 10
-        y_pre = h - box_height - margin - 20  # Adjust since we only have one row now
-        # y_post = h - box_height - margin  # Comment out
+        y_pre = h - box_height - margin - 20
+        slots = self._array_slots(self.num_nodes, w - 2 * self.ARRAY_LABEL_ROOM, box_width + margin)
         
         # Calculate starting x coordinate to center the arrays
-        start_x = (w - (self.num_nodes * (box_width + margin))) / 2
+        start_x = (w - (slots * (box_width + margin))) / 2
         
         # Draw "Pre-order:" label with black text right next to the first box
-        self.canvas.create_text(
+        self.pre_order_label = self.canvas.create_text(
             start_x - 5, y_pre + box_height/2, 
             text="Pre-order:", 
             anchor="e", 
@@ -507,38 +716,21 @@ class BreadthFirstSearchTab(ttk.Frame):
             tags="order_arrays"
         )
         
-        # Comment out post-order label
-        # self.canvas.create_text(
-        #     start_x - 5, y_post + box_height/2, 
-        #     text="Post-order:", 
-        #     anchor="e", 
-        #     font=("Arial", 10, "bold"), 
-        #     fill="black", 
-        #     tags="order_arrays"
-        # )
-        
-        # Draw empty boxes for pre-order
-        for i in range(self.num_nodes):
+        # Draw empty boxes for pre-order, remembering what each one shows
+        self.pre_order_boxes = []
+        for i in range(slots):
             x = start_x + i * (box_width + margin)
             box_id = self.canvas.create_rectangle(x, y_pre, x + box_width, y_pre + box_height,
                                                 fill="white", outline="black", tags="order_arrays")
             text_id = self.canvas.create_text(x + box_width/2, y_pre + box_height/2, 
                                             text="", font=("Arial", 10), fill="black", tags="order_arrays")
             self.pre_order_boxes.append((box_id, text_id))
-        
-        # Comment out post-order boxes
-        # Draw empty boxes for post-order
-        # for i in range(self.num_nodes):
-        #     x = start_x + i * (box_width + margin)
-        #     box_id = self.canvas.create_rectangle(x, y_post, x + box_width, y_post + box_height,
-        #                                         fill="white", outline="black", tags="order_arrays")
-        #     text_id = self.canvas.create_text(x + box_width/2, y_post + box_height/2, 
-        #                                     text="", font=("Arial", 10), fill="black", tags="order_arrays")
-        #     self.post_order_boxes.append((box_id, text_id))
+        self.pre_order_shown = [None] * slots
+        self.pre_order_first = 0
+        self.scene.reserve("order_arrays", 1 + 2 * slots)
         
         # Immediately update with current values
         self._update_pre_order_visualization()
-        # self._update_post_order_visualization()  # Comment out
 
     def _draw_distance_array(self):
         """Draw a vertical array showing distances from the start node to all nodes"""
@@ -548,32 +740,30 @@ class BreadthFirstSearchTab(ttk.Frame):
         w = self.canvas.winfo_width() or 700
         h = self.canvas.winfo_height() or 500
         
-        # Get starting index
-        try:
-            start_idx = int(self.start_index_entry.get())
-            if start_idx < 0 or start_idx >= self.num_nodes:
-                start_idx = 0
-        except (ValueError, AttributeError):
-            start_idx = 0
-        
+        # Start node(s)
+        starts = [idx for idx in self.start_nodes if idx < self.num_nodes] or [0]
+        start_text = ", ".join(self.node_labels[idx] for idx in starts)
+
         # Make sure distances is initialized
         if not hasattr(self, 'distances') or self.distances is None:
             self.distances = {i: float('inf') for i in range(self.num_nodes)}
-            self.distances[start_idx] = 0
+            for idx in starts:
+                self.distances[idx] = 0
         
-        # Initialize array to store box IDs
-        self.distance_boxes = []
+        rows = [i for i in range(self.num_nodes) if i not in starts]
         
         # Set dimensions for the boxes
         box_width = 40
         box_height = 30
         margin = 5
         x_pos = 70  # Fixed position on the left side
+        # Rows that fit between the header and the pre-order strip
+        slots = self._array_slots(len(rows), h - 50 - 2 * (box_height + margin) - 70, box_height + margin)
         
         # Draw "Distances from node X:" label
         self.canvas.create_text(
             x_pos, 20, 
-            text=f"Distances from node {self.node_labels[start_idx]}:", 
+            text=f"Distances from node {start_text}:", 
             anchor="n", 
             font=("Arial", 11, "bold"), 
             fill="black",
@@ -589,20 +779,16 @@ class BreadthFirstSearchTab(ttk.Frame):
         )
         self.canvas.create_text(
             x_pos + box_width/2, 50 + box_height/2,
-            text=self.node_labels[start_idx], 
+            text=start_text, 
             font=("Arial", 10, "bold"),
             fill="black",
             tags="distance_array"
         )
         
-        # Draw vertical array (skip starting index)
-        row = 0
-        for i in range(self.num_nodes):
-            if i == start_idx:  # Skip the starting index
-                continue
-            
+        # Draw vertical array (skip starting index), as far down as there is room
+        self.distance_boxes = []
+        for row, i in enumerate(rows[:slots]):
             y = 50 + (row + 1) * (box_height + margin)
-            row += 1
             
             # Row label (node)
             self.canvas.create_rectangle(
@@ -619,45 +805,64 @@ class BreadthFirstSearchTab(ttk.Frame):
                 tags="distance_array"
             )
             
-            # Distance value
+            # Distance value, filled in by update_distance_visualization
             box_id = self.canvas.create_rectangle(
                 x_pos, y, 
                 x_pos + box_width, y + box_height,
                 fill="white", outline="black", 
                 tags="distance_array"
             )
-            
-            # Display the distance (infinity as "∞")
-            dist_text = "∞" if self.distances[i] == float('inf') else str(self.distances[i])
             text_id = self.canvas.create_text(
                 x_pos + box_width/2, y + box_height/2,
-                text=dist_text, 
+                text="", 
                 font=("Arial", 10),
                 fill="black",
                 tags="distance_array"
             )
             
             self.distance_boxes.append((box_id, text_id, i))
+        self.distance_shown = [None] * len(self.distance_boxes)
+        
+        hidden = len(rows) - slots
+        if hidden:
+            self.canvas.create_text(
+                x_pos - margin, 50 + (slots + 1) * (box_height + margin) + box_height/2,
+                text=f"+{hidden} more",
+                font=("Arial", 10, "italic"),
+                fill="black",
+                tags="distance_array"
+            )
+        self.scene.reserve("distance_array", 3 + 4 * slots + (1 if hidden else 0))
+        self.update_distance_visualization()
 
     def update_distance_visualization(self):
         """Update the distance array visualization with current distances"""
         if not hasattr(self, 'distance_boxes') or not self.distance_boxes:
             return
         
-        for box_id, text_id, node_idx in self.distance_boxes:
+        # Only the drawn rows whose distance changed since they were last drawn
+        for row, (box_id, text_id, node_idx) in enumerate(self.distance_boxes):
+            distance = self.distances[node_idx]
+            if distance == self.distance_shown[row]:
+                continue
+            self.distance_shown[row] = distance
             # Display the distance (infinity as "∞")
-            dist_text = "∞" if self.distances[node_idx] == float('inf') else str(self.distances[node_idx])
+            dist_text = "∞" if distance == float('inf') else str(distance)
             self.canvas.itemconfig(text_id, text=dist_text)
             
             # Color code based on distance
-            if self.distances[node_idx] == float('inf'):
+            if distance == float('inf'):
                 self.canvas.itemconfig(box_id, fill="white")
             else:
                 # Color gradient based on distance
-                intensity = max(0, 255 - self.distances[node_idx] * 40)
+                intensity = max(0, 255 - distance * 40)
                 color = f"#{intensity:02x}{intensity:02x}ff"
                 self.canvas.itemconfig(box_id, fill=color)
 
+    def _array_slots(self, length, room, step):
+        """How many of an array's length slots fit in room pixels, step apart (at least one)."""
+        return min(length, max(1, int(room // step)))
+
     def visualize_step(self):
         if self.paused or not self.bfs_generator:
             return
@@ -666,7 +871,7 @@ class BreadthFirstSearchTab(ttk.Frame):
             if event[0] == "visit":
                 # event = ("visit", node_idx)
                 _, idx = event
-                self._color_node(idx, "lightgreen")
+                self._color_node(idx, self._source_color(idx))
                 # Don't highlight node with halo when first visiting
                 # self._halo_node(idx)
                 
@@ -693,28 +898,160 @@ class BreadthFirstSearchTab(ttk.Frame):
                 # event = ("completed", node_idx)
                 # This node has had all its outgoing edges explored
                 _, idx = event
-                self._color_node(idx, "darkgreen")  # Turn the node darkgreen (was red)
-            
+                self._color_node(idx, self._source_color(idx, completed=True))  # Darker shade (was red)
+
+            elif event[0] == "level":
+                # event = ("level", depth, expanded_nodes, new_nodes, tree_edges)
+                _, depth, expanded, new_nodes, tree_edges = event
+                self._paint_level(expanded, new_nodes, tree_edges)
+
+            elif event[0] == "back_edge":
+                # event = ("back_edge", i, j): goal side at i looks back along the edge j->i
+                _, i, j = event
+                self._color_node(i, "red")
+                self._highlight_edge(j, i, "magenta")
+                self._halo_node(j)
+
+            elif event[0] == "back_visit":
+                _, idx = event
+                self._color_node(idx, self.BACKWARD_COLORS[0])
+
+            elif event[0] == "back_completed":
+                _, idx = event
+                self._color_node(idx, self.BACKWARD_COLORS[1])
+
+            elif event[0] == "meet":
+                # event = ("meet", path): the shortest path, or [] if the sides never met
+                _, self.path = event
+
         except StopIteration:
             # BFS complete
             self._halo_node(None)
             
             # Turn all arrows green when BFS is done
             for edge_pair, line_id in self.edge_lines.items():
-                self.canvas.itemconfig(line_id, fill="green", width=2)
-            
+                self.scene.itemconfig(line_id, fill="green", width=2)
+
+            if self.goal_node is None:
+                self.dynamic = DynamicBFS(self.adjacency_indexed, self.start_nodes)
+                for v, p in enumerate(self.dynamic.parent):
+                    if p >= 0:
+                        self._draw_tree_edge(v, p)
+
+            if self.path:
+                for edge_pair in zip(self.path, self.path[1:]):
+                    if edge_pair in self.edge_lines:
+                        line_id = self.edge_lines[edge_pair]
+                        self.scene.itemconfig(line_id, fill="red", width=4)
+                        self.scene.tag_raise(line_id)
+                for idx in self.path:
+                    self._color_node(idx, "gold")
+            self.touched_var.set(self._touched_text())
             return
 
         self.after(self.current_delay, self.visualize_step)
 
+    ###########################################################################
+    # Live repair after the run: edge toggles patch the finished BFS tree
+    ###########################################################################
+    def _repair(self, u, v, present):
+        if present:
+            changed = self.dynamic.insert_edge(u, v)
+            self.adjacency_indexed[u] = sorted(self.adjacency_indexed[u] + [v])
+            line_id = self._draw_directed_edge(u, v, color="green")
+            self.scene.tag_lower(line_id)
+            self.edge_lines[(u, v)] = line_id
+        else:
+            changed = self.dynamic.delete_edge(u, v)
+            self.adjacency_indexed[u] = [w for w in self.adjacency_indexed[u] if w != v]
+            if (u, v) in self.edge_lines:
+                self.scene.delete(self.edge_lines.pop((u, v)))
+            if self.tree_parent.get(v) == u:
+                del self.tree_parent[v]
+
+        for idx in changed:
+            d = self.dynamic.dist[idx]
+            self.distances[idx] = d if d >= 0 else float('inf')
+            if d >= 0:
+                self.source_of[idx] = self.dynamic.source[idx]
+                self.touched.add(idx)
+                self._color_node(idx, self._source_color(idx, completed=True))
+            else:
+                self.source_of.pop(idx, None)
+                self.touched.discard(idx)
+                self._color_node(idx, "gray")
+            self._draw_tree_edge(idx, self.dynamic.parent[idx])
+        self.update_distance_visualization()
+        reached = sum(1 for d in self.dynamic.dist if d >= 0)
+        self.touched_var.set(f"Edge {self.node_labels[u]} -> {self.node_labels[v]} "
+                             f"{'added' if present else 'removed'}: {len(changed)} nodes repaired, "
+                             f"{reached} of {self.num_nodes} reachable")
+
+    def _draw_tree_edge(self, v, p):
+        """Move v's tree highlight from its old parent edge to p -> v (p == -1: none)."""
+        old = self.tree_parent.pop(v, None)
+        if old is not None and (old, v) in self.edge_lines:
+            self.scene.itemconfig(self.edge_lines[(old, v)], fill="green", width=2)
+        if p >= 0 and (p, v) in self.edge_lines:
+            line_id = self.edge_lines[(p, v)]
+            self.scene.itemconfig(line_id, fill=self.TREE_EDGE_COLOR, width=3)
+            self.scene.tag_raise(line_id)
+            self.tree_parent[v] = p
+
+    def _paint_level(self, expanded, new_nodes, tree_edges):
+        """Draw one whole BFS level in a single pass."""
+        self._halo_node(None)
+        for idx in expanded:
+            self._color_node(idx, self._source_color(idx, completed=True))
+        # Edges of the previous level go back to black, this level's tree edges turn red
+        for line_id in getattr(self, 'level_edge_lines', []):
+            self.scene.itemconfig(line_id, fill="black", width=2)
+        self.level_edge_lines = []
+        for edge_pair in tree_edges:
+            if edge_pair in self.edge_lines:
+                line_id = self.edge_lines[edge_pair]
+                self.scene.itemconfig(line_id, fill="red", width=3)
+                self.scene.tag_raise(line_id)
+                self.level_edge_lines.append(line_id)
+        for idx in new_nodes:
+            self._color_node(idx, self._source_color(idx))
+        self._update_pre_order_visualization()
+        self.update_distance_visualization()
+
+    def _source_color(self, idx, completed=False):
+        """Color of a node reached from the start at position source_of[idx]."""
+        visited, done = self.SOURCE_COLORS[self.source_of.get(idx, 0) % len(self.SOURCE_COLORS)]
+        return done if completed else visited
+
+    def _touched_text(self):
+        """How much of the graph the finished search had to reach."""
+        touched = f"touched {len(self.touched)} of {self.num_nodes} nodes"
+        if self.replayed:
+            touched += " (replayed from the trace cache)"
+        if self.goal_node is None:
+            sources = len(self.start_nodes)
+            return f"{sources} start{'s' if sources > 1 else ''}: {touched}"
+        goal = self.node_labels[self.goal_node]
+        if not self.path:
+            return f"Bidirectional: no path to {goal}, {touched}"
+        return f"Bidirectional: {len(self.path) - 1} edges to {goal}, {touched}"
+
     def _update_pre_order_visualization(self):
         """Update the pre-order array visualization with current values"""
-        for i, label in enumerate(self.pre_order_list):
-            if i < len(self.pre_order_boxes):
-                box_id, text_id = self.pre_order_boxes[i]
-                self.canvas.itemconfig(text_id, text=label)
-                # Change box color to light green to make it more visible
-                self.canvas.itemconfig(box_id, fill="#e0ffe0")
+        # The boxes show the newest labels once the pre-order outgrows them
+        first = max(0, len(self.pre_order_list) - len(self.pre_order_boxes))
+        if first != self.pre_order_first:
+            self.pre_order_first = first
+            self.canvas.itemconfig(self.pre_order_label, text=f"Pre-order (+{first}):" if first else "Pre-order:")
+        for slot, (box_id, text_id) in enumerate(self.pre_order_boxes):
+            i = first + slot
+            label = self.pre_order_list[i] if i < len(self.pre_order_list) else None
+            if label == self.pre_order_shown[slot]:
+                continue
+            self.pre_order_shown[slot] = label
+            self.canvas.itemconfig(text_id, text=label or "")
+            # Change box color to light green to make it more visible
+            self.canvas.itemconfig(box_id, fill="white" if label is None else "#e0ffe0")
 
     def _update_post_order_visualization(self):
         """Update the post-order array visualization with current values"""
@@ -732,12 +1069,12 @@ class BreadthFirstSearchTab(ttk.Frame):
         if idx not in self.node_circles:
             return
         c_id, _ = self.node_circles[idx]
-        self.canvas.itemconfig(c_id, fill=color)
+        self.scene.itemconfig(c_id, fill=color)
 
     def _halo_node(self, idx):
         # remove old halo
         if self.node_halo is not None:
-            self.canvas.delete(self.node_halo)
+            self.scene.delete(self.node_halo)
             self.node_halo = None
             self.halo_node = None
 
@@ -746,7 +1083,7 @@ class BreadthFirstSearchTab(ttk.Frame):
         self.halo_node = idx
         x, y = self.node_positions[idx]
         radius = 26
-        self.node_halo = self.canvas.create_oval(
+        self.node_halo = self.scene.create_oval(
             x - radius, y - radius, x + radius, y + radius,
             outline="red", width=3, dash=(4,2)
         )
@@ -760,9 +1097,9 @@ class BreadthFirstSearchTab(ttk.Frame):
                 (old_i, old_j) = edge_pair
                 if (old_i, old_j) in self.edge_lines:
                     line_id = self.edge_lines[(old_i, old_j)]
-                    self.canvas.itemconfig(line_id, fill="black")
+                    self.scene.itemconfig(line_id, fill="black")
                     # Make sure it's at its normal z-order
-                    self.canvas.tag_lower(line_id)
+                    self.scene.tag_lower(line_id)
             self.last_edge_highlight = None
 
         # Only highlight the specific edge i->j, not both directions
@@ -773,72 +1110,245 @@ class BreadthFirstSearchTab(ttk.Frame):
             (from_node, to_node) = edge_pair
             if (from_node, to_node) in self.edge_lines:
                 line_id = self.edge_lines[(from_node, to_node)]
-                self.canvas.itemconfig(line_id, fill=color, width=3)  # Make it a bit thicker too
+                self.scene.itemconfig(line_id, fill=color, width=3)  # Make it a bit thicker too
                 # Raise the highlighted edge to the top to ensure it's visible
-                self.canvas.tag_raise(line_id)
+                self.scene.tag_raise(line_id)
         
         # Remember highlighted edge
         self.last_edge_highlight = edges_to_highlight
 
     def _on_canvas_resize(self, event):
-        """Redraw the order arrays when canvas is resized"""
+        """Redraw the order arrays and rescale the graph when canvas is resized"""
         if hasattr(self, 'node_positions') and self.node_positions:
+            if len(self.node_circles) == self.num_nodes:
+                self._move_nodes(self._node_placement())
             self._draw_order_arrays()
             self._update_pre_order_visualization()
             self._update_post_order_visualization()
 
+    def _zoom_at(self, event, factor):
+        """Zoom the graph around the mouse pointer (the arrays stay put)."""
+        self.scene.zoom(factor, event.x, event.y)
+
+    def _pan_start(self, event):
+        self._pan_from = (event.x, event.y)
+
+    def _pan_drag(self, event):
+        x, y = self._pan_from
+        self._pan_from = (event.x, event.y)
+        self.scene.pan(event.x - x, event.y - y)
+
     ###########################################################################
     # BFS Steps: yields ("edge", i, j) before visiting j
     ###########################################################################
-    def bfs_steps(self, start_idx):
-        visited = set()
-        queue = deque([start_idx])
-        visited.add(start_idx)
-        
-        # Track distances from start node
+    def bfs_steps(self, starts):
+        """
+        starts: one or more start nodes, all at distance 0 (multi-source BFS).
+        frontier.search_steps with a FIFO frontier; a node is reported as
+        visited when it is discovered, like the queue it joins.
+        """
+        visited = set(starts)
+        self.touched = visited
+        self.source_of = {idx: k for k, idx in enumerate(starts)}
+
+        # Track distances from the start node(s)
         self.distances = {i: float('inf') for i in range(self.num_nodes)}
-        self.distances[start_idx] = 0
+        for idx in starts:
+            self.distances[idx] = 0
+
+        # Mark the starts as visited
+        for idx in starts:
+            self.pre_order_list.append(self.node_labels[idx])
+            yield ("visit", idx)
+
+        parent = {}
+        for event in search_steps(self.adjacency_indexed, starts, None, FifoFrontier(),
+                                  parent, {"expanded": 0}, order=self._label_key):
+            if event[0] == "edge" or event[0] == "completed":
+                yield event
+            elif event[0] == "discover":
+                neighbor = event[1]
+                current = parent[neighbor]
+                visited.add(neighbor)
+                self.source_of[neighbor] = self.source_of[current]
+                # Update distance to this node
+                self.distances[neighbor] = self.distances[current] + 1
+                self.pre_order_list.append(self.node_labels[neighbor])
+                yield ("visit", neighbor)
+
+    def _sorted_neighbors(self, current):
+        """Neighbors of current in ascending _label_key order."""
+        return sorted(self.adjacency_indexed[current], key=self._label_key)
+
+    def _label_key(self, idx):
+        return label_key(self.node_labels[idx])
 
-        # Mark start as visited
-        self.pre_order_list.append(self.node_labels[start_idx])
-        yield ("visit", start_idx)
+    ###########################################################################
+    # Level-synchronous BFS: yields one whole frontier per step
+    ###########################################################################
+    def bfs_level_steps(self, starts):
+        """
+        Same visiting order, distances and pre-order as bfs_steps, but one
+        event per BFS level instead of one per edge:
+            ("level", depth, expanded_nodes, new_nodes, tree_edges)
+        so a graph plays back in (diameter + 1) steps.
+        """
+        self.distances = {i: float('inf') for i in range(self.num_nodes)}
+        for idx in starts:
+            self.distances[idx] = 0
+        visited = set(starts)
+        self.touched = visited
+        self.source_of = {idx: k for k, idx in enumerate(starts)}
+        self.pre_order_list.extend(self.node_labels[idx] for idx in starts)
+        yield ("level", 0, [], list(starts), [])
+
+        frontier = list(starts)
+        depth = 0
+        while frontier:
+            depth += 1
+            new_nodes = []
+            tree_edges = []
+            for current in frontier:
+                for neighbor in self._sorted_neighbors(current):
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        self.source_of[neighbor] = self.source_of[current]
+                        new_nodes.append(neighbor)
+                        tree_edges.append((current, neighbor))
+            # Bulk updates for the whole level
+            for idx in new_nodes:
+                self.distances[idx] = depth
+            self.pre_order_list.extend(self.node_labels[idx] for idx in new_nodes)
+            yield ("level", depth, frontier, new_nodes, tree_edges)
+            frontier = new_nodes
+
+    def bfs_bitset_level_steps(self, starts):
+        """
+        bfs_level_steps for the matrix input: every row is one bitset over the
+        nodes in label order, so a frontier node's new neighbours are its row
+        AND the unvisited set, a word at a time rather than an edge at a time.
+        Yields the same events, in the same order.
+        """
+        bitsets = BitsetRows.from_adjacency(
+            self.adjacency_indexed, sorted(range(self.num_nodes), key=self._label_key))
+        self.distances = {i: float('inf') for i in range(self.num_nodes)}
+        unvisited = bitsets.full()
+        for idx in starts:
+            self.distances[idx] = 0
+            unvisited &= ~(1 << bitsets.position[idx])
+        self.touched = set(starts)
+        self.source_of = {idx: k for k, idx in enumerate(starts)}
+        self.pre_order_list.extend(self.node_labels[idx] for idx in starts)
+        yield ("level", 0, [], list(starts), [])
+
+        frontier = list(starts)
+        depth = 0
+        while frontier:
+            depth += 1
+            new_nodes = []
+            tree_edges = []
+            for current in frontier:
+                hits = bitsets.rows[current] & unvisited
+                if hits:
+                    unvisited ^= hits
+                    for neighbor in bitsets.members(hits):
+                        self.source_of[neighbor] = self.source_of[current]
+                        new_nodes.append(neighbor)
+                        tree_edges.append((current, neighbor))
+            self.touched.update(new_nodes)
+            for idx in new_nodes:
+                self.distances[idx] = depth
+            self.pre_order_list.extend(self.node_labels[idx] for idx in new_nodes)
+            yield ("level", depth, frontier, new_nodes, tree_edges)
+            frontier = new_nodes
 
-        while queue:
-            current = queue.popleft()
-            
-            # Get all neighbors of current node
-            neighbors = self.adjacency_indexed[current]
-            
-            # Create a list of (neighbor_idx, neighbor_label) pairs for sorting
-            # Try to convert labels to integers for proper numeric sorting if possible
-            neighbor_info = []
-            for neighbor in neighbors:
-                label = self.node_labels[neighbor]
-                # Try to convert to int for numeric comparison
-                try:
-                    value = int(label)
-                except ValueError:
-                    value = label  # Keep as string if not convertible
-                neighbor_info.append((neighbor, value))
-            
-            # Sort neighbors by their values (ascending)
-            neighbor_info.sort(key=lambda x: x[1])
-            
-            # Now process neighbors in sorted order
-            for neighbor, _ in neighbor_info:
-                # We'll highlight the edge from current->neighbor in red first
-                yield ("edge", current, neighbor)
-
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    queue.append(neighbor)
-                    # Update distance to this node
-                    self.distances[neighbor] = self.distances[current] + 1
-                    self.pre_order_list.append(self.node_labels[neighbor])
-                    yield ("visit", neighbor)
-            
-            # After processing all neighbors, mark the current node as "completed"
-            yield ("completed", current)
+    ###########################################################################
+    # Bidirectional BFS: starts -> goal, always growing the smaller frontier
+    ###########################################################################
+    def bfs_bidirectional_steps(self, starts, goal):
+        """
+        Point-to-point BFS from both ends: a forward search from the starts
+        along the edges, a backward one from the goal against them. Each
+        round expands a whole level of whichever frontier is smaller. Once a
+        level reaches a node the other side has seen, the shortest path goes
+        through the best such node, so both searches stop there, usually
+        long before either has touched the whole graph.
+        Forward events are bfs_steps' ("visit"/"edge"/"completed"); the goal
+        side yields ("back_visit", v), ("back_edge", u, v) for the edge v->u
+        and ("back_completed", u); the last event is ("meet", path).
+        """
+        reverse = {i: [] for i in range(self.num_nodes)}
+        for u in range(self.num_nodes):
+            for v in self.adjacency_indexed[u]:
+                reverse[v].append(u)
+
+        self.distances = {i: float('inf') for i in range(self.num_nodes)}
+        self.source_of = {idx: k for k, idx in enumerate(starts)}
+        forward = {idx: None for idx in starts}     # node -> parent (towards a start)
+        backward = {goal: None}                     # node -> parent (towards the goal)
+        self.touched = set(starts) | {goal}
+        for idx in starts:
+            self.distances[idx] = 0
+            self.pre_order_list.append(self.node_labels[idx])
+            yield ("visit", idx)
+        yield ("back_visit", goal)
+
+        back_depth = {goal: 0}
+        front, back = list(starts), [goal]
+        meet = goal if goal in forward else None
+        while meet is None and front and back:
+            if len(front) <= len(back):
+                nxt = []
+                for current in front:
+                    for neighbor in self._sorted_neighbors(current):
+                        yield ("edge", current, neighbor)
+                        if neighbor not in forward:
+                            forward[neighbor] = current
+                            self.touched.add(neighbor)
+                            self.source_of[neighbor] = self.source_of[current]
+                            self.distances[neighbor] = self.distances[current] + 1
+                            self.pre_order_list.append(self.node_labels[neighbor])
+                            nxt.append(neighbor)
+                            yield ("visit", neighbor)
+                            if neighbor in backward:
+                                meet = self._closer_meet(meet, neighbor, back_depth)
+                    yield ("completed", current)
+                front = nxt
+            else:
+                nxt = []
+                for current in back:
+                    for neighbor in sorted(reverse[current], key=self._label_key):
+                        yield ("back_edge", current, neighbor)
+                        if neighbor not in backward:
+                            backward[neighbor] = current
+                            back_depth[neighbor] = back_depth[current] + 1
+                            self.touched.add(neighbor)
+                            nxt.append(neighbor)
+                            yield ("back_visit", neighbor)
+                            if neighbor in forward:
+                                meet = self._closer_meet(meet, neighbor, back_depth)
+                    yield ("back_completed", current)
+                back = nxt
+
+        path = []
+        if meet is not None:
+            node = meet
+            while node is not None:
+                path.append(node)
+                node = forward[node]
+            path.reverse()
+            node = backward[meet]
+            while node is not None:
+                path.append(node)
+                node = backward[node]
+        yield ("meet", path)
+
+    def _closer_meet(self, meet, node, back_depth):
+        """The meeting node with the shorter start -> goal path through it."""
+        if meet is None:
+            return node
+        through = lambda v: self.distances[v] + back_depth[v]
+        return node if through(node) < through(meet) else meet
 
     def _draw_initial_nodes_array(self):
         """Draw the initial node array at the top of the canvas"""
@@ -853,8 +1363,10 @@ class BreadthFirstSearchTab(ttk.Frame):
         margin = 10
         y_pos = 20  # Position at top
         
+        slots = self._array_slots(self.num_nodes, w - 2 * self.ARRAY_LABEL_ROOM, box_width + margin)
+        
         # Calculate starting x position to center the array
-        start_x = (w - (self.num_nodes * (box_width + margin))) / 2
+        start_x = (w - (slots * (box_width + margin))) / 2
         
         # Draw "Nodes:" label with black text to the left of array
         self.canvas.create_text(
@@ -866,8 +1378,8 @@ class BreadthFirstSearchTab(ttk.Frame):
             tags="initial_nodes"
         )
         
-        # Draw boxes for each node
-        for i in range(self.num_nodes):
+        # Draw boxes for as many nodes as fit across the canvas
+        for i in range(slots):
             x = start_x + i * (box_width + margin)
             box_id = self.canvas.create_rectangle(
                 x, y_pos, x + box_width, y_pos + box_height,
@@ -884,7 +1396,18 @@ class BreadthFirstSearchTab(ttk.Frame):
                 fill="black",
                 tags="initial_nodes"
             )
-
+        
+        hidden = self.num_nodes - slots
+        if hidden:
+            self.canvas.create_text(
+                start_x + slots * (box_width + margin), y_pos + box_height/2,
+                text=f"+{hidden} more",
+                anchor="w",
+                font=("Arial", 10, "italic"),
+                fill="black",
+                tags="initial_nodes"
+            )
+        self.scene.reserve("initial_nodes", 1 + 2 * slots + (1 if hidden else 0))
 
 # Test
 if __name__ == "__main__":
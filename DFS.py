@@ -2,8 +2,22 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import math
 from collections import deque
+from edge_editor import SparseEdgeEditor, label_key
+from trace_cache import Trace, TraceCache
+from force_layout import fit
+from layout_cache import LayoutSlot
+from viewport import CulledScene
+import graph_generators
+from frontier import LifoFrontier, search_steps
 
 class DepthFirstSearchTab(ttk.Frame):
+    # From this many nodes the circle gives way to a force-directed layout
+    FORCE_LAYOUT_MIN_NODES = 30
+    FORCE_LAYOUT_SECONDS = 5.0
+    # Most canvas items the graph may use; past it edges are bundled (viewport.py)
+    CANVAS_ITEM_BUDGET = 3000
+    ARRAY_LABEL_ROOM = 80       # Pixels left beside an array strip for its label
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -54,10 +68,8 @@ class DepthFirstSearchTab(ttk.Frame):
         #######################################################################
         self.num_nodes = 0
         self.node_labels = []
-        self.node_label_entries = []
         self.adj_type_var = tk.StringVar(value="matrix")
-        self.adjacency_matrix_vars = []
-        self.adjacency_list_entries = []
+        self.edge_editor = None
         self.adjacency_indexed = {}
 
         # DFS
@@ -67,6 +79,11 @@ class DepthFirstSearchTab(ttk.Frame):
         self.dfs_generator = None
         self.pre_order_list = []
         self.post_order_list = []
+        # Recorded runs per (graph digest, start); cleared on any edit
+        self.trace_cache = TraceCache()
+        # Force-directed layout for big graphs, cached per graph and box shape
+        self.layout = LayoutSlot(self, self._layout_ready,
+                                 self.FORCE_LAYOUT_MIN_NODES, self.FORCE_LAYOUT_SECONDS)
 
         # Canvas drawing
         self.node_positions = {}   # index -> (x,y)
@@ -103,13 +120,13 @@ class DepthFirstSearchTab(ttk.Frame):
 
         ttk.Radiobutton(
             input_top, text="Adjacency Matrix", variable=self.adj_type_var,
-            value="matrix", command=self.clear_adjacency_fields,
+            value="matrix", command=self.switch_adjacency_mode,
             style="Dark.TRadiobutton"
         ).grid(row=1, column=0, columnspan=2, sticky="w", padx=5)
 
         ttk.Radiobutton(
             input_top, text="Adjacency List", variable=self.adj_type_var,
-            value="list", command=self.clear_adjacency_fields,
+            value="list", command=self.switch_adjacency_mode,
             style="Dark.TRadiobutton"
         ).grid(row=2, column=0, columnspan=2, sticky="w", padx=5)
 
@@ -117,15 +134,36 @@ class DepthFirstSearchTab(ttk.Frame):
                              style="Dark.TButton")
         gen_btn.grid(row=3, column=0, columnspan=2, padx=5, pady=5)
 
+        # Seeded random graphs (sized by "Number of nodes")
+        ttk.Label(input_top, text="Random graph:", style="Dark.TLabel")\
+            .grid(row=4, column=0, padx=5, pady=5, sticky="e")
+        self.generator_var = tk.StringVar(value=next(iter(graph_generators.GENERATORS)))
+        ttk.Combobox(input_top, textvariable=self.generator_var, state="readonly", width=18,
+                     values=list(graph_generators.GENERATORS))\
+            .grid(row=4, column=1, padx=5, pady=5)
+
+        ttk.Label(input_top, text="Seed:", style="Dark.TLabel")\
+            .grid(row=5, column=0, padx=5, pady=5, sticky="e")
+        self.seed_entry = ttk.Entry(input_top, width=8)
+        self.seed_entry.grid(row=5, column=1, padx=5, pady=5, sticky="w")
+        self.seed_entry.insert(0, "1")
+
+        ttk.Button(input_top, text="Generate Random Graph", command=self.generate_random_graph,
+                   style="Dark.TButton").grid(row=6, column=0, columnspan=2, padx=5, pady=5)
+
         self.adjacency_frame = ttk.Frame(self.left_frame, style="Dark.TFrame")
         self.adjacency_frame.pack(anchor="nw", fill="both", expand=True, pady=5)
 
     def clear_adjacency_fields(self):
+        """Remove the adjacency editor so we can rebuild it."""
         for child in self.adjacency_frame.winfo_children():
             child.destroy()
-        self.node_label_entries.clear()
-        self.adjacency_matrix_vars.clear()
-        self.adjacency_list_entries.clear()
+        self.edge_editor = None
+
+    def switch_adjacency_mode(self):
+        """Show the same edges as a matrix or as a list."""
+        if self.edge_editor is not None:
+            self.edge_editor.set_mode(self.adj_type_var.get())
 
     def generate_adjacency_fields(self):
         self.clear_adjacency_fields()
@@ -136,112 +174,49 @@ class DepthFirstSearchTab(ttk.Frame):
         if self.num_nodes < 1:
             return
 
-        # Node label row
-        label_frame = ttk.Frame(self.adjacency_frame, style="Dark.TFrame")
-        label_frame.pack(anchor="nw", pady=5)
+        self.build_edge_editor()
+        self.edge_editor.reset(self.num_nodes, self.adj_type_var.get())
+        self.node_labels = self.edge_editor.labels()
 
-        tk.Label(label_frame, text="Enter each node label:", font=("Arial", 10, "bold"),
-                 bg="#424242", fg="white").pack(anchor="w")
+    def generate_random_graph(self):
+        """Load a seeded random graph of the chosen kind into the editor."""
+        try:
+            n = int(self.num_nodes_entry.get())
+        except ValueError:
+            n = 0
+        if n < 1:
+            return
 
-        row_label_frame = ttk.Frame(label_frame, style="Dark.TFrame")
-        row_label_frame.pack(side="top", anchor="w")
+        seed_text = self.seed_entry.get().strip()
+        try:
+            seed = int(seed_text)
+        except ValueError:
+            seed = seed_text  # Any string is a valid (reproducible) seed too
 
-        for i in range(self.num_nodes):
-            ent = ttk.Entry(row_label_frame, width=7)
-            ent.pack(side="left", padx=5)
-            self.node_label_entries.append(ent)
-        
-        ref_btn = ttk.Button(label_frame, text="Refresh Labels", command=self.refresh_labels_only,
-                             style="Dark.TButton")
-        ref_btn.pack(anchor="w", pady=5)
+        adjacency = graph_generators.generate(self.generator_var.get(), n, seed)
 
-        # Build adjacency portion
-        if self.adj_type_var.get() == "matrix":
-            self.build_matrix_inputs()
-        else:
-            self.build_list_inputs()
-
-        self.refresh_labels_only()
-
-    def build_matrix_inputs(self):
-        lbl = tk.Label(self.adjacency_frame, text="Adjacency Matrix", font=("Arial", 14, "bold"),
-                       bg="#424242", fg="white")
-        lbl.pack(anchor="center", pady=5)
-
-        container = ttk.Frame(self.adjacency_frame, style="Dark.TFrame")
-        container.pack(anchor="center")
-
-        for r in range(self.num_nodes):
-            row_vars = []
-            for c in range(self.num_nodes):
-                row_vars.append(tk.BooleanVar(value=False))
-            self.adjacency_matrix_vars.append(row_vars)
-
-        corner = tk.Label(container, text="", width=7, bg="#424242")
-        corner.grid(row=0, column=0, padx=5, pady=5)
-
-        self.matrix_col_labels = []
-        for c in range(self.num_nodes):
-            lbl_c = tk.Label(container, text="", width=7, bg="#424242", fg="white",
-                             font=("Arial", 9, "bold"), anchor="center")
-            lbl_c.grid(row=0, column=c+1, padx=5, pady=5)
-            self.matrix_col_labels.append(lbl_c)
-
-        self.matrix_row_labels = []
-        for r in range(self.num_nodes):
-            lbl_r = tk.Label(container, text="", width=7, bg="#424242", fg="white",
-                             font=("Arial", 9, "bold"), anchor="e")
-            lbl_r.grid(row=r+1, column=0, padx=5, pady=5)
-            self.matrix_row_labels.append(lbl_r)
-
-            for c in range(self.num_nodes):
-                var = self.adjacency_matrix_vars[r][c]
-                cb = ttk.Checkbutton(container, variable=var, style="Dark.TCheckbutton")
-                cb.grid(row=r+1, column=c+1, padx=5, pady=5)
-
-    def build_list_inputs(self):
-        lbl = tk.Label(self.adjacency_frame, text="Adjacency List", font=("Arial", 10, "bold"),
-                       bg="#424242", fg="white")
-        lbl.pack(anchor="w", pady=5)
-
-        container = ttk.Frame(self.adjacency_frame, style="Dark.TFrame")
-        container.pack()
-
-        heading_lbl = tk.Label(container, text="Edges", font=("Arial", 9, "bold"),
-                               bg="#424242", fg="white")
-        heading_lbl.grid(row=0, column=1, padx=5, pady=5)
-
-        for r in range(self.num_nodes):
-            row_lbl = tk.Label(container, text="", width=7, bg="#424242", fg="white",
-                               font=("Arial", 9, "bold"), anchor="e")
-            row_lbl.grid(row=r+1, column=0, padx=5, pady=5, sticky="e")
-
-            row_frame = ttk.Frame(container, style="Dark.TFrame")
-            row_frame.grid(row=r+1, column=1, sticky="w")
-
-            row_entries = []
-            for c in range(self.num_nodes):
-                ent = tk.Entry(row_frame, width=7)
-                ent.grid(row=0, column=c, padx=5, pady=5)
-                row_entries.append(ent)
-            self.adjacency_list_entries.append(row_entries)
-
-    def refresh_labels_only(self):
-        self.node_labels = [ent.get().strip() for ent in self.node_label_entries]
-        if self.adj_type_var.get() == "matrix" and hasattr(self, 'matrix_row_labels'):
-            for r, lbl_w in enumerate(self.matrix_row_labels):
-                textval = self.node_labels[r] if r < len(self.node_labels) else ""
-                lbl_w.config(text=textval)
-            for c, lbl_w in enumerate(self.matrix_col_labels):
-                textval = self.node_labels[c] if c < len(self.node_labels) else ""
-                lbl_w.config(text=textval)
-        elif self.adj_type_var.get() == "list" and self.adjacency_list_entries:
-            container = self.adjacency_list_entries[0][0].master.master
-            for r in range(self.num_nodes):
-                label_list = container.grid_slaves(row=r+1, column=0)
-                if label_list:
-                    lbl = label_list[0]
-                    lbl.config(text=self.node_labels[r] if r < len(self.node_labels) else "")
+        self.clear_adjacency_fields()
+        self.num_nodes = len(adjacency)
+        self.num_nodes_entry.delete(0, tk.END)   # The grid rounds n to a rectangle
+        self.num_nodes_entry.insert(0, str(self.num_nodes))
+        self.build_edge_editor()
+        self.edge_editor.set_graph(adjacency)
+        self.node_labels = self.edge_editor.labels()
+
+    def build_edge_editor(self):
+        """Sparse editor: labels in the row headers, widgets only for visible rows."""
+        tk.Label(self.adjacency_frame, text="Node labels and edges (row -> column)",
+                 font=("Arial", 10, "bold"), bg="#424242", fg="white").pack(anchor="w", pady=5)
+
+        self.edge_editor = SparseEdgeEditor(self.adjacency_frame, mode=self.adj_type_var.get())
+        self.edge_editor.pack(anchor="nw", fill="both", expand=True)
+        self.edge_editor.add_listener(self._on_graph_edit)
+
+    def _on_graph_edit(self, change):
+        """Any edit makes every recorded trace stale; a new graph needs a new layout too."""
+        self.trace_cache.clear()
+        if change[0] == "graph":
+            self.layout.reset()
 
     ###########################################################################
     # RIGHT: DFS Controls + Single White Canvas
@@ -284,6 +259,16 @@ class DepthFirstSearchTab(ttk.Frame):
         self.canvas.grid(row=2, column=0, sticky="nsew", padx=5, pady=5)
         self.canvas.bind("<Configure>", self._on_canvas_resize)
 
+        # Zoomable graph; the arrays stay fixed on the canvas
+        self.scene = CulledScene(self.canvas, overlay_tags=("order_arrays", "initial_nodes", "explanation"),
+                                 item_budget=self.CANVAS_ITEM_BUDGET)
+        self.canvas.bind("<MouseWheel>", lambda e: self._zoom_at(e, 1.2 if e.delta > 0 else 1 / 1.2))
+        self.canvas.bind("<Button-4>", lambda e: self._zoom_at(e, 1.2))
+        self.canvas.bind("<Button-5>", lambda e: self._zoom_at(e, 1 / 1.2))
+        self.canvas.bind("<ButtonPress-1>", self._pan_start)
+        self.canvas.bind("<B1-Motion>", self._pan_drag)
+        self.canvas.bind("<Double-Button-1>", lambda e: self.scene.reset_view())
+
     def set_speed(self, delay):
         self.current_delay = delay
 
@@ -302,6 +287,7 @@ class DepthFirstSearchTab(ttk.Frame):
         self.post_order_list.clear()
 
         self.canvas.delete("all")
+        self.scene.clear()
         self.node_positions.clear()
         self.node_circles.clear()
         self.node_halo = None
@@ -334,82 +320,58 @@ class DepthFirstSearchTab(ttk.Frame):
             self.start_index_entry.insert(0, "0")
 
         if self.num_nodes > 0:
-            # Estimate total steps and adjust font size before starting
-            estimated_steps = self.estimate_dfs_steps(start_idx)
-            self.adjust_explanation_font_size(estimated_steps)
-            
-            self.dfs_generator = self.dfs_steps(start_idx)
+            # Record the run once (or reuse the recording for this graph and
+            # start); one explanation line per event plus "DFS complete!"
+            key = (self.edge_editor.digest(), start_idx)
+            trace = self.trace_cache.get(key)
+            if trace is None:
+                trace = Trace(self.dfs_steps(start_idx))
+                self.trace_cache.put(key, trace)
+            self.pre_order_list.clear()
+            self.post_order_list.clear()
+            self.adjust_explanation_font_size(len(trace.events) + 1)
+
+            self.dfs_generator = self._replay(trace)
             self.after(self.current_delay, self.visualize_step)
         else:
             self.dfs_generator = None
 
     def build_indexed_adjacency(self):
-        self.node_labels = [ent.get().strip() for ent in self.node_label_entries]
-        self.adjacency_indexed = {i: [] for i in range(self.num_nodes)}
-
-        if self.adj_type_var.get() == "matrix":
-            if len(self.adjacency_matrix_vars) != self.num_nodes:
-                return True
-            for r in range(self.num_nodes):
-                for c in range(self.num_nodes):
-                    if self.adjacency_matrix_vars[r][c].get():
-                        self.adjacency_indexed[r].append(c)
-        else:
-            if len(self.adjacency_list_entries) != self.num_nodes:
-                return True
-            for r in range(self.num_nodes):
-                row_ents = self.adjacency_list_entries[r]
-                for c in range(len(row_ents)):
-                    typed = row_ents[c].get().strip()
-                    if typed:
-                        matches = [idx for idx, lab in enumerate(self.node_labels) if lab == typed]
-                        if not matches:
-                            messagebox.showerror(
-                                "Invalid Label",
-                                f"Node {r} typed '{typed}' but no node has that label."
-                            )
-                            return False
-                        self.adjacency_indexed[r].append(matches[0])
+        if self.edge_editor is None:
+            self.node_labels = []
+            self.adjacency_indexed = {}
+            return True
+
+        self.node_labels = self.edge_editor.labels()
+        self.adjacency_indexed = self.edge_editor.adjacency()
+
+        # List mode: a typed label that matches no node is an error
+        for r in sorted(self.edge_editor.unresolved):
+            typed = self.edge_editor.unresolved[r][0]
+            messagebox.showerror(
+                "Invalid Label",
+                f"Node {r} typed '{typed}' but no node has that label."
+            )
+            return False
         return True
 
     ###########################################################################
     # Drawing / Canvas
     ###########################################################################
     def draw_graph_initial(self):
-        w = self.canvas.winfo_width() or 700
-        h = self.canvas.winfo_height() or 500
-        
         # We'll keep ~200 px margin on the left side for text.
         left_text_area = 200  
         
         # Draw the "Nodes" row near the top, starting around x = left_text_area
         self._draw_initial_nodes_array(left_text_area)
 
-        # Center for the circle (shifting to the right so it doesn't overlap text)
-        cx = (w + left_text_area) // 2
-        
-        # Calculate the vertical center, accounting for top and bottom elements
-        # Remove the +20 offset that was pushing the graph down
-        # Top elements take ~80px, bottom elements take ~120px, so shift slightly up
-        cy = h // 2 - 20  # Shift up by 20px to balance the space
-
-        # CHANGED: multiply radius by 0.6 to shrink
-        base_radius = min(cx - left_text_area - 40, cy - 40) - 30
-        radius = int(0.6 * base_radius)  # scale down
-
         n = self.num_nodes
         if n < 1:
             return
 
-        if n == 1:
-            self.node_positions[0] = (cx, cy)
-        else:
-            angle_step = 2*math.pi / n
-            for i in range(n):
-                angle = i * angle_step
-                x = cx + radius * math.cos(angle)
-                y = cy + radius * math.sin(angle)
-                self.node_positions[i] = (x, y)
+        # In a circle until a force-directed layout is ready
+        self.layout.set_graph(self.adjacency_indexed)
+        self.node_positions = self._node_placement()
 
         # edges
         for i in range(n):
@@ -419,10 +381,10 @@ class DepthFirstSearchTab(ttk.Frame):
 
         # nodes
         for i, (nx, ny) in self.node_positions.items():
-            c_id = self.canvas.create_oval(nx-20, ny-20, nx+20, ny+20,
-                                           fill="gray", outline="black", width=2)
+            c_id = self.scene.create_oval(nx-20, ny-20, nx+20, ny+20,
+                                          fill="gray", outline="black", width=2)
             label = self.node_labels[i] if i < len(self.node_labels) else str(i)
-            t_id = self.canvas.create_text(nx, ny, text=label, font=("Arial", 10, "bold"))
+            t_id = self.scene.create_text(nx, ny, text=label, font=("Arial", 10, "bold"))
             self.node_circles[i] = (c_id, t_id)
 
         # Pre- & post-order boxes at the bottom (also shifted right)
@@ -438,8 +400,8 @@ class DepthFirstSearchTab(ttk.Frame):
         y_pos = 20  # near top
         
         usable_width = w - left_text_area
-        total_width = self.num_nodes * (box_width + margin)
-        start_x = left_text_area + (usable_width - total_width) / 2
+        slots = self._array_slots(self.num_nodes, usable_width - 2 * self.ARRAY_LABEL_ROOM, box_width + margin)
+        start_x = left_text_area + (usable_width - slots * (box_width + margin)) / 2
 
         self.canvas.create_text(
             start_x - 5, y_pos + box_height/2, 
@@ -450,7 +412,8 @@ class DepthFirstSearchTab(ttk.Frame):
             tags="initial_nodes"
         )
         
-        for i in range(self.num_nodes):
+        # As many nodes as fit across the canvas
+        for i in range(slots):
             x = start_x + i * (box_width + margin)
             box_id = self.canvas.create_rectangle(
                 x, y_pos, x + box_width, y_pos + box_height,
@@ -466,14 +429,23 @@ class DepthFirstSearchTab(ttk.Frame):
                 tags="initial_nodes"
             )
 
+        hidden = self.num_nodes - slots
+        if hidden:
+            self.canvas.create_text(
+                start_x + slots * (box_width + margin), y_pos + box_height/2,
+                text=f"+{hidden} more",
+                anchor="w",
+                font=("Arial", 10, "italic"),
+                fill="black",
+                tags="initial_nodes"
+            )
+        self.scene.reserve("initial_nodes", 1 + 2 * slots + (1 if hidden else 0))
+
     def _draw_order_arrays(self, left_text_area):
         self.canvas.delete("order_arrays")
         w = self.canvas.winfo_width() or 700
         h = self.canvas.winfo_height() or 500
 
-        self.pre_order_boxes = []
-        self.post_order_boxes = []
-
         box_width = 30
         box_height = 30
         margin = 10
@@ -482,59 +454,119 @@ class DepthFirstSearchTab(ttk.Frame):
         y_post = h - (box_height + margin) - 20
 
         usable_width = w - left_text_area
-        total_width = self.num_nodes * (box_width + margin)
-        start_x = left_text_area + (usable_width - total_width) / 2
+        slots = self._array_slots(self.num_nodes, usable_width - 2 * self.ARRAY_LABEL_ROOM, box_width + margin)
+        start_x = left_text_area + (usable_width - slots * (box_width + margin)) / 2
 
-        # Pre-order
-        self.canvas.create_text(
-            start_x - 5, y_pre + box_height/2, 
-            text="Pre-order:", 
-            anchor="e", 
-            font=("Arial", 10, "bold"), 
-            fill="black", 
-            tags="order_arrays"
-        )
-        for i in range(self.num_nodes):
-            x = start_x + i * (box_width + margin)
-            box_id = self.canvas.create_rectangle(
-                x, y_pre, x + box_width, y_pre + box_height,
-                fill="white", outline="black", 
-                tags="order_arrays"
-            )
-            text_id = self.canvas.create_text(
-                x + box_width/2, y_pre + box_height/2, 
-                text="", font=("Arial", 10), fill="black", 
-                tags="order_arrays"
-            )
-            self.pre_order_boxes.append((box_id, text_id))
+        self.pre_order_strip = self._draw_order_strip("Pre-order", start_x, y_pre, slots)
+        self.post_order_strip = self._draw_order_strip("Post-order", start_x, y_post, slots)
+        self.scene.reserve("order_arrays", 2 * (1 + 2 * slots))
 
-        # Post-order
-        self.canvas.create_text(
-            start_x - 5, y_post + box_height/2, 
-            text="Post-order:", 
+        self._update_pre_order_visualization()
+        self._update_post_order_visualization()
+
+    def _draw_order_strip(self, title, start_x, y, slots):
+        """A titled row of slots empty boxes; _update_order_strip fills them in."""
+        box_width = 30
+        box_height = 30
+        margin = 10
+        label_id = self.canvas.create_text(
+            start_x - 5, y + box_height/2, 
+            text=f"{title}:", 
             anchor="e", 
             font=("Arial", 10, "bold"), 
             fill="black", 
             tags="order_arrays"
         )
-        for i in range(self.num_nodes):
+        boxes = []
+        for i in range(slots):
             x = start_x + i * (box_width + margin)
             box_id = self.canvas.create_rectangle(
-                x, y_post, x + box_width, y_post + box_height,
+                x, y, x + box_width, y + box_height,
                 fill="white", outline="black", 
                 tags="order_arrays"
             )
             text_id = self.canvas.create_text(
-                x + box_width/2, y_post + box_height/2, 
+                x + box_width/2, y + box_height/2, 
                 text="", font=("Arial", 10), fill="black", 
                 tags="order_arrays"
             )
-            self.post_order_boxes.append((box_id, text_id))
+            boxes.append((box_id, text_id))
+        return {"title": title, "label": label_id, "boxes": boxes, "shown": [None] * slots, "first": 0}
 
-        self._update_pre_order_visualization()
-        self._update_post_order_visualization()
+    def _array_slots(self, length, room, step):
+        """How many of an array's length slots fit in room pixels, step apart (at least one)."""
+        return min(length, max(1, int(room // step)))
+
+    def _graph_circle(self, left_text_area=200):
+        """(cx, cy, radius) of the graph area, right of the explanation text."""
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+
+        # Center for the circle (shifting to the right so it doesn't overlap text)
+        cx = (w + left_text_area) // 2
+        
+        # Calculate the vertical center, accounting for top and bottom elements
+        # Remove the +20 offset that was pushing the graph down
+        # Top elements take ~80px, bottom elements take ~120px, so shift slightly up
+        cy = h // 2 - 20  # Shift up by 20px to balance the space
+
+        # CHANGED: multiply radius by 0.6 to shrink
+        base_radius = min(cx - left_text_area - 40, cy - 40) - 30
+        radius = int(0.6 * base_radius)  # scale down
+        return cx, cy, radius
+
+    def _graph_box(self, left_text_area=200):
+        """(x0, y0, x1, y1) a laid-out graph may fill, clear of the text and arrays."""
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+        # Top elements take ~80px, bottom elements take ~120px
+        return left_text_area + 40, 80 + 20, w - 40, h - 120 - 20
+
+    def _node_placement(self):
+        """index -> (x, y): the force-directed layout once there is one, else a circle."""
+        x0, y0, x1, y1 = self._graph_box()
+        found = self.layout.coords(x1 - x0, y1 - y0)
+        if found is not None:
+            coords, aspect = found
+            return dict(enumerate(fit(coords, x0, y0, x1, y1, aspect)))
+
+        cx, cy, radius = self._graph_circle()
+        n = self.num_nodes
+        positions = {}
+        if n == 1:
+            positions[0] = (cx, cy)
+        else:
+            angle_step = 2*math.pi / n
+            for i in range(n):
+                angle = i * angle_step
+                x = cx + radius * math.cos(angle)
+                y = cy + radius * math.sin(angle)
+                positions[i] = (x, y)
+        return positions
+
+    def _layout_ready(self):
+        """A layout for this graph just arrived: move whatever is drawn onto it."""
+        if self.num_nodes and len(self.node_circles) == self.num_nodes:
+            self._move_nodes(self._node_placement())
+
+    def _move_nodes(self, positions):
+        """Move the drawn nodes and their edges, keeping every color."""
+        self.node_positions = positions
+        for i, (x, y) in positions.items():
+            c_id, t_id = self.node_circles[i]
+            self.scene.coords(c_id, x-20, y-20, x+20, y+20)
+            self.scene.coords(t_id, x, y)
+        for (i, j), line_id in self.edge_lines.items():
+            self.scene.coords(line_id, *self._edge_points(i, j))
+        if self.halo_node is not None:
+            self._halo_node(self.halo_node)
 
     def _draw_directed_edge(self, i, j, color="black"):
+        return self.scene.create_line(
+            *self._edge_points(i, j), fill=color, width=2, arrow=tk.LAST
+        )
+
+    def _edge_points(self, i, j):
         x1, y1 = self.node_positions.get(i, (0,0))
         x2, y2 = self.node_positions.get(j, (0,0))
         dx, dy = x2 - x1, y2 - y1
@@ -546,115 +578,56 @@ class DepthFirstSearchTab(ttk.Frame):
             y2 -= udy*20
             x1 += udx*20
             y1 += udy*20
-
-        return self.canvas.create_line(
-            x1, y1, x2, y2, fill=color, width=2, arrow=tk.LAST
-        )
+        return x1, y1, x2, y2
 
     def _on_canvas_resize(self, event):
         if self.node_positions:
+            if len(self.node_circles) == self.num_nodes:
+                self._move_nodes(self._node_placement())
             self._draw_order_arrays(left_text_area=200)
             self._draw_initial_nodes_array(left_text_area=200)
             self._update_pre_order_visualization()
             self._update_post_order_visualization()
 
+    def _zoom_at(self, event, factor):
+        self.scene.zoom(factor, event.x, event.y)
+
+    def _pan_start(self, event):
+        self._pan_from = (event.x, event.y)
+
+    def _pan_drag(self, event):
+        x, y = self._pan_from
+        self._pan_from = (event.x, event.y)
+        self.scene.pan(event.x - x, event.y - y)
+
     ###########################################################################
     # DFS Steps
     ###########################################################################
     def dfs_steps(self, start_idx):
-        visited = set()
-        stack = [start_idx]
-
-        visited.add(start_idx)
-        self.pre_order_list.append(self.node_labels[start_idx])
-        yield ("visit", start_idx)
-
-        neighbor_index_map = {i: 0 for i in range(self.num_nodes)}
-
-        while stack:
-            current = stack[-1]
-            neighbors = self.adjacency_indexed[current]
-
-            labeled_neighbors = []
-            for nb in neighbors:
-                lbl = self.node_labels[nb]
-                try:
-                    val = int(lbl)
-                except ValueError:
-                    val = lbl
-                labeled_neighbors.append((nb, val))
-            labeled_neighbors.sort(key=lambda x: x[1])
-
-            idx_next = neighbor_index_map[current]
-            if idx_next < len(labeled_neighbors):
-                (neighbor, _) = labeled_neighbors[idx_next]
-                neighbor_index_map[current] += 1
-
-                yield ("edge", current, neighbor)
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
-                    self.pre_order_list.append(self.node_labels[neighbor])
-                    yield ("visit", neighbor)
-                else:
-                    # Add a specific yield for already visited nodes
-                    yield ("already_visited", current, neighbor)
-            else:
-                stack.pop()
-                self.post_order_list.append(self.node_labels[current])
-                yield ("completed", current)
-
-    def estimate_dfs_steps(self, start_idx):
-        """
-        More accurately estimate the number of explanation lines by simulating the DFS traversal
-        """
-        # We'll simulate the actual traversal for accurate count
-        visited = set()
-        stack = [start_idx]
-        step_count = 0
-        
-        # Count initial visit
-        visited.add(start_idx)
-        step_count += 1  # "Visiting node X" line
-        
-        neighbor_index_map = {i: 0 for i in range(self.num_nodes)}
-        
-        while stack:
-            current = stack[-1]
-            neighbors = self.adjacency_indexed[current]
-            
-            # Sort neighbors to match the actual traversal
-            labeled_neighbors = []
-            for nb in neighbors:
-                lbl = self.node_labels[nb]
-                try:
-                    val = int(lbl)
-                except ValueError:
-                    val = lbl
-                labeled_neighbors.append((nb, val))
-            labeled_neighbors.sort(key=lambda x: x[1])
-            
-            idx_next = neighbor_index_map[current]
-            if idx_next < len(labeled_neighbors):
-                neighbor = labeled_neighbors[idx_next][0]
-                neighbor_index_map[current] += 1
-                
-                step_count += 1  # "Check path from X → Y" line
-                
-                if neighbor not in visited:
-                    visited.add(neighbor)
-                    stack.append(neighbor)
-                    step_count += 1  # "Visiting node X" line
-                else:
-                    step_count += 1  # "Node X already visited" line
-            else:
-                stack.pop()
-                step_count += 1  # "No more unseen paths from X" line
-        
-        # Add one more for "DFS complete!" line
-        step_count += 1
-        
-        return step_count
+        """frontier.search_steps with a LIFO frontier, neighbours in label order."""
+        for event in search_steps(self.adjacency_indexed, start_idx, None, LifoFrontier(),
+                                  {}, {"expanded": 0},
+                                  order=lambda nb: label_key(self.node_labels[nb])):
+            if event[0] == "visit":
+                self.pre_order_list.append(self.node_labels[event[1]])
+                yield event
+            elif event[0] == "seen":
+                # Add a specific yield for already visited nodes
+                yield ("already_visited",) + event[1:]
+            elif event[0] == "completed":
+                self.post_order_list.append(self.node_labels[event[1]])
+                yield event
+            elif event[0] == "edge":
+                yield event
+
+    def _replay(self, trace):
+        """Yield a recorded run's events, filling the order lists as dfs_steps did."""
+        for event in trace.events:
+            if event[0] == "visit":
+                self.pre_order_list.append(self.node_labels[event[1]])
+            elif event[0] == "completed":
+                self.post_order_list.append(self.node_labels[event[1]])
+            yield event
 
     ###########################################################################
     # Step-by-step Visualization
@@ -698,7 +671,7 @@ class DepthFirstSearchTab(ttk.Frame):
         except StopIteration:
             self._halo_node(None)
             for edge_pair, line_id in self.edge_lines.items():
-                self.canvas.itemconfig(line_id, fill="green", width=2)
+                self.scene.itemconfig(line_id, fill="green", width=2)
             self._log_step("DFS complete! All nodes processed.")
             return
 
@@ -708,18 +681,27 @@ class DepthFirstSearchTab(ttk.Frame):
     # Update Pre/Post-Order
     ###########################################################################
     def _update_pre_order_visualization(self):
-        for i, label in enumerate(self.pre_order_list):
-            if i < len(self.pre_order_boxes):
-                box_id, text_id = self.pre_order_boxes[i]
-                self.canvas.itemconfig(text_id, text=label)
-                self.canvas.itemconfig(box_id, fill="#e0ffe0")
+        self._update_order_strip(self.pre_order_strip, self.pre_order_list, "#e0ffe0")
 
     def _update_post_order_visualization(self):
-        for i, label in enumerate(self.post_order_list):
-            if i < len(self.post_order_boxes):
-                box_id, text_id = self.post_order_boxes[i]
-                self.canvas.itemconfig(text_id, text=label)
-                self.canvas.itemconfig(box_id, fill="#e0e0ff")
+        self._update_order_strip(self.post_order_strip, self.post_order_list, "#e0e0ff")
+
+    def _update_order_strip(self, strip, order, fill):
+        """Show the newest labels of order once it outgrows the strip, touching only changed boxes."""
+        boxes, shown = strip["boxes"], strip["shown"]
+        first = max(0, len(order) - len(boxes))
+        if first != strip["first"]:
+            strip["first"] = first
+            title = f"{strip['title']} (+{first}):" if first else f"{strip['title']}:"
+            self.canvas.itemconfig(strip["label"], text=title)
+        for slot, (box_id, text_id) in enumerate(boxes):
+            i = first + slot
+            label = order[i] if i < len(order) else None
+            if label == shown[slot]:
+                continue
+            shown[slot] = label
+            self.canvas.itemconfig(text_id, text=label or "")
+            self.canvas.itemconfig(box_id, fill="white" if label is None else fill)
 
     ###########################################################################
     # Coloring / Highlighting
@@ -727,18 +709,19 @@ class DepthFirstSearchTab(ttk.Frame):
     def _color_node(self, idx, color):
         if idx in self.node_circles:
             c_id, _ = self.node_circles[idx]
-            self.canvas.itemconfig(c_id, fill=color)
+            self.scene.itemconfig(c_id, fill=color)
 
     def _halo_node(self, idx):
         if self.node_halo is not None:
-            self.canvas.delete(self.node_halo)
+            self.scene.delete(self.node_halo)
             self.node_halo = None
             self.halo_node = None
         if idx is None:
             return
+        self.halo_node = idx
         x, y = self.node_positions[idx]
         radius = 26
-        self.node_halo = self.canvas.create_oval(
+        self.node_halo = self.scene.create_oval(
             x - radius, y - radius, x + radius, y + radius,
             outline="red", width=3, dash=(4,2)
         )
@@ -748,14 +731,14 @@ class DepthFirstSearchTab(ttk.Frame):
             for (old_i, old_j) in self.last_edge_highlight:
                 if (old_i, old_j) in self.edge_lines:
                     line_id = self.edge_lines[(old_i, old_j)]
-                    self.canvas.itemconfig(line_id, fill="black", width=2)
-                    self.canvas.tag_lower(line_id)
+                    self.scene.itemconfig(line_id, fill="black", width=2)
+                    self.scene.tag_lower(line_id)
             self.last_edge_highlight = None
 
         if (i, j) in self.edge_lines:
             line_id = self.edge_lines[(i, j)]
-            self.canvas.itemconfig(line_id, fill=color, width=3)
-            self.canvas.tag_raise(line_id)
+            self.scene.itemconfig(line_id, fill=color, width=3)
+            self.scene.tag_raise(line_id)
 
         self.last_edge_highlight = [(i, j)]
 
@@ -777,7 +760,8 @@ class DepthFirstSearchTab(ttk.Frame):
             anchor="nw",
             text=msg,
             fill="black",
-            font=("Arial", font_size)
+            font=("Arial", font_size),
+            tags="explanation"
         )
         
         # Adjust line spacing based on font size
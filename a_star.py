@@ -0,0 +1,112 @@
+# a_star.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+import math
+from graph_tab import WeightedGraphTab
+import shortest_paths
+
+
+class AStarTab(WeightedGraphTab):
+    """
+    A* from the start to the goal on graphs whose nodes have coordinates
+    (load a "2-D grid" from the random graph picker). The heuristic is scaled
+    down to the cheapest weight per unit of distance so it never
+    overestimates; the counters show how much a better heuristic (and the
+    tie-break between equal f values) cuts the number of expansions.
+    """
+
+    TITLE = "A* Search"
+    USES_GOAL = True
+
+    def build_options(self, frame):
+        ttk.Label(frame, text="Heuristic:", style="Dark.TLabel").pack(side="left")
+        self.heuristic_var = tk.StringVar(value=next(iter(shortest_paths.HEURISTICS)))
+        ttk.Combobox(frame, textvariable=self.heuristic_var, state="readonly", width=16,
+                     values=list(shortest_paths.HEURISTICS)).pack(side="left", padx=5)
+
+        ttk.Label(frame, text="Ties:", style="Dark.TLabel").pack(side="left", padx=(10, 0))
+        self.tie_break_var = tk.StringVar(value=shortest_paths.TIE_BREAKS[0])
+        ttk.Combobox(frame, textvariable=self.tie_break_var, state="readonly", width=18,
+                     values=list(shortest_paths.TIE_BREAKS)).pack(side="left", padx=5)
+        self.counts = None
+        self.dist = []
+        self.parent = []
+        self.start = self.goal = None
+
+    def make_steps(self, start, goal):
+        heuristic = self.heuristic_var.get()
+        coords = self.node_coords
+        if coords is None or len(coords) != self.num_nodes:
+            if heuristic != "Zero (Dijkstra)":
+                messagebox.showerror("No Coordinates",
+                                     "This heuristic needs node positions: generate a "
+                                     "'2-D grid' random graph, or use the Zero heuristic.")
+                return None
+            coords = [(0, 0)] * self.num_nodes
+        for nbrs in self.graph.values():
+            for _, w in nbrs:
+                if w < 0:
+                    messagebox.showerror("Negative Weight", "A* needs non-negative edge weights.")
+                    return None
+
+        self.start, self.goal = start, goal
+        self.dist = [math.inf] * self.num_nodes
+        self.parent = [None] * self.num_nodes
+        self.counts = {"expanded": 0, "pushes": 0, "re-opens": 0}
+        return shortest_paths.a_star_steps(
+            self.graph, coords, start, goal, self.dist, self.parent, self.counts,
+            heuristic, self.tie_break_var.get())
+
+    def draw_graph_initial(self):
+        super().draw_graph_initial()
+        self._color_node(self.goal, "gold")
+
+    def handle_event(self, event):
+        if event[0] == "visit":
+            _, u = event
+            super().handle_event(event)
+            self._set_node_note(u, str(self.dist[u]), color="darkgreen")
+            self._log_step(f"Expand {self.node_labels[u]} (g = {self.dist[u]}).")
+        elif event[0] == "relax":
+            _, u, v, d = event
+            self._set_node_note(v, str(d))
+            if v != self.goal:
+                self._color_node(v, "khaki")
+            self._log_step(f"Shorter path to {self.node_labels[v]} through "
+                           f"{self.node_labels[u]}: g = {d}.")
+        elif event[0] == "reopen":
+            _, v = event
+            self._color_node(v, "orange")
+            self._log_step(f"Re-open {self.node_labels[v]}: reached more cheaply after expansion.")
+        elif event[0] == "found":
+            pass
+        else:
+            super().handle_event(event)
+
+    def on_complete(self):
+        path = shortest_paths.path_to(self.parent, self.start, self.goal)
+        if not path:
+            self._log_step(f"Goal {self.node_labels[self.goal]} is unreachable.")
+            return
+        for (i, j), line_id in self.edge_lines.items():
+            self.canvas.itemconfig(line_id, fill="lightgray", width=1)
+        for a, b in zip(path, path[1:]):
+            self._set_edge_color(a, b, "green", width=3)
+            self._color_node(a, "gold")
+        self._color_node(self.goal, "gold")
+        self._log_step(f"A* complete! Path cost {self.dist[self.goal]} over {len(path) - 1} edges.")
+
+    def stats_text(self):
+        if self.counts is None:
+            return ""
+        counts = ", ".join(f"{k}: {v}" for k, v in self.counts.items())
+        return f"{self.heuristic_var.get()}, {self.tie_break_var.get().lower()} — {counts}"
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("A* Search")
+    tab = AStarTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
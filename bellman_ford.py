@@ -0,0 +1,103 @@
+# bellman_ford.py
+import tkinter as tk
+from tkinter import ttk
+import math
+from graph_tab import WeightedGraphTab
+import shortest_paths
+
+
+class BellmanFordTab(WeightedGraphTab):
+    """
+    Bellman-Ford on the weighted edge editor (negative weights allowed).
+    Three modes over the shared edge arrays: a pass loop that stops early,
+    the SPFA queue variant, and NumPy passes that relax every edge at once.
+    A negative cycle reachable from the start is found and drawn in red.
+    """
+
+    TITLE = "Bellman-Ford Algorithm"
+    NEGATIVE_WEIGHTS = True
+
+    def build_options(self, frame):
+        modes = list(shortest_paths.BELLMAN_FORD_MODES)
+        if shortest_paths.np is None:
+            modes.remove("NumPy vectorized passes")  # NumPy is optional
+        ttk.Label(frame, text="Mode:", style="Dark.TLabel").pack(side="left")
+        self.mode_var = tk.StringVar(value=modes[0])
+        ttk.Combobox(frame, textvariable=self.mode_var, state="readonly", width=24,
+                     values=modes).pack(side="left", padx=5)
+        self.counts = None
+        self.dist = []
+        self.parent = []
+        self.cycle = None
+
+    def make_steps(self, start, goal):
+        self.dist = [math.inf] * self.num_nodes
+        self.parent = [None] * self.num_nodes
+        self.counts = {"passes": 0, "queue pops": 0, "edge checks": 0, "relaxations": 0}
+        self.cycle = None
+        return self._watch_cycle(shortest_paths.bellman_ford_stepper(
+            self.graph, start, self.mode_var.get(), self.dist, self.parent, self.counts,
+            detail=self.num_nodes <= self.MAX_DRAWN_NODES))
+
+    def _watch_cycle(self, steps):
+        # Keep the cycle even when the graph is too big to draw
+        for event in steps:
+            if event[0] == "negative_cycle":
+                self.cycle = event[1]
+            yield event
+
+    def handle_event(self, event):
+        if event[0] == "pass":
+            _, k = event
+            self._halo_node(None)
+            self._log_step(f"Pass {k}: relax every edge.")
+        elif event[0] == "relax":
+            _, u, v, d = event
+            # The tree edge into v moves to the new parent
+            for (i, j), color in list(self.edge_colors.items()):
+                if j == v and color == "green":
+                    self._set_edge_color(i, j, "black")
+            self._set_edge_color(u, v, "green", width=3)
+            self._set_node_note(v, str(d))
+            self._color_node(v, "khaki")
+            self._log_step(f"Shorter path to {self.node_labels[v]} through "
+                           f"{self.node_labels[u]}: {d}.")
+        elif event[0] == "negative_cycle":
+            _, nodes = event
+            for a, b in zip(nodes, nodes[1:] + nodes[:1]):
+                self._set_edge_color(a, b, "red", width=3)
+                self._color_node(a, "red")
+            labels = " → ".join(self.node_labels[v] for v in nodes + nodes[:1])
+            self._log_step(f"Negative cycle: {labels}")
+        else:
+            super().handle_event(event)
+
+    def on_complete(self):
+        if self.cycle is not None:
+            labels = " → ".join(self.node_labels[v] for v in self.cycle + self.cycle[:1])
+            self._log_step(f"Negative cycle found: {labels}. Distances are not defined.")
+            return
+        for idx in range(self.num_nodes):
+            if self.dist[idx] != math.inf:
+                self._color_node(idx, "darkgreen")
+                self._set_node_note(idx, str(self.dist[idx]), color="darkgreen")
+        for (i, j), line_id in self.edge_lines.items():
+            if self.parent[j] != i:
+                self.canvas.itemconfig(line_id, fill="lightgray", width=1)
+        unreachable = sum(1 for d in self.dist if d == math.inf)
+        self._log_step(f"Bellman-Ford complete! No negative cycle, {unreachable} unreachable.")
+
+    def stats_text(self):
+        if self.counts is None:
+            return ""
+        counts = ", ".join(f"{k}: {v}" for k, v in self.counts.items() if v)
+        return f"{self.mode_var.get()} — {counts}"
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Bellman-Ford Algorithm")
+    tab = BellmanFordTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
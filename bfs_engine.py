@@ -0,0 +1,632 @@
+# bfs_engine.py
+"""
+Headless BFS engine: breadth-first search over CSR arrays (graph_arrays)
+for graphs far too large to animate, checked against the BFS tab's own
+bfs_steps on smaller ones.
+
+    python bfs_engine.py --n 200000 --m 4 --seed 1
+    python bfs_engine.py --n 3000 --dense 0.3 --seed 1    # adds the bitset runners
+    python bfs_engine.py --n 2000000 --m 4 --workers 16   # adds the process-pool runner
+    python bfs_engine.py --n 3000 --m 4 --all-pairs       # hop-count table for every source
+
+Every runner returns (dist, parent, counts): dist[v] is the hop count from
+the source (-1 if unreached), parent[v] the node v was reached from (-1 for
+the source and unreached nodes). bidirectional() answers a single
+start -> goal query instead and returns (path, counts).
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import graph_generators
+from graph_arrays import CSR, BitsetRows, np
+
+
+def _bare(tab_class):
+    """A tab with no widgets; bfs_steps only uses plain attributes."""
+    return tab_class.__new__(tab_class)
+
+
+def reference(adjacency, source):
+    """Distances and parents exactly as BreadthFirstSearchTab.bfs_steps finds them."""
+    from BFS import BreadthFirstSearchTab   # Here, as the BFS tab imports this module
+    n = len(adjacency)
+    tab = _bare(BreadthFirstSearchTab)
+    tab.num_nodes = n
+    tab.node_labels = [str(i) for i in range(n)]
+    tab.adjacency_indexed = adjacency
+    tab.pre_order_list = []
+    parent = array("l", [-1]) * n
+    last_edge = None
+    for event in tab.bfs_steps([source]):
+        if event[0] == "edge":
+            last_edge = event
+        elif event[0] == "visit" and last_edge is not None and last_edge[2] == event[1]:
+            parent[event[1]] = last_edge[1]
+    dist = array("l", (-1 if d == float("inf") else d for d in (tab.distances[i] for i in range(n))))
+    return dist, parent, {}
+
+
+###############################################################################
+# Top-down BFS
+###############################################################################
+def top_down(csr, source):
+    """
+    Plain queue-order BFS: every frontier node scans all of its out-edges.
+    source may also be a list of nodes, all at distance 0 (multi-source BFS).
+    """
+    n, offsets, targets = csr.n, csr.offsets, csr.targets
+    dist = array("l", [-1]) * n
+    parent = array("l", [-1]) * n
+    frontier = [source] if isinstance(source, int) else list(source)
+    for s in frontier:
+        dist[s] = 0
+    counts = {"edges examined": 0, "top-down levels": 0, "bottom-up levels": 0}
+    depth = 0
+    while frontier:
+        depth += 1
+        counts["top-down levels"] += 1
+        nxt = []
+        for u in frontier:
+            counts["edges examined"] += offsets[u + 1] - offsets[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if dist[v] < 0:
+                    dist[v] = depth
+                    parent[v] = u
+                    nxt.append(v)
+        frontier = nxt
+    return dist, parent, counts
+
+
+###############################################################################
+# Direction-optimizing BFS (Beamer, Asanović & Patterson)
+###############################################################################
+def direction_optimizing(csr, reverse, source, alpha=14, beta=24, canonical=False):
+    """
+    Switches per level between top-down (frontier scans its out-edges) and
+    bottom-up (every unreached node scans its in-edges, stopping at the
+    first parent it finds in the frontier):
+      - go bottom-up when the frontier's out-edges exceed 1/alpha of the
+        edges still leaving unreached nodes (the frontier is "large"),
+      - go back top-down when the frontier shrinks below n/beta nodes.
+    reverse is csr.reverse() (the same graph again when it is undirected).
+
+    Distances always equal top-down BFS. Parents are valid BFS parents; with
+    canonical=True they are also exactly the ones top-down BFS (and the BFS
+    tab) picks: bottom-up steps then check every in-edge instead of stopping
+    early, choosing the parent that comes first in the frontier, and the
+    next frontier is kept in top-down order.
+    """
+    n, offsets, targets = csr.n, csr.offsets, csr.targets
+    r_offsets, r_targets = reverse.offsets, reverse.targets
+    dist = array("l", [-1]) * n
+    parent = array("l", [-1]) * n
+    position = array("l", [-1]) * n     # Index of a node in the current frontier
+    dist[source] = 0
+    counts = {"edges examined": 0, "top-down levels": 0, "bottom-up levels": 0}
+
+    frontier = [source]
+    unreached = range(n)                # Narrowed at every bottom-up level
+    edges_unexplored = len(targets) - (offsets[source + 1] - offsets[source])
+    bottom_up = False
+    depth = 0
+    while frontier:
+        depth += 1
+        frontier_edges = sum(offsets[u + 1] - offsets[u] for u in frontier)
+        if not bottom_up and frontier_edges > edges_unexplored / alpha:
+            bottom_up = True
+        elif bottom_up and len(frontier) < n / beta:
+            bottom_up = False
+
+        if bottom_up:
+            counts["bottom-up levels"] += 1
+            for i, u in enumerate(frontier):
+                position[u] = i
+            unreached = [v for v in unreached if dist[v] < 0]
+            found = []
+            examined = 0
+            for v in unreached:
+                start, end = r_offsets[v], r_offsets[v + 1]
+                best = -1
+                for k in range(start, end):
+                    u = r_targets[k]
+                    if position[u] >= 0:       # u is in the frontier
+                        if not canonical:
+                            best = u
+                            examined += k - start + 1
+                            break
+                        if best < 0 or position[u] < position[best]:
+                            best = u
+                else:
+                    examined += end - start
+                if best >= 0:
+                    found.append(v)
+                    parent[v] = best
+            counts["edges examined"] += examined
+            for v in found:
+                dist[v] = depth
+            if canonical:
+                # Top-down order: by parent's place in the frontier, then by edge order
+                found.sort(key=lambda v: position[parent[v]] * n + v)
+            for u in frontier:
+                position[u] = -1
+            nxt = found
+        else:
+            counts["top-down levels"] += 1
+            nxt = []
+            for u in frontier:
+                counts["edges examined"] += offsets[u + 1] - offsets[u]
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if dist[v] < 0:
+                        dist[v] = depth
+                        parent[v] = u
+                        nxt.append(v)
+        edges_unexplored -= sum(offsets[v + 1] - offsets[v] for v in nxt)
+        frontier = nxt
+    return dist, parent, counts
+
+
+###############################################################################
+# Parallel top-down BFS on a process pool
+###############################################################################
+# The shared blocks and their views, set once per worker process by _attach_worker
+_shared_blocks = None
+_shared_views = None
+
+
+def _shared_array(array_, extra=0):
+    """
+    A shared memory block holding array_ (plus room for extra items), and a
+    view of exactly those len(array_) + extra items: the block itself may be
+    rounded up to a whole page (macOS does), so its size says nothing.
+    """
+    length = len(array_) + extra
+    block = shared_memory.SharedMemory(create=True, size=max(length, 1) * array_.itemsize)
+    view = block.buf.cast(array_.typecode)[:length]
+    view[:len(array_)] = array_
+    return block, view
+
+
+def _attach_worker(names, lengths):
+    """Pool initializer: map the shared blocks (CSR, dist, frontier, ...) into this worker, no copies."""
+    global _shared_blocks, _shared_views
+    _shared_blocks = [shared_memory.SharedMemory(name=name) for name in names]
+    _shared_views = [block.buf.cast("l")[:length]
+                     for block, length in zip(_shared_blocks, lengths)]
+
+
+def _shared_pool(workers, blocks, views):
+    """
+    A process pool whose workers have the blocks attached, each cut to the
+    length of its view here. Forked workers where the platform has fork:
+    they start faster and never re-import the calling program (which may be
+    the Tk app).
+    """
+    context = None
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    return ProcessPoolExecutor(workers, mp_context=context, initializer=_attach_worker,
+                               initargs=([block.name for block in blocks],
+                                         [len(view) for view in views]))
+
+
+def _release(views, blocks):
+    for view in views:
+        view.release()
+    for block in blocks:
+        block.close()
+        block.unlink()
+
+
+def _expand_chunk(lo, hi):
+    """Worker task: _expand over this process's shared views."""
+    return _expand(_shared_views, lo, hi)
+
+
+def _expand(views, lo, hi):
+    """
+    Scan the out-edges of frontier[lo:hi] in order. Returns the unvisited
+    targets as flat (v, u) pairs, each v once, and the edges examined;
+    dist is only read, the main process settles the level.
+    """
+    offsets, targets, dist, frontier = views
+    found = array("l")
+    seen = set()
+    examined = 0
+    for i in range(lo, hi):
+        u = frontier[i]
+        start, end = offsets[u], offsets[u + 1]
+        examined += end - start
+        for k in range(start, end):
+            v = targets[k]
+            if dist[v] < 0 and v not in seen:
+                seen.add(v)
+                found.append(v)
+                found.append(u)
+    return found, examined
+
+
+def parallel_top_down(csr, source, workers=None, chunks_per_worker=4, inline_below=2048):
+    """
+    top_down with every large frontier split into contiguous chunks that a
+    ProcessPoolExecutor expands in parallel. The CSR arrays, dist and the
+    frontier live in multiprocessing.shared_memory, so workers read them in
+    place and only the discovered (node, parent) pairs travel back. The
+    chunks are merged in frontier order and the first pair for a node wins,
+    which gives exactly top_down's dist, parents and frontier order.
+    Frontiers smaller than inline_below are expanded here, where a round
+    trip to the pool would cost more than it saves.
+    """
+    workers = workers or os.cpu_count() or 1
+    n = csr.n
+    frontier = [source] if isinstance(source, int) else list(source)
+    dist = array("l", [-1]) * n
+    for s in frontier:
+        dist[s] = 0
+    parent = array("l", [-1]) * n
+    counts = {"edges examined": 0, "levels": 0, "parallel levels": 0}
+
+    blocks, views = [], []
+    for column, extra in ((csr.offsets, 0), (csr.targets, 0), (dist, 0), (array("l"), n)):
+        block, view = _shared_array(column, extra)
+        blocks.append(block)
+        views.append(view)
+    shared_dist, shared_frontier = views[2], views[3]
+    try:
+        with _shared_pool(workers, blocks, views) as pool:
+            depth = 0
+            while frontier:
+                depth += 1
+                counts["levels"] += 1
+                size = len(frontier)
+                shared_frontier[:size] = array("l", frontier)
+                if size < inline_below:
+                    results = [_expand(views, 0, size)]
+                else:
+                    counts["parallel levels"] += 1
+                    step = -(-size // (workers * chunks_per_worker))
+                    futures = [pool.submit(_expand_chunk, lo, min(lo + step, size))
+                               for lo in range(0, size, step)]
+                    results = [future.result() for future in futures]
+                nxt = []
+                for found, examined in results:
+                    counts["edges examined"] += examined
+                    for i in range(0, len(found), 2):
+                        v = found[i]
+                        if shared_dist[v] < 0:
+                            shared_dist[v] = depth
+                            parent[v] = found[i + 1]
+                            nxt.append(v)
+                frontier = nxt
+            dist = array("l", shared_dist)
+    finally:
+        _release(views, blocks)
+    return dist, parent, counts
+
+
+###############################################################################
+# All-pairs hop counts
+###############################################################################
+class DistanceMatrix:
+    """
+    n x n BFS hop counts in one row-major array: 'H' (uint16) while every
+    distance fits, 'I' (uint32) beyond 65534 nodes. unreached (the type's
+    largest value) marks "no path".
+    """
+
+    def __init__(self, n, data):
+        self.n = n
+        self.data = data
+        self.unreached = (1 << 8 * data.itemsize) - 1
+
+    def row(self, source):
+        """Distances from source to every node (an array slice)."""
+        return self.data[source * self.n:(source + 1) * self.n]
+
+    def __getitem__(self, pair):
+        source, target = pair
+        d = self.data[source * self.n + target]
+        return None if d == self.unreached else d
+
+    def nbytes(self):
+        return len(self.data) * self.data.itemsize
+
+
+def _typecode(n):
+    return "H" if n < 0xFFFF else "I"
+
+
+def _distance_rows(offsets, targets, n, lo, hi):
+    """Rows lo..hi-1 of the hop-count matrix, one top-down BFS each."""
+    typecode = _typecode(n)
+    unreached = (1 << 8 * array(typecode).itemsize) - 1
+    blank = array(typecode, [unreached]) * n
+    rows = array(typecode)
+    for source in range(lo, hi):
+        row = array(typecode, blank)
+        row[source] = 0
+        frontier = [source]
+        depth = 0
+        while frontier:
+            depth += 1
+            nxt = []
+            for u in frontier:
+                for k in range(offsets[u], offsets[u + 1]):
+                    v = targets[k]
+                    if row[v] == unreached:
+                        row[v] = depth
+                        nxt.append(v)
+            frontier = nxt
+        rows.extend(row)
+    return rows
+
+
+def _distance_rows_chunk(n, lo, hi):
+    """Worker task: _distance_rows over this process's shared CSR."""
+    offsets, targets = _shared_views[0], _shared_views[1]
+    return _distance_rows(offsets, targets, n, lo, hi)
+
+
+def all_pairs(csr, workers=1, rows_per_task=32):
+    """
+    BFS from every node, giving a DistanceMatrix. With workers > 1 the
+    sources are handed out in blocks of rows_per_task to a process pool
+    that reads the CSR from shared memory, like parallel_top_down; the
+    blocks come back in order, so the matrix is the same either way.
+    Meant for graphs of up to a few thousand nodes (n² entries).
+    """
+    n = csr.n
+    if workers <= 1 or n <= rows_per_task:
+        return DistanceMatrix(n, _distance_rows(csr.offsets, csr.targets, n, 0, n))
+    blocks, views = [], []
+    for column in (csr.offsets, csr.targets):
+        block, view = _shared_array(column)
+        blocks.append(block)
+        views.append(view)
+    try:
+        with _shared_pool(workers, blocks, views) as pool:
+            futures = [pool.submit(_distance_rows_chunk, n, lo, min(lo + rows_per_task, n))
+                       for lo in range(0, n, rows_per_task)]
+            data = array(_typecode(n))
+            for future in futures:
+                data.extend(future.result())
+    finally:
+        _release(views, blocks)
+    return DistanceMatrix(n, data)
+
+
+###############################################################################
+# Bidirectional point-to-point BFS
+###############################################################################
+def bidirectional(csr, reverse, source, goal):
+    """
+    Shortest source -> goal path by searching forward from source (a node or
+    a list of nodes) and backward from goal over reverse = csr.reverse().
+    Each round expands one whole level of the frontier with fewer nodes;
+    after the first level in which the two searches meet, the best meeting
+    node lies on a shortest path. Returns (path, counts); path is [] when
+    the goal cannot be reached. counts["touched"] is the number of nodes
+    either search reached.
+    """
+    sides = (
+        (csr.offsets, csr.targets, array("l", [-1]) * csr.n, array("l", [-1]) * csr.n),
+        (reverse.offsets, reverse.targets, array("l", [-1]) * csr.n, array("l", [-1]) * csr.n),
+    )
+    starts = [source] if isinstance(source, int) else list(source)
+    frontiers = [starts, [goal]]
+    for s in starts:
+        sides[0][2][s] = 0
+    sides[1][2][goal] = 0
+    counts = {"touched": len(set(starts) | {goal}), "edges examined": 0,
+              "forward levels": 0, "backward levels": 0}
+
+    meet = goal if sides[0][2][goal] == 0 else -1
+    while meet < 0 and frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        offsets, targets, dist, parent = sides[side]
+        other = sides[1 - side][2]
+        counts["backward levels" if side else "forward levels"] += 1
+        best = -1
+        nxt = []
+        for u in frontiers[side]:
+            counts["edges examined"] += offsets[u + 1] - offsets[u]
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                if dist[v] < 0:
+                    dist[v] = dist[u] + 1
+                    parent[v] = u
+                    nxt.append(v)
+                    if other[v] < 0:
+                        counts["touched"] += 1
+                    elif best < 0 or dist[v] + other[v] < dist[best] + other[best]:
+                        best = v
+        frontiers[side] = nxt
+        meet = best
+
+    if meet < 0:
+        return [], counts
+    path = []
+    v = meet
+    while v >= 0:
+        path.append(v)
+        v = sides[0][3][v]
+    path.reverse()
+    v = sides[1][3][meet]
+    while v >= 0:
+        path.append(v)
+        v = sides[1][3][v]
+    return path, counts
+
+
+###############################################################################
+# Bitset BFS (dense graphs, e.g. from the matrix input)
+###############################################################################
+def bitset_bfs(bitsets, source):
+    """
+    Level-synchronous BFS on BitsetRows. The unvisited set is one bitset:
+    each frontier node's row is AND-ed with it and the hits cleared from it,
+    so a level costs one word-parallel row operation per frontier node
+    instead of one interpreted step per edge. Hits are read lowest bit
+    first, so with rows in ascending node order the parents and frontier
+    order are exactly those of top_down.
+    """
+    n, rows, position = bitsets.n, bitsets.rows, bitsets.position
+    dist = array("l", [-1]) * n
+    parent = array("l", [-1]) * n
+    dist[source] = 0
+    unvisited = bitsets.full() & ~(1 << position[source])
+    counts = {"row operations": 0, "levels": 0}
+    frontier = [source]
+    depth = 0
+    while frontier and unvisited:
+        depth += 1
+        counts["levels"] += 1
+        nxt = []
+        for u in frontier:
+            counts["row operations"] += 1
+            hits = rows[u] & unvisited
+            if hits:
+                unvisited ^= hits
+                for v in bitsets.members(hits):
+                    dist[v] = depth
+                    parent[v] = u
+                    nxt.append(v)
+        frontier = nxt
+    return dist, parent, counts
+
+
+def bitset_bfs_numpy(bitsets, source):
+    """
+    bitset_bfs on the NumPy-packed rows: a level ORs all frontier rows in one
+    reduction and masks out the visited bits. Each new node's parent is the
+    first frontier node whose row has its bit, which keeps the parents and
+    frontier order of top_down.
+    """
+    if np is None:
+        raise ImportError("NumPy is not installed")
+    n = bitsets.n
+    packed = bitsets.as_numpy()
+    nodes = np.asarray(bitsets.nodes, dtype=np.int64)
+    dist = np.full(n, -1, dtype=np.int64)
+    parent = np.full(n, -1, dtype=np.int64)
+    dist[source] = 0
+    visited = np.zeros(packed.shape[1], dtype=np.uint8)
+    b = bitsets.position[source]
+    visited[b >> 3] |= 1 << (b & 7)
+    counts = {"row operations": 0, "levels": 0}
+    frontier = np.array([source], dtype=np.int64)
+    unvisited = n - 1
+    depth = 0
+    while frontier.size and unvisited:
+        depth += 1
+        counts["levels"] += 1
+        counts["row operations"] += frontier.size
+        block = packed[frontier]
+        reach = np.bitwise_or.reduce(block, axis=0) & ~visited
+        if not reach.any():
+            break
+        visited |= reach
+        bits = np.flatnonzero(np.unpackbits(reach, bitorder="little")[:n])
+        hits = (block[:, bits >> 3] >> (bits & 7).astype(np.uint8)) & 1
+        first = hits.argmax(axis=0)
+        order = np.lexsort((bits, first))
+        found = nodes[bits[order]]
+        dist[found] = depth
+        parent[found] = frontier[first[order]]
+        unvisited -= found.size
+        frontier = found
+    return array("l", dist.tolist()), array("l", parent.tolist()), counts
+
+
+BITSET_ALGORITHMS = {
+    "Bitset (Python ints)": bitset_bfs,
+    "Bitset (NumPy packed rows)": bitset_bfs_numpy,
+}
+
+
+ALGORITHMS = {
+    "Top-down": lambda csr, reverse, source: top_down(csr, source),
+    "Direction-optimizing": direction_optimizing,
+    "Direction-optimizing (canonical parents)":
+        lambda csr, reverse, source: direction_optimizing(csr, reverse, source, canonical=True),
+}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the BFS engines on a scale-free or dense graph.")
+    parser.add_argument("--n", type=int, default=200000)
+    parser.add_argument("--m", type=int, default=4, help="Barabási–Albert edges per new node")
+    parser.add_argument("--dense", type=float, metavar="P",
+                        help="use a directed G(n, P) graph instead and add the bitset runners")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--source", type=int, default=0)
+    parser.add_argument("--workers", type=int,
+                        help="also run parallel_top_down on this many processes")
+    parser.add_argument("--all-pairs", action="store_true",
+                        help="also build the all-pairs hop-count matrix (on --workers processes)")
+    parser.add_argument("--goal", type=int,
+                        help="also answer source -> goal with bidirectional BFS")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.dense:
+        adjacency = graph_generators.erdos_renyi(args.n, args.dense, args.seed)
+        name = f"G(n, p) n={args.n}, p={args.dense}"
+    else:
+        adjacency = graph_generators.barabasi_albert(args.n, args.m, args.seed)
+        name = f"Barabási–Albert n={args.n}, m={args.m}"
+    csr = CSR.from_adjacency(adjacency)
+    reverse = csr.reverse()
+    print(f"{name}: {len(csr)} directed edges ({time.perf_counter() - start:.1f} s to build)")
+
+    runs = dict(ALGORITHMS)
+    if args.dense:
+        start = time.perf_counter()
+        bitsets = BitsetRows.from_adjacency(adjacency)
+        print(f"bitset rows: {time.perf_counter() - start:.1f} s to build")
+        for label, bfs in BITSET_ALGORITHMS.items():
+            if bfs is bitset_bfs_numpy and np is None:
+                continue
+            runs[label] = lambda csr, reverse, source, bfs=bfs: bfs(bitsets, source)
+    if args.workers:
+        runs[f"Parallel top-down ({args.workers} workers)"] = \
+            lambda csr, reverse, source: parallel_top_down(csr, source, args.workers)
+
+    baseline = None
+    for name, run in runs.items():
+        start = time.perf_counter()
+        dist, parent, counts = run(csr, reverse, args.source)
+        seconds = time.perf_counter() - start
+        if baseline is None:
+            baseline = (dist, parent)
+        same = "same dist" if dist == baseline[0] else "DIST DIFFERS"
+        same += ", same parents" if parent == baseline[1] else ", other valid parents"
+        ops = ", ".join(f"{k}={v}" for k, v in counts.items())
+        print(f"{name:<42}{seconds:>7.2f}s  {ops}  ({same})")
+
+    if args.goal is not None:
+        start = time.perf_counter()
+        path, counts = bidirectional(csr, reverse, args.source, args.goal)
+        seconds = time.perf_counter() - start
+        reached = sum(1 for d in baseline[0] if d >= 0)
+        hops = len(path) - 1 if path else "no path"
+        same = "same length" if len(path) - 1 == baseline[0][args.goal] else "LENGTH DIFFERS"
+        ops = ", ".join(f"{k}={v}" for k, v in counts.items())
+        name = f"Bidirectional {args.source} -> {args.goal}"
+        print(f"{name:<42}{seconds:>7.2f}s  "
+              f"{ops}  (path {hops}, {same}; single-source BFS touched {reached})")
+
+    if args.all_pairs:
+        start = time.perf_counter()
+        matrix = all_pairs(csr, args.workers or 1)
+        seconds = time.perf_counter() - start
+        same = "same" if list(matrix.row(args.source)) == [
+            matrix.unreached if d < 0 else d for d in baseline[0]] else "ROW DIFFERS"
+        print(f"{'All pairs':<42}{seconds:>7.2f}s  {matrix.n}x{matrix.n} '{matrix.data.typecode}' "
+              f"matrix, {matrix.nbytes() / 1e6:.1f} MB  (row {args.source}: {same})")
@@ -1,6 +1,7 @@
 # bubble_sort.py
 import tkinter as tk
 from tkinter import ttk
+from workload_picker import WorkloadPicker
 
 class BubbleSortTab(ttk.Frame):
     def __init__(self, parent):
@@ -27,6 +28,9 @@ class BubbleSortTab(ttk.Frame):
         self.generate_button = ttk.Button(
             self.input_frame, text="Generate Input Fields", command=self.generate_input_fields)
         self.generate_button.grid(row=0, column=2, padx=5, pady=5)
+        # Seeded input distributions (uses the number of elements above)
+        self.workload_picker = WorkloadPicker(self.input_frame, on_fill=self.fill_workload)
+        self.workload_picker.grid(row=1, column=0, columnspan=3, pady=5)
 
         # --- Next Section: Enter Array Elements ---
         self.array_frame = ttk.Frame(self)
@@ -101,6 +105,13 @@ class BubbleSortTab(ttk.Frame):
             self.array_frame, text="Start Bubble Sort", command=self.start_sort)
         self.start_button.grid(row=2, column=0, columnspan=num_elements, pady=10)
 
+    def fill_workload(self):
+        """Generate the input fields and fill them from the chosen workload."""
+        self.generate_input_fields()
+        values = self.workload_picker.values(len(self.entries))
+        for entry, value in zip(self.entries, values):
+            entry.insert(0, str(value))
+
     def start_sort(self):
         """
         Gathers numbers from input fields and starts the bubble sort visualization.
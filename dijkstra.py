@@ -0,0 +1,96 @@
+# dijkstra.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+import math
+from graph_tab import WeightedGraphTab
+from priority_queues import QUEUE_ENGINES, make_queue
+import shortest_paths
+
+
+class DijkstraTab(WeightedGraphTab):
+    """
+    Dijkstra's algorithm on the weighted edge editor, with a choice of
+    priority-queue engine. The counters under the controls show how much
+    queue work each engine does for the same graph.
+    """
+
+    TITLE = "Dijkstra's Algorithm"
+
+    def build_options(self, frame):
+        ttk.Label(frame, text="Priority queue:", style="Dark.TLabel").pack(side="left")
+        self.queue_var = tk.StringVar(value=QUEUE_ENGINES[0])
+        ttk.Combobox(frame, textvariable=self.queue_var, state="readonly", width=22,
+                     values=list(QUEUE_ENGINES)).pack(side="left", padx=5)
+        self.queue = None
+        self.dist = []
+        self.parent = []
+        self.settled = 0
+
+    def make_steps(self, start, goal):
+        for nbrs in self.graph.values():
+            for _, w in nbrs:
+                if w < 0:
+                    messagebox.showerror("Negative Weight",
+                                         "Dijkstra needs non-negative edge weights "
+                                         "(use Bellman-Ford for negative ones).")
+                    return None
+
+        engine = self.queue_var.get()
+        max_weight = shortest_paths.max_edge_weight(self.graph)
+        if engine == "Bucket queue (Dial)" and max_weight != int(max_weight):
+            messagebox.showerror("Bucket Queue", "The bucket queue needs integer edge weights.")
+            return None
+
+        self.queue = make_queue(engine, max_weight)
+        self.dist = [math.inf] * self.num_nodes
+        self.parent = [None] * self.num_nodes
+        self.settled = 0
+        return self._counted(shortest_paths.dijkstra_steps(
+            self.graph, start, self.queue, self.dist, self.parent))
+
+    def _counted(self, steps):
+        for event in steps:
+            if event[0] == "visit":
+                self.settled += 1
+            yield event
+
+    def handle_event(self, event):
+        if event[0] == "visit":
+            _, u = event
+            super().handle_event(event)
+            self._set_node_note(u, str(self.dist[u]), color="darkgreen")
+            if self.parent[u] is not None:
+                self._set_edge_color(self.parent[u], u, "green", width=3)
+            self._log_step(f"Settle node {self.node_labels[u]} at distance {self.dist[u]}.")
+        elif event[0] == "relax":
+            _, u, v, d = event
+            self._set_node_note(v, str(d))
+            self._color_node(v, "khaki")
+            self._log_step(f"Shorter path to {self.node_labels[v]} through "
+                           f"{self.node_labels[u]}: {d}.")
+        else:
+            super().handle_event(event)
+
+    def on_complete(self):
+        # Only the shortest-path tree stays highlighted
+        for (i, j), line_id in self.edge_lines.items():
+            if self.parent[j] != i and (self.DIRECTED or self.parent[i] != j):
+                self.canvas.itemconfig(line_id, fill="lightgray", width=1)
+        unreachable = sum(1 for d in self.dist if d == math.inf)
+        self._log_step(f"Dijkstra complete! {self.settled} nodes settled, "
+                       f"{unreachable} unreachable.")
+
+    def stats_text(self):
+        if self.queue is None:
+            return ""
+        counts = ", ".join(f"{k}: {v}" for k, v in self.queue.counts.items())
+        return f"{self.queue_var.get()} — settled: {self.settled}, {counts}"
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Dijkstra's Algorithm")
+    tab = DijkstraTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
@@ -0,0 +1,205 @@
+# dynamic_bfs.py
+"""
+Dynamic BFS: keep a BFS tree's distances and parents correct while edges
+are inserted and deleted, repairing only the part of the tree an edit can
+reach instead of searching the whole graph again.
+
+    python dynamic_bfs.py --n 200000 --m 4 --edits 2000 --seed 1
+
+Same conventions as bfs_engine: dist[v] is the hop count from the nearest
+source (-1 if unreached) and parent[v] the node v hangs off in the tree
+(-1 for sources and unreached nodes). Every edit returns the nodes whose
+distance, parent or source changed, so a view only redraws those.
+"""
+import argparse
+import heapq
+import random
+import time
+from collections import deque
+
+import graph_generators
+import bfs_engine
+from graph_arrays import CSR
+
+
+class DynamicBFS:
+    """
+    Multi-source BFS tree over a directed graph that can change. The graph
+    is held as out- and in-neighbour sets; source[v] is the position in
+    sources of the start v was reached from.
+
+    insert_edge(u, v) can only shorten paths: if it gives v a shorter
+    distance, the decrease spreads breadth-first from v and stops at the
+    first node it does not improve.
+
+    delete_edge(u, v) only matters when u -> v is a tree edge. Then v's
+    subtree is cut off; each cut node is re-seeded from its best in-neighbour
+    outside the subtree and the subtree is re-solved in distance order
+    (unit-weight Dijkstra), never looking outside it again.
+    """
+
+    def __init__(self, adjacency, sources):
+        n = len(adjacency)
+        self.sources = list(sources)
+        self.out = [set(adjacency[u]) for u in range(n)]
+        self.into = [set() for _ in range(n)]
+        for u in range(n):
+            for v in self.out[u]:
+                self.into[v].add(u)
+        self.dist = [-1] * n
+        self.parent = [-1] * n
+        self.source = [-1] * n
+        self.children = [set() for _ in range(n)]
+        self.counts = {"inserts": 0, "deletes": 0, "nodes repaired": 0}
+        self._search()
+
+    def __len__(self):
+        return len(self.out)
+
+    def _search(self):
+        """Plain BFS from the sources, used once to build the first tree."""
+        queue = deque()
+        for k, s in enumerate(self.sources):
+            if self.dist[s] < 0:
+                self.dist[s] = 0
+                self.source[s] = k
+                queue.append(s)
+        while queue:
+            u = queue.popleft()
+            for v in self.out[u]:
+                if self.dist[v] < 0:
+                    self._attach(v, u, self.dist[u] + 1)
+                    queue.append(v)
+
+    def _attach(self, v, u, d):
+        """Hang v off u at distance d (u == -1 detaches v)."""
+        old = self.parent[v]
+        if old >= 0:
+            self.children[old].discard(v)
+        self.parent[v] = u
+        self.dist[v] = d
+        if u >= 0:
+            self.children[u].add(v)
+            self.source[v] = self.source[u]
+        else:
+            self.source[v] = -1
+
+    def _improves(self, u, v):
+        """Would the edge u -> v give v a shorter distance than it has?"""
+        return self.dist[u] >= 0 and (self.dist[v] < 0 or self.dist[u] + 1 < self.dist[v])
+
+    ###########################################################################
+    # Edits
+    ###########################################################################
+    def insert_edge(self, u, v):
+        if v in self.out[u]:
+            return []
+        self.counts["inserts"] += 1
+        self.out[u].add(v)
+        self.into[v].add(u)
+        if not self._improves(u, v):
+            return []
+
+        self._attach(v, u, self.dist[u] + 1)
+        changed = [v]
+        queue = deque([v])
+        while queue:
+            x = queue.popleft()
+            for y in self.out[x]:
+                if self._improves(x, y):
+                    self._attach(y, x, self.dist[x] + 1)
+                    changed.append(y)
+                    queue.append(y)
+        self.counts["nodes repaired"] += len(changed)
+        return changed
+
+    def delete_edge(self, u, v):
+        if v not in self.out[u]:
+            return []
+        self.counts["deletes"] += 1
+        self.out[u].discard(v)
+        self.into[v].discard(u)
+        if self.parent[v] != u:
+            return []
+
+        # Cut off v's subtree, remembering what each node had
+        cut = [v]
+        for x in cut:
+            cut.extend(self.children[x])
+        before = {x: (self.dist[x], self.parent[x], self.source[x]) for x in cut}
+        inside = set(cut)
+        for x in cut:
+            self._attach(x, -1, -1)
+
+        # Best way into each cut node from the part of the tree still standing
+        heap = []
+        for x in cut:
+            for w in self.into[x]:
+                if w not in inside and self._improves(w, x):
+                    self._attach(x, w, self.dist[w] + 1)
+            if self.dist[x] >= 0:
+                heap.append((self.dist[x], x))
+        heapq.heapify(heap)
+
+        # Settle the subtree in distance order, only following edges inside it
+        while heap:
+            d, x = heapq.heappop(heap)
+            if d != self.dist[x]:
+                continue
+            for y in self.out[x]:
+                if y in inside and self._improves(x, y):
+                    self._attach(y, x, d + 1)
+                    heapq.heappush(heap, (d + 1, y))
+
+        changed = [x for x in cut if before[x] != (self.dist[x], self.parent[x], self.source[x])]
+        self.counts["nodes repaired"] += len(cut)
+        return changed
+
+    def tree_edges(self):
+        return [(p, v) for v, p in enumerate(self.parent) if p >= 0]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Repair a BFS tree through random edge edits.")
+    parser.add_argument("--n", type=int, default=200000)
+    parser.add_argument("--m", type=int, default=4, help="Barabási–Albert edges per new node")
+    parser.add_argument("--edits", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--source", type=int, default=0)
+    parser.add_argument("--check-every", type=int, default=500,
+                        help="compare against a full BFS after this many edits")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    adjacency = graph_generators.barabasi_albert(args.n, args.m, args.seed)
+    start = time.perf_counter()
+    tree = DynamicBFS(adjacency, [args.source])
+    print(f"Barabási–Albert n={args.n}, m={args.m}: first tree in {time.perf_counter() - start:.2f} s")
+
+    repaired = full = 0.0
+    for k in range(1, args.edits + 1):
+        # Half deletions of tree edges (the expensive kind), half random insertions
+        if k % 2:
+            v = rng.randrange(args.n)
+            while tree.parent[v] < 0:
+                v = rng.randrange(args.n)
+            u = tree.parent[v]
+            start = time.perf_counter()
+            tree.delete_edge(u, v)
+        else:
+            u, v = rng.randrange(args.n), rng.randrange(args.n)
+            start = time.perf_counter()
+            tree.insert_edge(u, v)
+        repaired += time.perf_counter() - start
+
+        if k % args.check_every == 0 or k == args.edits:
+            start = time.perf_counter()
+            dist, _, _ = bfs_engine.top_down(CSR.from_adjacency(dict(enumerate(tree.out))), args.source)
+            full += time.perf_counter() - start
+            same = "same dist" if list(dist) == tree.dist else "DIST DIFFERS"
+            print(f"after {k:>6} edits: {same}")
+
+    checks = -(-args.edits // args.check_every)
+    ops = ", ".join(f"{k}={v}" for k, v in tree.counts.items())
+    print(f"repair: {repaired / args.edits * 1e3:.3f} ms per edit ({ops})")
+    print(f"full BFS (CSR build + top-down): {full / checks * 1e3:.1f} ms per run")
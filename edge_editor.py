@@ -0,0 +1,486 @@
+# edge_editor.py
+import hashlib
+import tkinter as tk
+from tkinter import ttk
+
+
+class SparseEdgeEditor(ttk.Frame):
+    """
+    Virtualized adjacency editor shared by the graph tabs.
+
+    Edges live in ``self.edges`` (row index -> set of column indexes), so only
+    rows that actually have edges take up memory. Widgets are only created for
+    the rows currently scrolled into view and are recycled as the view moves:
+      - "matrix" mode draws the visible block of cells straight onto the canvas
+        (click a cell to toggle the edge row -> col).
+      - "list" mode shows one Entry per visible row holding the neighbour labels,
+        separated by commas or spaces.
+    Node labels are edited in the row header of either mode.
+
+    With weighted=True every edge also carries a weight (default 1): list mode
+    takes "label:weight" tokens and matrix cells show the weight.
+
+    Every change bumps ``revision`` and is passed to the callbacks given to
+    add_listener() as one tuple:
+        ("edge", row, col, present)   an edge was added or removed
+        ("weight", row, col)          an existing edge got a new weight
+        ("labels",)                   a node was renamed
+        ("graph",)                    the whole graph was replaced
+    List-mode rows are only read when committed (labels(), adjacency(), ...),
+    so their changes are reported then.
+    """
+
+    ROW_HEIGHT = 28      # Height of one row in pixels
+    CELL_WIDTH = 26      # Width of one matrix cell in pixels
+    HEADER_HEIGHT = 26   # Column labels (matrix) / heading (list)
+    ROW_HEADER_WIDTH = 70
+
+    def __init__(self, parent, mode="matrix", width=360, height=380, weighted=False):
+        super().__init__(parent, style="Dark.TFrame")
+
+        self.mode = mode
+        self.weighted = weighted
+        self.weights = {}      # (row, col) -> weight, for weighted editors
+        self.num_nodes = 0
+        self.node_labels = []
+        self.edges = {}        # row -> set(col) (directed edges row -> col)
+        self.unresolved = {}   # row -> [typed labels that matched no node] (list mode)
+        self.revision = 0      # Bumped on every change
+        self._listeners = []
+        self._digest = None    # (revision, digest) of the last digest() call
+
+        # First visible row/column
+        self.top_row = 0
+        self.left_col = 0
+
+        # Recycled widgets: each entry is a dict describing one visible row
+        self._row_pool = []
+
+        self.canvas = tk.Canvas(self, width=width, height=height, bg="#424242",
+                                highlightthickness=0)
+        self.vbar = ttk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.hbar = ttk.Scrollbar(self, orient="horizontal", command=self._xview)
+
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        self.vbar.grid(row=0, column=1, sticky="ns")
+        self.hbar.grid(row=1, column=0, sticky="ew")
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Configure>", lambda e: self._render())
+        self.canvas.bind("<Button-1>", self._on_click)
+        self.canvas.bind("<MouseWheel>", self._on_wheel)
+        self.canvas.bind("<Button-4>", lambda e: self._yview("scroll", -1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self._yview("scroll", 1, "units"))
+
+    ###########################################################################
+    # Public API
+    ###########################################################################
+    def reset(self, num_nodes, mode=None):
+        """Start an empty graph with ``num_nodes`` nodes labelled 0..n-1."""
+        if mode is not None:
+            self.mode = mode
+        self.num_nodes = num_nodes
+        self.node_labels = [str(i) for i in range(num_nodes)]
+        self.edges = {}
+        self.weights = {}
+        self.unresolved = {}
+        self.top_row = 0
+        self.left_col = 0
+        self._clear_pool()
+        self._render()
+        self._changed("graph")
+
+    def set_graph(self, adjacency, labels=None, weights=None):
+        """
+        Load a whole graph (dict: index -> list of neighbour indexes) and, for
+        weighted editors, a dict (row, col) -> weight.
+        """
+        self.num_nodes = len(adjacency)
+        self.node_labels = list(labels) if labels else [str(i) for i in range(self.num_nodes)]
+        self.edges = {r: set(nbrs) for r, nbrs in adjacency.items() if nbrs}
+        self.weights = dict(weights) if weights else {}
+        self.unresolved = {}
+        self.top_row = 0
+        self.left_col = 0
+        self._clear_pool()
+        self._render()
+        self._changed("graph")
+
+    def set_mode(self, mode):
+        """Switch between "matrix" and "list" views; the edges are kept."""
+        self._commit_rows()
+        self.mode = mode
+        self.left_col = 0
+        self._clear_pool()
+        self._render()
+
+    def labels(self):
+        """Commit any pending edits and return the node labels."""
+        self._commit_rows()
+        return list(self.node_labels)
+
+    def has_edge(self, r, c):
+        return c in self.edges.get(r, ())
+
+    def set_edge(self, r, c, present, weight=None):
+        existed = self.has_edge(r, c)
+        if present:
+            self.edges.setdefault(r, set()).add(c)
+            reweighted = weight is not None and existed and self.weights.get((r, c), 1) != weight
+            if weight is not None:
+                self.weights[(r, c)] = weight
+            if not existed:
+                self._changed("edge", r, c, True)
+            elif reweighted:
+                self._changed("weight", r, c)
+        elif existed:
+            self.edges[r].discard(c)
+            self.weights.pop((r, c), None)
+            if not self.edges[r]:
+                del self.edges[r]
+            self._changed("edge", r, c, False)
+
+    def weight(self, r, c):
+        return self.weights.get((r, c), 1)
+
+    def edge_count(self):
+        return sum(len(cols) for cols in self.edges.values())
+
+    def adjacency(self):
+        """Return the graph as dict: index -> sorted list of neighbour indexes."""
+        self._commit_rows()
+        adj = {i: [] for i in range(self.num_nodes)}
+        for r, cols in self.edges.items():
+            adj[r] = sorted(cols)
+        return adj
+
+    def weighted_adjacency(self):
+        """Return dict: index -> list of (neighbour index, weight), by neighbour index."""
+        self._commit_rows()
+        adj = {i: [] for i in range(self.num_nodes)}
+        for r, cols in self.edges.items():
+            adj[r] = [(c, self.weights.get((r, c), 1)) for c in sorted(cols)]
+        return adj
+
+    def add_listener(self, callback):
+        """Call callback(change) after every change (see the class docstring)."""
+        self._listeners.append(callback)
+
+    def digest(self):
+        """Hash of the labels, edges and weights; equal digests mean the same graph."""
+        self._commit_rows()
+        if self._digest is None or self._digest[0] != self.revision:
+            h = hashlib.blake2b(digest_size=16)
+            h.update(repr(self.node_labels).encode())
+            for r in sorted(self.edges):
+                cols = sorted(self.edges[r])
+                h.update(repr((r, cols)).encode())
+                if self.weighted:
+                    h.update(repr([self.weights.get((r, c), 1) for c in cols]).encode())
+            self._digest = (self.revision, h.hexdigest())
+        return self._digest[1]
+
+    def _changed(self, *change):
+        self.revision += 1
+        for callback in self._listeners:
+            callback(change)
+
+    ###########################################################################
+    # Scrolling
+    ###########################################################################
+    def _visible_rows(self):
+        h = self.canvas.winfo_height() or int(self.canvas["height"])
+        return max(1, (h - self.HEADER_HEIGHT) // self.ROW_HEIGHT)
+
+    def _visible_cols(self):
+        w = self.canvas.winfo_width() or int(self.canvas["width"])
+        return max(1, (w - self.ROW_HEADER_WIDTH) // self.CELL_WIDTH)
+
+    @staticmethod
+    def _scroll_target(args, current, total, visible):
+        """Translate a Scrollbar command ("moveto"/"scroll") into a first index."""
+        if args[0] == "moveto":
+            pos = int(float(args[1]) * total)
+        else:
+            step = int(args[1]) * (visible if args[2] == "pages" else 1)
+            pos = current + step
+        return max(0, min(pos, max(0, total - visible)))
+
+    def _yview(self, *args):
+        self._commit_rows()
+        self.top_row = self._scroll_target(args, self.top_row, self.num_nodes,
+                                           self._visible_rows())
+        self._render()
+
+    def _xview(self, *args):
+        if self.mode != "matrix":
+            return
+        self.left_col = self._scroll_target(args, self.left_col, self.num_nodes,
+                                            self._visible_cols())
+        self._render()
+
+    def _on_wheel(self, event):
+        self._yview("scroll", -1 if event.delta > 0 else 1, "units")
+
+    ###########################################################################
+    # Rendering
+    ###########################################################################
+    def _clear_pool(self):
+        for slot in self._row_pool:
+            for widget in slot["widgets"]:
+                widget.destroy()
+        self._row_pool = []
+        self.canvas.delete("all")
+
+    def _make_slot(self):
+        """Create one reusable row of widgets."""
+        slot = {"row": None, "widgets": []}
+
+        label_ent = ttk.Entry(self.canvas, width=7)
+        label_ent.bind("<Return>", lambda e, s=slot: self._commit_slot(s))
+        label_ent.bind("<FocusOut>", lambda e, s=slot: self._commit_slot(s))
+        slot["label"] = label_ent
+        slot["label_win"] = self.canvas.create_window(0, 0, window=label_ent, anchor="nw")
+        slot["widgets"].append(label_ent)
+
+        if self.mode == "list":
+            list_ent = tk.Entry(self.canvas)
+            list_ent.bind("<Return>", lambda e, s=slot: self._commit_slot(s))
+            list_ent.bind("<FocusOut>", lambda e, s=slot: self._commit_slot(s))
+            slot["list"] = list_ent
+            slot["list_win"] = self.canvas.create_window(0, 0, window=list_ent, anchor="nw")
+            slot["widgets"].append(list_ent)
+        return slot
+
+    def _render(self):
+        """Redraw the visible window of rows (and columns in matrix mode)."""
+        self._commit_rows()
+        self.canvas.delete("cells")
+        n = self.num_nodes
+        rows = min(self._visible_rows(), n)
+        cols = min(self._visible_cols(), n)
+        self.top_row = max(0, min(self.top_row, n - rows))
+        self.left_col = max(0, min(self.left_col, n - cols))
+
+        while len(self._row_pool) < rows:
+            self._row_pool.append(self._make_slot())
+
+        w = self.canvas.winfo_width() or int(self.canvas["width"])
+
+        # Heading / column labels
+        if self.mode == "matrix":
+            for k in range(cols):
+                c = self.left_col + k
+                x = self.ROW_HEADER_WIDTH + k * self.CELL_WIDTH + self.CELL_WIDTH / 2
+                self.canvas.create_text(x, self.HEADER_HEIGHT / 2, text=self.node_labels[c],
+                                        fill="white", font=("Arial", 9, "bold"), tags="cells")
+        else:
+            self.canvas.create_text(self.ROW_HEADER_WIDTH + 5, self.HEADER_HEIGHT / 2,
+                                    text="Edges", anchor="w", fill="white",
+                                    font=("Arial", 9, "bold"), tags="cells")
+
+        for k, slot in enumerate(self._row_pool):
+            if k >= rows:
+                self.canvas.itemconfigure(slot["label_win"], state="hidden")
+                if "list_win" in slot:
+                    self.canvas.itemconfigure(slot["list_win"], state="hidden")
+                slot["row"] = None
+                continue
+
+            r = self.top_row + k
+            y = self.HEADER_HEIGHT + k * self.ROW_HEIGHT
+            self._bind_slot(slot, r)
+            self.canvas.coords(slot["label_win"], 4, y + 2)
+            self.canvas.itemconfigure(slot["label_win"], state="normal")
+
+            if self.mode == "matrix":
+                row_edges = self.edges.get(r, ())
+                for kc in range(cols):
+                    c = self.left_col + kc
+                    x0 = self.ROW_HEADER_WIDTH + kc * self.CELL_WIDTH + 4
+                    y0 = y + 5
+                    checked = c in row_edges
+                    self.canvas.create_rectangle(
+                        x0, y0, x0 + 18, y0 + 18,
+                        fill="#4caf50" if checked else "white", outline="black", tags="cells"
+                    )
+                    if checked:
+                        mark = _format_weight(self.weight(r, c)) if self.weighted else "✓"
+                        self.canvas.create_text(x0 + 9, y0 + 9, text=mark, fill="white",
+                                                font=("Arial", 9 if self.weighted else 10, "bold"),
+                                                tags="cells")
+            else:
+                self.canvas.coords(slot["list_win"], self.ROW_HEADER_WIDTH, y + 2)
+                self.canvas.itemconfigure(slot["list_win"], state="normal",
+                                          width=max(60, w - self.ROW_HEADER_WIDTH - 6))
+
+        self._update_scrollbars(rows, cols)
+
+    def _update_scrollbars(self, rows, cols):
+        n = max(1, self.num_nodes)
+        self.vbar.set(self.top_row / n, (self.top_row + rows) / n)
+        if self.mode == "matrix":
+            self.hbar.set(self.left_col / n, (self.left_col + cols) / n)
+        else:
+            self.hbar.set(0, 1)
+
+    def _bind_slot(self, slot, r):
+        """Point a recycled row at graph row ``r`` and fill in its text."""
+        slot["row"] = r
+        slot["label"].delete(0, tk.END)
+        slot["label"].insert(0, self.node_labels[r])
+        if self.mode == "list":
+            slot["list"].delete(0, tk.END)
+            slot["list"].insert(0, self._row_text(r))
+
+    def _row_text(self, r):
+        if self.weighted:
+            names = [f"{self.node_labels[c]}:{_format_weight(self.weight(r, c))}"
+                     for c in sorted(self.edges.get(r, ()))]
+        else:
+            names = [self.node_labels[c] for c in sorted(self.edges.get(r, ()))]
+        names.extend(self.unresolved.get(r, []))
+        return ", ".join(names)
+
+    ###########################################################################
+    # Editing
+    ###########################################################################
+    def _commit_rows(self):
+        for slot in self._row_pool:
+            if slot["row"] is not None:
+                self._commit_slot(slot, redraw=False)
+
+    def _commit_slot(self, slot, redraw=True):
+        """Copy a visible row's widgets back into the label list / edge set."""
+        r = slot["row"]
+        if r is None or r >= self.num_nodes:
+            return
+        new_label = slot["label"].get().strip()
+        if new_label == self.node_labels[r]:
+            if self.mode == "list":
+                self._parse_row(r, slot["list"].get())
+            return
+
+        # Read every visible row against the labels it was typed with before renaming,
+        # then show the rows again under the new labels
+        visible = [s for s in self._row_pool if s["row"] is not None and s["row"] < self.num_nodes]
+        if self.mode == "list":
+            for s in visible:
+                self._parse_row(s["row"], s["list"].get())
+        self.node_labels[r] = new_label
+        self._changed("labels")
+        self._resolve_pending()
+        if self.mode == "list":
+            for s in visible:
+                s["list"].delete(0, tk.END)
+                s["list"].insert(0, self._row_text(s["row"]))
+        if redraw:
+            self._render()
+
+    def _label_index(self):
+        """Map each label to the first node carrying it."""
+        index = {}
+        for i, lab in enumerate(self.node_labels):
+            index.setdefault(lab, i)
+        return index
+
+    def _parse_row(self, r, text):
+        index = self._label_index()
+        cols = set()
+        row_weights = {}
+        missing = []
+        for typed in text.replace(",", " ").split():
+            name, weight = typed, 1
+            if self.weighted and ":" in typed:
+                name, _, weight_text = typed.rpartition(":")
+                weight = _parse_weight(weight_text)
+                if weight is None:
+                    missing.append(typed)
+                    continue
+            if name in index:
+                cols.add(index[name])
+                row_weights[index[name]] = weight
+            else:
+                missing.append(typed)
+        old_cols = self.edges.get(r, set())
+        old_weights = {c: self.weights.pop((r, c), 1) for c in old_cols}
+        if self.weighted:
+            for c, weight in row_weights.items():
+                self.weights[(r, c)] = weight
+        if cols:
+            self.edges[r] = cols
+        else:
+            self.edges.pop(r, None)
+        if missing:
+            self.unresolved[r] = missing
+        else:
+            self.unresolved.pop(r, None)
+
+        for c in sorted(old_cols - cols):
+            self._changed("edge", r, c, False)
+        for c in sorted(cols - old_cols):
+            self._changed("edge", r, c, True)
+        if self.weighted:
+            for c in sorted(cols & old_cols):
+                if old_weights[c] != row_weights[c]:
+                    self._changed("weight", r, c)
+
+    def _resolve_pending(self):
+        """Retry typed labels that did not match any node before a rename."""
+        if not self.unresolved:
+            return
+        index = self._label_index()
+        for r in list(self.unresolved):
+            still_missing = []
+            for typed in self.unresolved[r]:
+                name, weight = typed, 1
+                if self.weighted and ":" in typed:
+                    name, _, weight_text = typed.rpartition(":")
+                    weight = _parse_weight(weight_text)
+                if name in index and weight is not None:
+                    self.set_edge(r, index[name], True, weight if self.weighted else None)
+                else:
+                    still_missing.append(typed)
+            if still_missing:
+                self.unresolved[r] = still_missing
+            else:
+                del self.unresolved[r]
+
+    def _on_click(self, event):
+        if self.mode != "matrix":
+            return
+        if event.x < self.ROW_HEADER_WIDTH or event.y < self.HEADER_HEIGHT:
+            return
+        r = self.top_row + (event.y - self.HEADER_HEIGHT) // self.ROW_HEIGHT
+        c = self.left_col + (event.x - self.ROW_HEADER_WIDTH) // self.CELL_WIDTH
+        if r >= self.num_nodes or c >= self.num_nodes:
+            return
+        # The partly drawn strip past the last whole row / column has no cells
+        if r - self.top_row >= self._visible_rows() or c - self.left_col >= self._visible_cols():
+            return
+        self.set_edge(r, c, not self.has_edge(r, c))
+        self._render()
+
+
+def label_key(label):
+    """Sort key for node labels: numeric labels first, compared as numbers, then the rest as text."""
+    try:
+        return (0, int(label))
+    except ValueError:
+        return (1, label)
+
+
+def _format_weight(w):
+    return f"{w:g}" if isinstance(w, float) else str(w)
+
+
+def _parse_weight(text):
+    """"4" -> 4, "2.5" -> 2.5, anything else -> None."""
+    try:
+        return int(text)
+    except ValueError:
+        try:
+            return float(text)
+        except ValueError:
+            return None
@@ -0,0 +1,388 @@
+# force_layout.py
+"""
+Force-directed graph layout (Fruchterman–Reingold) for the graph tabs,
+whose default circle is unreadable past a few dozen nodes.
+
+    python force_layout.py --n 5000 --m 2 --seed 1 --seconds 20
+
+Every pair of nodes repels and every edge pulls its two ends together.
+Repulsion is the O(n²) part, so it is approximated Barnes–Hut style: the
+nodes are bucketed into a quadtree, and a quadtree cell that looks small
+from a node (side / distance < theta) pushes it as one body of the cell's
+total mass at the cell's centre of mass; a leaf that does not look small
+pushes with each of its nodes separately, so theta = 0 is exact. The
+quadtree comes from Morton
+codes: the cells of level l are the distinct codes shifted right by
+2 * (depth - l), so every level is one sorted array and a cell's four
+children are a contiguous run of the level below.
+
+With NumPy the whole traversal runs level by level over arrays of
+(node, cell) pairs; without it the same quadtree is walked node by node.
+Coordinates come back normalized to the unit square, for the caller to
+scale into whatever box it draws in. BackgroundLayout runs a layout on a
+worker thread and hands the result back to a Tk widget.
+"""
+import argparse
+import math
+import random
+import threading
+import time
+
+import graph_generators
+from graph_arrays import np
+
+
+def _spread(x):
+    """Spread the low 16 bits of x apart, one zero bit between each (ints or NumPy arrays)."""
+    x &= 0xFFFF
+    x = (x | (x << 8)) & 0x00FF00FF
+    x = (x | (x << 4)) & 0x0F0F0F0F
+    x = (x | (x << 2)) & 0x33333333
+    x = (x | (x << 1)) & 0x55555555
+    return x
+
+
+def _depth(n):
+    """Quadtree levels below the root: about two nodes per leaf, at most 16 (the Morton width)."""
+    return max(1, min(16, math.ceil(math.log(max(n, 2), 4)) + 1))
+
+
+def edge_pairs(adjacency):
+    """Each edge once as (u, v) with u < v; direction and self-loops do not matter to a layout."""
+    pairs = set()
+    for u in range(len(adjacency)):
+        for v in adjacency[u]:
+            if u != v:
+                pairs.add((u, v) if u < v else (v, u))
+    return sorted(pairs)
+
+
+def normalize(coords, aspect=1.0):
+    """
+    Scale coords uniformly into an aspect:1 (width:height) box, centred on
+    the slack side, then express them as fractions of that box's width and
+    height: the unit square that fit() stretches back out.
+    """
+    if not coords:
+        return []
+    xs = [x for x, _ in coords]
+    ys = [y for _, y in coords]
+    span_x, span_y = max(xs) - min(xs), max(ys) - min(ys)
+    span = max(span_x / aspect, span_y) or 1.0
+    off_x = (1 - span_x / (span * aspect)) / 2
+    off_y = (1 - span_y / span) / 2
+    return [(off_x + (x - min(xs)) / (span * aspect), off_y + (y - min(ys)) / span)
+            for x, y in coords]
+
+
+def fit(coords, x0, y0, x1, y1, aspect=1.0):
+    """Unit-square coords -> canvas positions in the largest aspect:1 box centred in (x0, y0)-(x1, y1)."""
+    height = min(y1 - y0, (x1 - x0) / aspect)
+    width = height * aspect
+    left = x0 + (x1 - x0 - width) / 2
+    top = y0 + (y1 - y0 - height) / 2
+    return [(left + x * width, top + y * height) for x, y in coords]
+
+
+###############################################################################
+# Barnes–Hut repulsion
+###############################################################################
+def _repulsion_numpy(pos, theta, counts):
+    """Repulsive displacement (k = 1, so k²/d) on every node, pairs of (node, cell) at a time."""
+    n = len(pos)
+    depth = _depth(n)
+    lo = pos.min(axis=0)
+    size = float((pos.max(axis=0) - lo).max()) or 1.0
+    cells = 1 << depth
+    grid = np.minimum(((pos - lo) / size * cells).astype(np.int64), cells - 1)
+    code = _spread(grid[:, 0]) | (_spread(grid[:, 1]) << 1)
+    order = np.argsort(code, kind="stable")
+    code_sorted = code[order]
+    pos_sorted = pos[order]
+
+    # Per level: sorted cell keys, their node counts, coordinate sums and first sorted index
+    levels = []
+    for level in range(depth + 1):
+        keys = code_sorted >> (2 * (depth - level))
+        first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        mass = np.diff(np.r_[first, n])
+        levels.append((keys[first], mass, np.add.reduceat(pos_sorted, first, axis=0), first))
+
+    force = np.zeros_like(pos)
+    node = np.arange(n)
+    cell = np.zeros(n, dtype=np.int64)
+    floor = (size * 1e-6) ** 2
+    for level in range(depth + 1):
+        keys, mass, sums, first = levels[level]
+        counts["pairs"] += len(node)
+        # A node's own cell is measured without the node itself
+        own = keys[cell] == code[node] >> (2 * (depth - level))
+        m = mass[cell] - own
+        centre = (sums[cell] - own[:, None] * pos[node]) / np.maximum(m, 1)[:, None]
+        delta = pos[node] - centre
+        d2 = np.maximum((delta * delta).sum(axis=1), floor)
+        side = size / (1 << level)
+        accept = (m == 0) | (~own & (side * side < theta * theta * d2))
+        push = (m / d2)[:, None] * delta
+        push[m == 0] = 0
+        force[:, 0] += np.bincount(node[accept], push[accept, 0], minlength=n)
+        force[:, 1] += np.bincount(node[accept], push[accept, 1], minlength=n)
+        if level == depth:
+            # Leaves too close to lump together: one (node, member) pair per member
+            node, cell = node[~accept], cell[~accept]
+            width = mass[cell]
+            node = np.repeat(node, width)
+            member = order[np.repeat(first[cell] - np.cumsum(width) + width, width)
+                           + np.arange(width.sum())]
+            node, member = node[node != member], member[node != member]
+            counts["pairs"] += len(node)
+            delta = pos[node] - pos[member]
+            push = delta / np.maximum((delta * delta).sum(axis=1), floor)[:, None]
+            force[:, 0] += np.bincount(node, push[:, 0], minlength=n)
+            force[:, 1] += np.bincount(node, push[:, 1], minlength=n)
+            break
+
+        # Open every rejected cell into its children on the next level
+        node, cell = node[~accept], cell[~accept]
+        child_keys = levels[level + 1][0]
+        first = np.searchsorted(child_keys, keys[cell] << 2)
+        last = np.searchsorted(child_keys, (keys[cell] << 2) + 4)
+        width = last - first
+        node = np.repeat(node, width)
+        cell = np.repeat(first - np.cumsum(width) + width, width) + np.arange(width.sum())
+    return force
+
+
+def _repulsion_python(pos, theta, counts):
+    """_repulsion_numpy one node at a time, for when NumPy is missing."""
+    n = len(pos)
+    depth = _depth(n)
+    xs = [x for x, _ in pos]
+    ys = [y for _, y in pos]
+    lo_x, lo_y = min(xs), min(ys)
+    size = max(max(xs) - lo_x, max(ys) - lo_y) or 1.0
+    cells = 1 << depth
+    code = [_spread(min(int((x - lo_x) / size * cells), cells - 1))
+            | (_spread(min(int((y - lo_y) / size * cells), cells - 1)) << 1)
+            for x, y in pos]
+
+    # levels[l]: cell key -> [mass, sum x, sum y]; leaves: leaf key -> its nodes
+    levels = []
+    for level in range(depth + 1):
+        shift = 2 * (depth - level)
+        table = {}
+        for i, (x, y) in enumerate(pos):
+            entry = table.setdefault(code[i] >> shift, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += x
+            entry[2] += y
+        levels.append(table)
+    leaves = {}
+    for i in range(n):
+        leaves.setdefault(code[i], []).append(i)
+
+    floor = (size * 1e-6) ** 2
+    force = []
+    for i, (x, y) in enumerate(pos):
+        fx = fy = 0.0
+        stack = [(0, 0)]
+        while stack:
+            level, key = stack.pop()
+            counts["pairs"] += 1
+            m, sx, sy = levels[level][key]
+            own = code[i] >> (2 * (depth - level)) == key
+            if own:
+                m, sx, sy = m - 1, sx - x, sy - y
+            if m == 0:
+                continue
+            dx, dy = x - sx / m, y - sy / m
+            d2 = max(dx * dx + dy * dy, floor)
+            side = size / (1 << level)
+            if not own and side * side < theta * theta * d2:
+                fx += m * dx / d2
+                fy += m * dy / d2
+                continue
+            if level == depth:
+                for j in leaves[key]:
+                    if j != i:
+                        counts["pairs"] += 1
+                        dx, dy = x - pos[j][0], y - pos[j][1]
+                        d2 = max(dx * dx + dy * dy, floor)
+                        fx += dx / d2
+                        fy += dy / d2
+                continue
+            below = levels[level + 1]
+            for q in range(4):
+                if (key << 2) + q in below:
+                    stack.append((level + 1, (key << 2) + q))
+        force.append((fx, fy))
+    return force
+
+
+###############################################################################
+# Layout
+###############################################################################
+def force_layout(adjacency, seed=None, iterations=300, seconds=None, theta=0.8,
+                 gravity=0.05, aspect=1.0, stop=None, use_numpy=True, counts=None):
+    """
+    Fruchterman–Reingold with ideal edge length 1 in a frame of area n and
+    the given width:height aspect, for at most iterations rounds or seconds
+    of wall time, whichever ends first (stop, a threading.Event, ends it
+    early too). Each round moves every node by its net force, capped by a
+    temperature that cools linearly to zero over the budget, and keeps it
+    inside the frame; gravity pulls towards the centroid so separate
+    components stay close. Returns [(x, y)] normalized for that aspect.
+    """
+    n = len(adjacency)
+    if counts is None:
+        counts = {}
+    counts.update({"iterations": 0, "pairs": 0})
+    if n == 0:
+        return []
+    if n == 1:
+        return [(0.5, 0.5)]
+
+    rng = random.Random(seed)
+    width, height = math.sqrt(n * aspect), math.sqrt(n / aspect)
+    start = [(rng.random() * width, rng.random() * height) for _ in range(n)]
+    edges = edge_pairs(adjacency)
+    numpy = use_numpy and np is not None
+    if numpy:
+        pos = np.array(start)
+        src = np.array([u for u, _ in edges], dtype=np.int64)
+        dst = np.array([v for _, v in edges], dtype=np.int64)
+    else:
+        pos = start
+
+    temperature = max(width, height) / 10
+    began = time.perf_counter()
+    deadline = None if seconds is None else began + seconds
+    for it in range(iterations):
+        if stop is not None and stop.is_set() or deadline is not None and time.perf_counter() > deadline:
+            break
+        counts["iterations"] += 1
+        # Cool by whichever budget is running out faster
+        progress = it / iterations
+        if seconds:
+            progress = max(progress, (time.perf_counter() - began) / seconds)
+        cap = temperature * (1 - min(progress, 1))
+        if numpy:
+            disp = _repulsion_numpy(pos, theta, counts)
+            delta = pos[dst] - pos[src]
+            pull = delta * np.sqrt((delta * delta).sum(axis=1))[:, None]   # d² / k along the edge
+            for axis in (0, 1):
+                disp[:, axis] += np.bincount(src, pull[:, axis], minlength=n)
+                disp[:, axis] -= np.bincount(dst, pull[:, axis], minlength=n)
+            disp -= gravity * (pos - pos.mean(axis=0))
+            length = np.maximum(np.sqrt((disp * disp).sum(axis=1)), 1e-12)
+            pos = pos + disp * (np.minimum(length, cap) / length)[:, None]
+            pos = np.minimum(np.maximum(pos, 0.0), (width, height))
+        else:
+            disp = [list(f) for f in _repulsion_python(pos, theta, counts)]
+            for u, v in edges:
+                dx, dy = pos[v][0] - pos[u][0], pos[v][1] - pos[u][1]
+                d = math.sqrt(dx * dx + dy * dy)
+                disp[u][0] += dx * d
+                disp[u][1] += dy * d
+                disp[v][0] -= dx * d
+                disp[v][1] -= dy * d
+            mx = sum(x for x, _ in pos) / n
+            my = sum(y for _, y in pos) / n
+            moved = []
+            for (x, y), (fx, fy) in zip(pos, disp):
+                fx -= gravity * (x - mx)
+                fy -= gravity * (y - my)
+                length = max(math.sqrt(fx * fx + fy * fy), 1e-12)
+                scale = min(length, cap) / length
+                moved.append((min(max(x + fx * scale, 0.0), width),
+                              min(max(y + fy * scale, 0.0), height)))
+            pos = moved
+
+    if numpy:
+        pos = [tuple(p) for p in pos.tolist()]
+    return normalize(pos, aspect)
+
+
+class BackgroundLayout:
+    """
+    force_layout on a daemon thread. Tk must only be touched from its own
+    thread, so the widget polls for the result with after() and calls
+    on_done(coords) there. cancel() stops the worker at its next round and
+    drops the result.
+    """
+
+    POLL_MS = 50
+
+    def __init__(self, widget, adjacency, on_done, **options):
+        self.widget = widget
+        self.on_done = on_done
+        self.stop = threading.Event()
+        self.result = None
+        self.thread = threading.Thread(target=self._run, args=(adjacency,), kwargs=options, daemon=True)
+        self.thread.start()
+        self.widget.after(self.POLL_MS, self._poll)
+
+    def _run(self, adjacency, **options):
+        self.result = force_layout(adjacency, stop=self.stop, **options)
+
+    def _poll(self):
+        if self.stop.is_set():
+            return
+        if self.thread.is_alive():
+            self.widget.after(self.POLL_MS, self._poll)
+        elif self.result is not None:
+            self.on_done(self.result)
+
+    def running(self):
+        return self.thread.is_alive() and not self.stop.is_set()
+
+    def cancel(self):
+        self.stop.set()
+
+
+def crossings(coords, edges, limit=20000):
+    """Edge crossings among the first limit edges: a rough layout quality number."""
+    def ccw(a, b, c):
+        return (c[1] - a[1]) * (b[0] - a[0]) > (b[1] - a[1]) * (c[0] - a[0])
+    edges = edges[:limit]
+    total = 0
+    for k, (a, b) in enumerate(edges):
+        for c, d in edges[k + 1:]:
+            if len({a, b, c, d}) == 4:
+                p, q, r, s = coords[a], coords[b], coords[c], coords[d]
+                total += ccw(p, r, s) != ccw(q, r, s) and ccw(p, q, r) != ccw(p, q, s)
+    return total
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Time the force-directed layout on a random graph.")
+    parser.add_argument("--n", type=int, default=2000)
+    parser.add_argument("--m", type=int, default=2, help="Barabási–Albert edges per new node")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--iterations", type=int, default=300)
+    parser.add_argument("--seconds", type=float, help="wall-time budget per layout")
+    parser.add_argument("--theta", type=float, default=0.8, help="Barnes–Hut opening angle (0 = exact)")
+    parser.add_argument("--crossings", action="store_true",
+                        help="also count edge crossings against the circle layout (slow on big graphs)")
+    args = parser.parse_args()
+
+    adjacency = graph_generators.barabasi_albert(args.n, args.m, args.seed)
+    edges = edge_pairs(adjacency)
+    print(f"Barabási–Albert n={args.n}, m={args.m}: {len(edges)} edges")
+    runs = {"Pure Python": False}
+    if np is not None:
+        runs["NumPy"] = True
+    for name, numpy in runs.items():
+        counts = {}
+        start = time.perf_counter()
+        coords = force_layout(adjacency, args.seed, args.iterations, args.seconds, args.theta,
+                              use_numpy=numpy, counts=counts)
+        seconds = time.perf_counter() - start
+        per = counts["pairs"] / max(counts["iterations"], 1) / args.n
+        ops = ", ".join(f"{k}={v}" for k, v in counts.items())
+        line = f"{name:<14}{seconds:>7.2f}s  {ops}  ({per:.0f} cells per node per round vs {args.n - 1} exact)"
+        if args.crossings:
+            circle = [(math.cos(2 * math.pi * i / args.n), math.sin(2 * math.pi * i / args.n))
+                      for i in range(args.n)]
+            line += f"  crossings {crossings(coords, edges)} vs circle {crossings(circle, edges)}"
+        print(line)
@@ -0,0 +1,201 @@
+# frontier.py
+"""
+One search loop for breadth-first, depth-first and greedy best-first search.
+The only thing that changes is the frontier the loop takes nodes from:
+
+    FifoFrontier      queue  -> breadth-first order
+    LifoFrontier      stack  -> depth-first order
+    PriorityFrontier  heap   -> smallest key first (greedy best-first)
+
+search_steps() yields one event schema for all three, so expansion counts
+from the same graph can be compared directly. The BFS and DFS tabs run
+their searches through it too (with FIFO and LIFO frontiers).
+
+    python frontier.py --rows 200 --cols 200 --walls 0.2 --seed 1
+"""
+import argparse
+import heapq
+import random
+import time
+from collections import deque
+
+import graph_generators
+from shortest_paths import HEURISTICS, path_to
+
+
+class FifoFrontier:
+    # The loop expands a node's edges one at a time, descending into the first new neighbour
+    DEPTH_FIRST = False
+
+    def __init__(self):
+        self.items = deque()
+        self.counts = {"pushes": 0, "pops": 0}
+
+    def push(self, node, key=None):
+        self.items.append(node)
+        self.counts["pushes"] += 1
+
+    def pop(self):
+        self.counts["pops"] += 1
+        return self.items.popleft()
+
+    def __len__(self):
+        return len(self.items)
+
+
+class LifoFrontier(FifoFrontier):
+    """
+    A node stays on the stack until all of its edges are examined, and the
+    first new neighbour is expanded at once: real depth-first order, with
+    "completed" events in post-order.
+    """
+
+    DEPTH_FIRST = True
+
+    def pop(self):
+        self.counts["pops"] += 1
+        return self.items.pop()
+
+    def peek(self):
+        return self.items[-1]
+
+
+class PriorityFrontier:
+    """Smallest key first; equal keys come out in the order they were pushed."""
+
+    DEPTH_FIRST = False
+
+    def __init__(self):
+        self.heap = []
+        self.order = 0
+        self.counts = {"pushes": 0, "pops": 0}
+
+    def push(self, node, key=0):
+        self.order += 1
+        heapq.heappush(self.heap, (key, self.order, node))
+        self.counts["pushes"] += 1
+
+    def pop(self):
+        self.counts["pops"] += 1
+        return heapq.heappop(self.heap)[2]
+
+    def __len__(self):
+        return len(self.heap)
+
+
+FRONTIERS = {
+    "Priority (greedy best-first)": PriorityFrontier,
+    "FIFO (breadth-first)": FifoFrontier,
+    "LIFO (depth-first)": LifoFrontier,
+}
+
+
+def search_steps(adjacency, start, goal, frontier, parent, counts, key=None, order=None,
+                 seen=None):
+    """
+    Generic graph search over adjacency (u -> [v], examined in list order,
+    or sorted by order(v) when it is given, as each node is expanded) from
+    start (one node or a list of them). key(v) orders a priority
+    frontier. Nodes are marked when first pushed, so each is pushed once;
+    a DEPTH_FIRST frontier descends into each new node as soon as it is
+    pushed, which makes that marking depth-first too. seen holds the marks
+    (anything with "in" and add(), e.g. a bitmap wrapper; a new set if None).
+    Events:
+      ("visit", u)       u expanded (taken off the frontier, or reached the top of the stack)
+      ("edge", u, v)     edge examined
+      ("discover", v)    v seen for the first time and pushed
+      ("seen", u, v)     v had been seen already
+      ("completed", u)   all of u's edges examined
+      ("found", goal)    the goal was expanded (the search stops)
+    counts["expanded"] is the number of "visit" events.
+    """
+    if key is None:
+        key = lambda v: 0
+    starts = [start] if isinstance(start, int) else list(start)
+    if seen is None:
+        seen = set()
+    for s in starts:
+        seen.add(s)
+    # LIFO: push in reverse so the first start is expanded first
+    for s in (reversed(starts) if frontier.DEPTH_FIRST else starts):
+        parent[s] = None
+        frontier.push(s, key(s))
+    counts["frontier"] = frontier.counts
+    remaining = {}      # Node being expanded -> iterator over the edges it has left
+    while frontier:
+        u = frontier.peek() if frontier.DEPTH_FIRST else frontier.pop()
+        if u not in remaining:
+            remaining[u] = iter(adjacency[u] if order is None else sorted(adjacency[u], key=order))
+            counts["expanded"] += 1
+            yield ("visit", u)
+            if u == goal:
+                yield ("found", u)
+                return
+        for v in remaining[u]:
+            yield ("edge", u, v)
+            if v in seen:
+                yield ("seen", u, v)
+                continue
+            seen.add(v)
+            parent[v] = u
+            frontier.push(v, key(v))
+            yield ("discover", v)
+            if frontier.DEPTH_FIRST:
+                break
+        else:
+            if frontier.DEPTH_FIRST:
+                frontier.pop()
+            del remaining[u]
+            yield ("completed", u)
+
+
+def heuristic_key(coords, goal, heuristic):
+    """key(v) = heuristic distance from v to goal, for a PriorityFrontier."""
+    h = HEURISTICS[heuristic]
+    gx, gy = coords[goal]
+    return lambda v: h(abs(coords[v][0] - gx), abs(coords[v][1] - gy))
+
+
+def search(adjacency, start, goal, frontier_name, coords=None, heuristic="Manhattan"):
+    """Run one search to the end; returns (path, counts)."""
+    frontier = FRONTIERS[frontier_name]()
+    key = None
+    if isinstance(frontier, PriorityFrontier):
+        key = heuristic_key(coords, goal, heuristic)
+    parent = {}
+    counts = {"expanded": 0}
+    for _ in search_steps(adjacency, start, goal, frontier, parent, counts, key):
+        pass
+    path = path_to(parent, start, goal) if goal in parent else []
+    return path, counts
+
+
+def walled_grid(rows, cols, walls, seed=None):
+    """4-connected grid with a seeded fraction of cells blocked (corners kept open)."""
+    rng = random.Random(seed)
+    n = rows * cols
+    blocked = {v for v in range(n) if rng.random() < walls} - {0, n - 1}
+    grid = graph_generators.grid_2d(rows, cols)
+    return {u: ([] if u in blocked else [v for v in nbrs if v not in blocked])
+            for u, nbrs in grid.items()}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the frontiers on one walled grid.")
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--cols", type=int, default=200)
+    parser.add_argument("--walls", type=float, default=0.2, help="fraction of blocked cells")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    adjacency = walled_grid(args.rows, args.cols, args.walls, args.seed)
+    coords = graph_generators.grid_coords(args.rows, args.cols)
+    goal = len(adjacency) - 1
+    print(f"{args.rows}x{args.cols} grid, {args.walls:.0%} walls, corner to corner")
+    for name in FRONTIERS:
+        start = time.perf_counter()
+        path, counts = search(adjacency, 0, goal, name, coords)
+        seconds = time.perf_counter() - start
+        result = f"path {len(path) - 1} edges" if path else "goal unreachable"
+        print(f"{name:<30}{seconds:>7.2f}s  expanded={counts['expanded']:<8}"
+              f"pushes={counts['frontier']['pushes']:<8}{result}")
@@ -0,0 +1,194 @@
+# graph_arrays.py
+"""
+Flat array forms of a graph, shared by the algorithms that sweep every edge
+(Bellman-Ford, Kruskal, the headless BFS engines).
+
+The tabs keep graphs as dicts (index -> neighbours); these classes copy them
+once into compact ``array`` columns so a pass over millions of edges does not
+walk Python lists of tuples. ``as_numpy()`` gives the same columns as NumPy
+arrays when NumPy is installed (it is optional: ``graph_arrays.np`` is None
+without it).
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is only needed for the vectorized paths
+    np = None
+
+
+def _weight_array(weights):
+    """Integer weights stay integers ('q'); anything else is stored as float ('d')."""
+    if all(isinstance(w, int) for w in weights):
+        return array("q", weights)
+    return array("d", weights)
+
+
+def _numpy_column(column):
+    """View an array.array as a NumPy array without copying."""
+    kind = "f" if column.typecode == "d" else "i"
+    return np.frombuffer(column, dtype=f"{kind}{column.itemsize}")
+
+
+class EdgeArrays:
+    """
+    Edge list as three parallel columns: edge k is src[k] -> dst[k] with
+    weight[k]. Edges are ordered by source node, then by target.
+    """
+
+    def __init__(self, n, src, dst, weight):
+        self.n = n
+        self.src = src
+        self.dst = dst
+        self.weight = weight
+
+    @classmethod
+    def from_weighted(cls, graph, undirected=False):
+        """
+        graph: index -> list of (neighbour, weight). With undirected=True the
+        graph lists each edge from both ends and only the u < v copy is kept.
+        """
+        src, dst, weight = array("l"), array("l"), []
+        for u in range(len(graph)):
+            for v, w in graph[u]:
+                if undirected and v <= u:
+                    continue
+                src.append(u)
+                dst.append(v)
+                weight.append(w)
+        return cls(len(graph), src, dst, _weight_array(weight))
+
+    def __len__(self):
+        return len(self.src)
+
+    def as_numpy(self):
+        """(src, dst, weight) as NumPy arrays; weights become float64 so inf fits alongside."""
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        return (_numpy_column(self.src).astype(np.int64, copy=False),
+                _numpy_column(self.dst).astype(np.int64, copy=False),
+                _numpy_column(self.weight).astype(np.float64))
+
+
+class CSR:
+    """
+    Compressed sparse rows: the neighbours of u are
+    targets[offsets[u]:offsets[u + 1]] (weights alongside, or None when the
+    graph is unweighted).
+    """
+
+    def __init__(self, n, offsets, targets, weights=None):
+        self.n = n
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+
+    @classmethod
+    def from_adjacency(cls, adjacency):
+        """adjacency: index -> list of neighbour indexes."""
+        offsets, targets = array("l", [0]), array("l")
+        for u in range(len(adjacency)):
+            targets.extend(adjacency[u])
+            offsets.append(len(targets))
+        return cls(len(adjacency), offsets, targets)
+
+    @classmethod
+    def from_weighted(cls, graph):
+        """graph: index -> list of (neighbour, weight)."""
+        offsets, targets, weights = array("l", [0]), array("l"), []
+        for u in range(len(graph)):
+            for v, w in graph[u]:
+                targets.append(v)
+                weights.append(w)
+            offsets.append(len(targets))
+        return cls(len(graph), offsets, targets, _weight_array(weights))
+
+    def __len__(self):
+        return len(self.targets)
+
+    def degree(self, u):
+        return self.offsets[u + 1] - self.offsets[u]
+
+    def neighbours(self, u):
+        return self.targets[self.offsets[u]:self.offsets[u + 1]]
+
+    def reverse(self):
+        """The transposed graph (every edge u -> v becomes v -> u), built by counting sort."""
+        n, offsets, targets = self.n, self.offsets, self.targets
+        counts = array("l", [0]) * (n + 1)
+        for v in targets:
+            counts[v + 1] += 1
+        for u in range(n):
+            counts[u + 1] += counts[u]
+        rev_offsets = array("l", counts)
+        fill = array("l", counts[:n])
+        rev_targets = array("l", [0]) * len(targets)
+        rev_weights = None
+        if self.weights is not None:
+            rev_weights = array(self.weights.typecode, [0]) * len(targets)
+        for u in range(n):
+            for k in range(offsets[u], offsets[u + 1]):
+                v = targets[k]
+                rev_targets[fill[v]] = u
+                if rev_weights is not None:
+                    rev_weights[fill[v]] = self.weights[k]
+                fill[v] += 1
+        return CSR(n, rev_offsets, rev_targets, rev_weights)
+
+
+class BitsetRows:
+    """
+    Dense adjacency as one bitset per row, held in a Python int: bit b of
+    rows[u] is set for the edge u -> nodes[b]. OR-ing or masking whole rows
+    then works a machine word at a time instead of an edge at a time.
+
+    Bits are numbered in the given order of the nodes (default 0..n-1), so
+    reading a row from the lowest bit up lists its neighbours in that order;
+    position[v] is the bit that stands for node v.
+    """
+
+    def __init__(self, n, rows, nodes):
+        self.n = n
+        self.rows = rows
+        self.nodes = nodes
+        self.position = array("l", [0]) * n
+        for b, v in enumerate(nodes):
+            self.position[v] = b
+
+    @classmethod
+    def from_adjacency(cls, adjacency, order=None):
+        """adjacency: index -> iterable of neighbour indexes (sets and lists both do)."""
+        n = len(adjacency)
+        nodes = array("l", order if order is not None else range(n))
+        position = array("l", [0]) * n
+        for b, v in enumerate(nodes):
+            position[v] = b
+        width = (n + 7) // 8
+        rows = []
+        for u in range(n):
+            row = bytearray(width)
+            for v in adjacency[u]:
+                b = position[v]
+                row[b >> 3] |= 1 << (b & 7)
+            rows.append(int.from_bytes(row, "little"))
+        return cls(n, rows, nodes)
+
+    def full(self):
+        """Bitset with every node's bit set."""
+        return (1 << self.n) - 1
+
+    def members(self, bits):
+        """Nodes whose bits are set, lowest bit first."""
+        nodes = self.nodes
+        while bits:
+            low = bits & -bits
+            yield nodes[low.bit_length() - 1]
+            bits ^= low
+
+    def as_numpy(self):
+        """The rows packed into an (n, ceil(n/8)) uint8 matrix, bit order little-endian."""
+        if np is None:
+            raise ImportError("NumPy is not installed")
+        width = (self.n + 7) // 8
+        packed = b"".join(row.to_bytes(width, "little") for row in self.rows)
+        return np.frombuffer(packed, dtype=np.uint8).reshape(self.n, width)
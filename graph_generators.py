@@ -0,0 +1,206 @@
+# graph_generators.py
+"""
+Seeded random graph generators for the graph tabs.
+
+Every generator returns the same adjacency form the traversal tabs use:
+a dict  index -> sorted list of neighbour indexes  (directed edges i -> j).
+Undirected graphs simply store both directions. The same seed always gives
+the same graph, so runs can be reproduced and compared.
+"""
+import math
+import random
+
+
+def _finish(adj_sets):
+    """Turn a list of neighbour sets into the tabs' dict-of-sorted-lists form."""
+    return {i: sorted(nbrs) for i, nbrs in enumerate(adj_sets)}
+
+
+def erdos_renyi(n, p, seed=None, directed=True):
+    """
+    G(n, p): every possible edge is present with probability p.
+
+    Uses geometric skipping (Batagelj & Brandes) so the work is proportional
+    to the number of edges produced, not to the n² candidate pairs.
+    """
+    rng = random.Random(seed)
+    adj = [set() for _ in range(n)]
+    if n < 2 or p <= 0:
+        return _finish(adj)
+    if p >= 1:
+        for v in range(n):
+            adj[v].update(w for w in range(n) if w != v)
+        return _finish(adj)
+
+    # No pair is produced twice and positions are walked in increasing order,
+    # so plain lists come out already sorted.
+    adj = [[] for _ in range(n)]
+    log_q = math.log(1.0 - p)
+
+    if directed:
+        # Walk the n*n grid of (v, w) positions, skipping self loops.
+        v, w = 0, -1
+        while v < n:
+            w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            while w >= n and v < n:
+                w -= n
+                v += 1
+            if v < n and w != v:
+                adj[v].append(w)
+    else:
+        # Walk the strict lower triangle (v > w).
+        v, w = 1, -1
+        while v < n:
+            w += 1 + int(math.log(1.0 - rng.random()) / log_q)
+            while w >= v and v < n:
+                w -= v
+                v += 1
+            if v < n:
+                adj[v].append(w)
+                adj[w].append(v)
+    return {i: nbrs for i, nbrs in enumerate(adj)}
+
+
+def grid_2d(rows, cols, diagonal=False):
+    """Undirected rows x cols grid; node (r, c) has index r*cols + c."""
+    adj = [set() for _ in range(rows * cols)]
+    steps = [(0, 1), (1, 0)]
+    if diagonal:
+        steps += [(1, 1), (1, -1)]
+    for r in range(rows):
+        for c in range(cols):
+            i = r * cols + c
+            for dr, dc in steps:
+                rr, cc = r + dr, c + dc
+                if 0 <= rr < rows and 0 <= cc < cols:
+                    j = rr * cols + cc
+                    adj[i].add(j)
+                    adj[j].add(i)
+    return _finish(adj)
+
+
+def random_tree(n, seed=None, directed=True):
+    """
+    Random recursive tree rooted at 0: node i attaches to a uniformly chosen
+    earlier node. Directed trees point from parent to child.
+    """
+    rng = random.Random(seed)
+    adj = [set() for _ in range(n)]
+    for i in range(1, n):
+        parent = rng.randrange(i)
+        adj[parent].add(i)
+        if not directed:
+            adj[i].add(parent)
+    return _finish(adj)
+
+
+def barabasi_albert(n, m, seed=None):
+    """
+    Undirected scale-free graph by preferential attachment: each new node
+    links to m distinct existing nodes picked proportionally to their degree.
+    """
+    rng = random.Random(seed)
+    m = max(1, min(m, n - 1)) if n > 1 else 0
+    adj = [set() for _ in range(n)]
+    if m == 0:
+        return _finish(adj)
+
+    # Every edge endpoint goes into this list, so a uniform pick from it
+    # is a degree-proportional pick of a node.
+    endpoints = []
+    targets = list(range(m))
+    for source in range(m, n):
+        for t in targets:
+            adj[source].add(t)
+            adj[t].add(source)
+            endpoints.append(t)
+        endpoints.extend([source] * m)
+
+        chosen = set()
+        while len(chosen) < m:
+            chosen.add(endpoints[rng.randrange(len(endpoints))])
+        targets = list(chosen)
+    return _finish(adj)
+
+
+def random_dag(n, p, seed=None, shuffle=True):
+    """
+    Random DAG: each pair i < j gets the edge i -> j with probability p
+    (geometric skipping over the upper triangle). With shuffle=True the node
+    indexes are permuted so index order is not already a topological order.
+    """
+    rng = random.Random(seed)
+    order = list(range(n))
+    if shuffle:
+        rng.shuffle(order)
+    adj = [set() for _ in range(n)]
+    if n < 2 or p <= 0:
+        return _finish(adj)
+
+    p = min(p, 1.0)
+    log_q = math.log(1.0 - p) if p < 1 else None
+    v, w = 1, -1
+    while v < n:
+        w += 1 if log_q is None else 1 + int(math.log(1.0 - rng.random()) / log_q)
+        while w >= v and v < n:
+            w -= v
+            v += 1
+        if v < n:
+            adj[order[w]].add(order[v])
+    return _finish(adj)
+
+
+def random_weights(adjacency, seed=None, low=1, high=9, symmetric=True):
+    """
+    Integer weights in low..high for every edge: dict (i, j) -> weight.
+    With symmetric=True the edges i -> j and j -> i share one weight, which is
+    what road-style (undirected) grids want.
+    """
+    rng = random.Random(seed)
+    weights = {}
+    for i, nbrs in adjacency.items():
+        for j in nbrs:
+            if symmetric and (j, i) in weights:
+                weights[(i, j)] = weights[(j, i)]
+            else:
+                weights[(i, j)] = rng.randint(low, high)
+    return weights
+
+
+def grid_shape(n):
+    """The rows x cols rectangle the grid generator uses for roughly n nodes."""
+    cols = max(1, math.ceil(math.sqrt(n)))
+    rows = max(1, n // cols)
+    return rows, cols
+
+
+def grid_coords(rows, cols):
+    """(x, y) = (column, row) of each grid node, in index order."""
+    return [(c, r) for r in range(rows) for c in range(cols)]
+
+
+###############################################################################
+# Picker used by the graph tabs: name -> builder(n, seed)
+###############################################################################
+def _grid_for(n, seed):
+    return grid_2d(*grid_shape(n))
+
+
+GENERATORS = {
+    "Erdős–Rényi G(n,p)": lambda n, seed: erdos_renyi(n, min(1.0, 3.0 / max(1, n - 1)), seed),
+    "2-D grid": _grid_for,
+    "Random tree": lambda n, seed: random_tree(n, seed),
+    "Barabási–Albert": lambda n, seed: barabasi_albert(n, 2, seed),
+    "Random DAG": lambda n, seed: random_dag(n, min(1.0, 3.0 / max(1, n - 1)), seed),
+}
+
+
+# Generators whose nodes have a natural position: name -> coords(n)
+COORDINATES = {
+    "2-D grid": lambda n: grid_coords(*grid_shape(n)),
+}
+
+
+def generate(name, n, seed=None):
+    """Build the named graph with roughly n nodes (the grid rounds to a rectangle)."""
+    return GENERATORS[name](n, seed)
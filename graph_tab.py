@@ -0,0 +1,694 @@
+# graph_tab.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+import math
+import time
+from edge_editor import SparseEdgeEditor
+from layout_cache import LayoutSlot
+import graph_generators
+
+
+class GraphTab(ttk.Frame):
+    """
+    Shared layout for the graph algorithm tabs (Dijkstra, Prim, Topological
+    Sort, ...).
+
+    Same arrangement as the BFS/DFS tabs: the sparse edge editor on the left
+    and the controls plus a white canvas on the right. WeightedGraphTab (at
+    the bottom) gives every edge a number. A subclass supplies:
+      TITLE                      heading text
+      build_options(frame)       extra controls (queue engine, heuristic, ...)
+      make_steps(start, goal)    generator of events for the animation
+      handle_event(event)        draw one event (call super() for the common ones)
+      on_complete()              final drawing once the generator is exhausted
+      stats_text()               one line of counters for the stats label
+    Common events: ("visit", u), ("edge", u, v), ("completed", u).
+    The graph is read into self.graph (u -> [(v, weight)], weight 1 when
+    unweighted) and self.adjacency_indexed (u -> [v]).
+
+    Graphs bigger than MAX_DRAWN_NODES are not drawn; the generator is run to
+    the end and only the counters are shown. From FORCE_LAYOUT_MIN_NODES up,
+    a graph without coordinates is drawn on a circle first and moved to a
+    force-directed layout (force_layout) once a worker thread has one; layouts
+    are cached per graph and box shape (layout_cache).
+    """
+
+    TITLE = "Graph"
+    WEIGHTED = False
+    DIRECTED = True          # False: every edge is shown and used both ways
+    USES_START = True        # False: no "Starting Index" entry (the algorithm has no start)
+    USES_GOAL = False        # Show a "Goal Index" entry next to the start
+    NEGATIVE_WEIGHTS = False # Show a "Min weight" entry so random graphs can get negative edges
+    MAX_DRAWN_NODES = 400
+    WEIGHT_LABEL_NODES = 60  # Draw edge weights only on small graphs
+    FORCE_LAYOUT_MIN_NODES = 30
+    FORCE_LAYOUT_SECONDS = 5.0
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        #######################################################################
+        # Style / Dark background for frames/labels, white canvas
+        #######################################################################
+        style = ttk.Style()
+        style.configure("Dark.TFrame", background="#424242")
+        style.configure("Dark.TLabel", background="#424242", foreground="white")
+        style.configure("Dark.TButton", background="#424242", foreground="white")
+        style.configure("Dark.TCheckbutton", background="#424242")
+        style.configure("Dark.TRadiobutton", background="#424242", foreground="white")
+
+        self.configure(style="Dark.TFrame")
+
+        #######################################################################
+        # Heading
+        #######################################################################
+        self.heading = tk.Label(
+            self, text=self.TITLE, font=("Arial", 24, "bold"),
+            bg="#424242", fg="white"
+        )
+        self.heading.pack(pady=10, fill="x")
+
+        #######################################################################
+        # Main container: left (inputs), right (animation)
+        #######################################################################
+        self.main_frame = ttk.Frame(self, style="Dark.TFrame")
+        self.main_frame.pack(expand=True, fill="both")
+
+        self.main_frame.columnconfigure(0, weight=3)  # ~30%
+        self.main_frame.columnconfigure(1, weight=7)  # ~70%
+        self.main_frame.rowconfigure(0, weight=1)
+
+        self.left_frame = ttk.Frame(self.main_frame, style="Dark.TFrame")
+        self.left_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+        self.right_frame = ttk.Frame(self.main_frame, style="Dark.TFrame")
+        self.right_frame.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
+
+        #######################################################################
+        # Data structures
+        #######################################################################
+        self.num_nodes = 0
+        self.node_labels = []
+        self.node_coords = None           # [(x, y)] from a coordinate generator, else None
+        self.layout = LayoutSlot(self, self._layout_ready,
+                                 self.FORCE_LAYOUT_MIN_NODES, self.FORCE_LAYOUT_SECONDS)
+
+        self.adj_type_var = tk.StringVar(value="matrix")
+        self.edge_editor = None           # SparseEdgeEditor(weighted=WEIGHTED)
+        self.graph = {}                   # int -> list of (int, weight)
+        self.adjacency_indexed = {}       # int -> list(int)
+
+        # Animation
+        self.current_delay = 1000
+        self.paused = False
+        self.step_generator = None
+
+        # Graph drawing
+        self.node_positions = {}    # index -> (x,y)
+        self.node_circles = {}      # index -> (circle_id, text_id)
+        self.node_notes = {}        # index -> text_id drawn above the node
+        self.node_radius = 20
+        self.node_halo = None
+        self.halo_node = None
+        self.edge_lines = {}        # (i, j) -> line_id
+        self.edge_colors = {}       # (i, j) -> color the edge returns to after a highlight
+        self.weight_labels = {}     # (i, j) -> text_id of the drawn weight
+        self.last_edge_highlight = None
+
+        self._build_left_inputs()
+        self._build_right_area()
+
+    ###########################################################################
+    # LEFT: weighted adjacency input
+    ###########################################################################
+    def _build_left_inputs(self):
+        input_top = ttk.Frame(self.left_frame, style="Dark.TFrame")
+        input_top.pack(anchor="nw", fill="x", pady=5)
+
+        ttk.Label(input_top, text="Number of nodes:", style="Dark.TLabel")\
+            .grid(row=0, column=0, padx=5, pady=5, sticky="e")
+        self.num_nodes_entry = ttk.Entry(input_top, width=8)
+        self.num_nodes_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Radiobutton(
+            input_top, text="Adjacency Matrix", variable=self.adj_type_var,
+            value="matrix", command=self.switch_adjacency_mode,
+            style="Dark.TRadiobutton"
+        ).grid(row=1, column=0, columnspan=2, sticky="w", padx=5)
+
+        ttk.Radiobutton(
+            input_top, text="Adjacency List (label:weight)" if self.WEIGHTED else "Adjacency List",
+            variable=self.adj_type_var,
+            value="list", command=self.switch_adjacency_mode,
+            style="Dark.TRadiobutton"
+        ).grid(row=2, column=0, columnspan=2, sticky="w", padx=5)
+
+        ttk.Button(input_top, text="Generate Fields", command=self.generate_adjacency_fields,
+                   style="Dark.TButton").grid(row=3, column=0, columnspan=2, padx=5, pady=5)
+
+        # Seeded random graphs (with random integer weights when weighted)
+        ttk.Label(input_top, text="Random graph:", style="Dark.TLabel")\
+            .grid(row=4, column=0, padx=5, pady=5, sticky="e")
+        self.generator_var = tk.StringVar(value=next(iter(graph_generators.GENERATORS)))
+        ttk.Combobox(input_top, textvariable=self.generator_var, state="readonly", width=18,
+                     values=list(graph_generators.GENERATORS))\
+            .grid(row=4, column=1, padx=5, pady=5)
+
+        ttk.Label(input_top, text="Seed:", style="Dark.TLabel")\
+            .grid(row=5, column=0, padx=5, pady=5, sticky="e")
+        self.seed_entry = ttk.Entry(input_top, width=8)
+        self.seed_entry.grid(row=5, column=1, padx=5, pady=5, sticky="w")
+        self.seed_entry.insert(0, "1")
+
+        self.max_weight_entry = None
+        if self.WEIGHTED:
+            ttk.Label(input_top, text="Max weight:", style="Dark.TLabel")\
+                .grid(row=6, column=0, padx=5, pady=5, sticky="e")
+            self.max_weight_entry = ttk.Entry(input_top, width=8)
+            self.max_weight_entry.grid(row=6, column=1, padx=5, pady=5, sticky="w")
+            self.max_weight_entry.insert(0, "9")
+
+        self.min_weight_entry = None
+        if self.WEIGHTED and self.NEGATIVE_WEIGHTS:
+            ttk.Label(input_top, text="Min weight:", style="Dark.TLabel")\
+                .grid(row=7, column=0, padx=5, pady=5, sticky="e")
+            self.min_weight_entry = ttk.Entry(input_top, width=8)
+            self.min_weight_entry.grid(row=7, column=1, padx=5, pady=5, sticky="w")
+            self.min_weight_entry.insert(0, "-2")
+
+        ttk.Button(input_top, text="Generate Random Graph", command=self.generate_random_graph,
+                   style="Dark.TButton").grid(row=8, column=0, columnspan=2, padx=5, pady=5)
+
+        self.adjacency_frame = ttk.Frame(self.left_frame, style="Dark.TFrame")
+        self.adjacency_frame.pack(anchor="nw", fill="both", expand=True, pady=5)
+
+    def clear_adjacency_fields(self):
+        for child in self.adjacency_frame.winfo_children():
+            child.destroy()
+        self.edge_editor = None
+
+    def switch_adjacency_mode(self):
+        if self.edge_editor is not None:
+            self.edge_editor.set_mode(self.adj_type_var.get())
+
+    def generate_adjacency_fields(self):
+        self.clear_adjacency_fields()
+        self.node_coords = None
+
+        try:
+            self.num_nodes = int(self.num_nodes_entry.get())
+        except ValueError:
+            self.num_nodes = 0
+        if self.num_nodes < 1:
+            return
+
+        self.build_edge_editor()
+        self.edge_editor.reset(self.num_nodes, self.adj_type_var.get())
+        self.node_labels = self.edge_editor.labels()
+
+    def generate_random_graph(self):
+        """Load a seeded random graph; weighted tabs get seeded weights (1 or min weight)..max weight."""
+        try:
+            n = int(self.num_nodes_entry.get())
+        except ValueError:
+            n = 0
+        if n < 1:
+            return
+
+        seed = self.seed()
+        name = self.generator_var.get()
+        adjacency = graph_generators.generate(name, n, seed)
+        weights = None
+        if self.WEIGHTED:
+            try:
+                max_weight = max(1, int(self.max_weight_entry.get()))
+            except ValueError:
+                max_weight = 9
+            min_weight = 1
+            if self.min_weight_entry is not None:
+                try:
+                    min_weight = min(max_weight, int(self.min_weight_entry.get()))
+                except ValueError:
+                    pass
+            weights = graph_generators.random_weights(adjacency, seed, min_weight, max_weight)
+
+        self.clear_adjacency_fields()
+        self.num_nodes = len(adjacency)
+        self.num_nodes_entry.delete(0, tk.END)   # The grid rounds n to a rectangle
+        self.num_nodes_entry.insert(0, str(self.num_nodes))
+        coords = graph_generators.COORDINATES.get(name)
+        self.node_coords = coords(n) if coords else None
+        self.build_edge_editor()
+        self.edge_editor.set_graph(adjacency, weights=weights)
+        self.node_labels = self.edge_editor.labels()
+
+    def seed(self):
+        text = self.seed_entry.get().strip()
+        try:
+            return int(text)
+        except ValueError:
+            return text  # Any string is a valid (reproducible) seed too
+
+    def build_edge_editor(self):
+        heading = "Node labels and weighted edges" if self.WEIGHTED else "Node labels and edges"
+        tk.Label(self.adjacency_frame, text=f"{heading} (row -> column)",
+                 font=("Arial", 10, "bold"), bg="#424242", fg="white").pack(anchor="w", pady=5)
+
+        self.edge_editor = SparseEdgeEditor(self.adjacency_frame, mode=self.adj_type_var.get(),
+                                            weighted=self.WEIGHTED)
+        self.edge_editor.pack(anchor="nw", fill="both", expand=True)
+        self.edge_editor.add_listener(self._on_graph_edit)
+
+    def _on_graph_edit(self, change):
+        """A new graph needs a new layout; single edge edits keep the current one."""
+        if change[0] == "graph":
+            self.layout.reset()
+
+    def build_indexed_adjacency(self):
+        """Read the editor into self.graph; False (after a message) on a bad label."""
+        if self.edge_editor is None:
+            self.node_labels = []
+            self.graph = {}
+            self.adjacency_indexed = {}
+            return True
+
+        self.node_labels = self.edge_editor.labels()
+        self.graph = self.edge_editor.weighted_adjacency()
+
+        for r in sorted(self.edge_editor.unresolved):
+            typed = self.edge_editor.unresolved[r][0]
+            messagebox.showerror(
+                "Invalid Label",
+                f"Node {r} typed '{typed}' but no node has that label."
+            )
+            return False
+
+        if not self.DIRECTED:
+            # Use every edge both ways; a pair entered twice keeps the lighter weight
+            best = {}
+            for i, nbrs in self.graph.items():
+                for j, w in nbrs:
+                    if i == j:
+                        continue
+                    key = (min(i, j), max(i, j))
+                    if key not in best or w < best[key]:
+                        best[key] = w
+            self.graph = {i: [] for i in range(self.num_nodes)}
+            for (i, j), w in sorted(best.items()):
+                self.graph[i].append((j, w))
+                self.graph[j].append((i, w))
+        self.adjacency_indexed = {i: [j for j, _ in nbrs] for i, nbrs in self.graph.items()}
+        return True
+
+    ###########################################################################
+    # RIGHT: controls + White Canvas
+    ###########################################################################
+    def _build_right_area(self):
+        self.right_frame.columnconfigure(0, weight=1)
+
+        # row0: start (and goal) + Start
+        top_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
+        top_frame.grid(row=0, column=0, sticky="w", pady=5)
+
+        self.start_index_entry = None
+        if self.USES_START:
+            ttk.Label(top_frame, text="Starting Index:", style="Dark.TLabel").pack(side="left")
+            self.start_index_entry = ttk.Entry(top_frame, width=5)
+            self.start_index_entry.pack(side="left", padx=5)
+            self.start_index_entry.insert(0, "0")
+
+        self.goal_index_entry = None
+        if self.USES_GOAL:
+            ttk.Label(top_frame, text="Goal Index:", style="Dark.TLabel").pack(side="left", padx=(10, 0))
+            self.goal_index_entry = ttk.Entry(top_frame, width=5)
+            self.goal_index_entry.pack(side="left", padx=5)
+
+        ttk.Button(top_frame, text="Start", command=self.start_search, style="Dark.TButton")\
+            .pack(side="left", padx=5)
+
+        # row1: algorithm-specific controls
+        self.options_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
+        self.options_frame.grid(row=1, column=0, sticky="w", pady=5)
+        self.build_options(self.options_frame)
+
+        # row2: speed & pause
+        control_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
+        control_frame.grid(row=2, column=0, sticky="w", pady=5)
+
+        ttk.Button(control_frame, text="Slow", command=lambda: self.set_speed(2000), style="Dark.TButton")\
+            .pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Medium", command=lambda: self.set_speed(1000), style="Dark.TButton")\
+            .pack(side='left', padx=5)
+        ttk.Button(control_frame, text="Fast", command=lambda: self.set_speed(300), style="Dark.TButton")\
+            .pack(side='left', padx=5)
+
+        self.pause_play_button = ttk.Button(control_frame, text="Pause", command=self.toggle_pause,
+                                            style="Dark.TButton")
+        self.pause_play_button.pack(side='left', padx=5)
+
+        # row3: latest step + counters
+        self.step_var = tk.StringVar(value="")
+        ttk.Label(self.right_frame, textvariable=self.step_var, style="Dark.TLabel")\
+            .grid(row=3, column=0, sticky="w", padx=5)
+        self.stats_var = tk.StringVar(value="")
+        ttk.Label(self.right_frame, textvariable=self.stats_var, style="Dark.TLabel")\
+            .grid(row=4, column=0, sticky="w", padx=5)
+
+        # row5: White canvas
+        self.canvas = tk.Canvas(self.right_frame, bg="white", width=700, height=500, highlightthickness=0)
+        self.canvas.grid(row=5, column=0, sticky="nsew", padx=5, pady=5)
+        self.canvas.bind("<Configure>", self._on_canvas_resize)
+        self.right_frame.rowconfigure(5, weight=1)
+
+    def set_speed(self, delay):
+        self.current_delay = delay
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self.pause_play_button.config(text="Play" if self.paused else "Pause")
+        if not self.paused:
+            self.visualize_step()
+
+    ###########################################################################
+    # Subclass hooks
+    ###########################################################################
+    def build_options(self, frame):
+        pass
+
+    def make_steps(self, start, goal):
+        raise NotImplementedError
+
+    def stats_text(self):
+        return ""
+
+    def on_complete(self):
+        pass
+
+    ###########################################################################
+    # Start
+    ###########################################################################
+    def _read_index(self, entry, name, default):
+        """Node index typed in entry; a bad value falls back to default with a warning."""
+        try:
+            idx = int(entry.get())
+            if 0 <= idx < self.num_nodes:
+                return idx
+            messagebox.showwarning(f"Invalid {name} Index",
+                                   f"{name} index must be between 0 and {self.num_nodes-1}. "
+                                   f"Using {default} instead.")
+        except ValueError:
+            messagebox.showwarning(f"Invalid {name} Index",
+                                   f"{name} index must be a number. Using {default} instead.")
+        entry.delete(0, tk.END)
+        entry.insert(0, str(default))
+        return default
+
+    def start_search(self):
+        self.step_generator = None
+        self.canvas.delete("all")
+        self.node_positions.clear()
+        self.node_circles.clear()
+        self.node_notes.clear()
+        self.node_halo = None
+        self.halo_node = None
+        self.edge_lines.clear()
+        self.edge_colors.clear()
+        self.weight_labels.clear()
+        self.last_edge_highlight = None
+        self.step_var.set("")
+        self.stats_var.set("")
+
+        if not self.build_indexed_adjacency():
+            return
+        if self.num_nodes < 1:
+            return
+
+        start = 0
+        if self.start_index_entry is not None:
+            start = self._read_index(self.start_index_entry, "Start", 0)
+        goal = None
+        if self.goal_index_entry is not None:
+            goal = self._read_index(self.goal_index_entry, "Goal", self.num_nodes - 1)
+
+        steps = self.make_steps(start, goal)
+        if steps is None:
+            return
+
+        if self.num_nodes > self.MAX_DRAWN_NODES:
+            # Too many nodes to draw: just run it and report the counters
+            began = time.perf_counter()
+            for _ in steps:
+                pass
+            seconds = time.perf_counter() - began
+            self.on_complete()
+            self.canvas.create_text(
+                10, 10, anchor="nw", font=("Arial", 12), fill="black",
+                text=f"{self.num_nodes} nodes is too many to draw; "
+                     f"ran without animation in {seconds:.2f} s."
+            )
+            self.stats_var.set(self.stats_text())
+            return
+
+        self.draw_graph_initial()
+        self.step_generator = steps
+        self.after(self.current_delay, self.visualize_step)
+
+    def visualize_step(self):
+        if self.paused or not self.step_generator:
+            return
+        try:
+            event = next(self.step_generator)
+            self.handle_event(event)
+            self.stats_var.set(self.stats_text())
+        except StopIteration:
+            self.step_generator = None
+            self._halo_node(None)
+            self._highlight_edge(None, None)
+            self.on_complete()
+            self.stats_var.set(self.stats_text())
+            return
+
+        self.after(self.current_delay, self.visualize_step)
+
+    def handle_event(self, event):
+        if event[0] == "visit":
+            _, idx = event
+            self._color_node(idx, "lightgreen")
+            self._halo_node(None)
+            self._log_step(f"Visit node {self.node_labels[idx]}.")
+        elif event[0] == "edge":
+            _, i, j = event
+            self._color_node(i, "red")
+            self._highlight_edge(i, j, "red")
+            self._halo_node(j)
+            self._log_step(f"Check edge {self.node_labels[i]} → {self.node_labels[j]}.")
+        elif event[0] == "completed":
+            _, idx = event
+            self._color_node(idx, "darkgreen")
+
+    ###########################################################################
+    # Drawing: White Canvas
+    ###########################################################################
+    def layout_coords(self):
+        """(x, y) per node to draw at (any scale), or None for a circle."""
+        if self.node_coords is not None and len(self.node_coords) == self.num_nodes:
+            return self.node_coords
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+        found = self.layout.coords(w - 80, h - 80)
+        if found is not None:
+            # Back to the layout's own frame, where neighbours sit about one unit apart
+            coords, aspect = found
+            width, height = math.sqrt(self.num_nodes * aspect), math.sqrt(self.num_nodes / aspect)
+            return [(x * width, y * height) for x, y in coords]
+        return None
+
+    def _node_placement(self):
+        """(index -> canvas position, node radius): layout_coords() scaled to the canvas, else a circle."""
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+        n = self.num_nodes
+        margin = 40
+        positions = {}
+
+        coords = self.layout_coords()
+        if coords is not None:
+            xs = [x for x, _ in coords]
+            ys = [y for _, y in coords]
+            span_x = (max(xs) - min(xs)) or 1
+            span_y = (max(ys) - min(ys)) or 1
+            scale = min((w - 2*margin) / span_x, (h - 2*margin) / span_y)
+            for i, (x, y) in enumerate(coords):
+                positions[i] = (margin + (x - min(xs)) * scale,
+                                margin + (y - min(ys)) * scale)
+            spacing = scale
+        else:
+            cx, cy = w // 2, h // 2
+            radius = min(w, h) // 2 - margin
+            if n == 1:
+                positions[0] = (cx, cy)
+            for i in range(n if n > 1 else 0):
+                angle = i * 2*math.pi / n
+                positions[i] = (cx + radius * math.cos(angle),
+                                cy + radius * math.sin(angle))
+            spacing = 2*math.pi*radius / max(n, 1)
+        return positions, max(4, min(20, int(spacing * 0.35)))
+
+    def _layout_ready(self):
+        """A layout for this graph just arrived: move whatever is drawn onto it."""
+        if self.num_nodes and len(self.node_circles) == self.num_nodes:
+            self._move_nodes(*self._node_placement())
+
+    def _on_canvas_resize(self, event):
+        """Rescale the drawn graph to the new canvas size."""
+        if self.num_nodes and len(self.node_circles) == self.num_nodes:
+            self._move_nodes(*self._node_placement())
+
+    def _move_nodes(self, positions, r):
+        """Move the drawn nodes, their notes, edges and weights without losing any colors."""
+        self.node_positions = positions
+        self.node_radius = r
+        for i, (x, y) in positions.items():
+            c_id, t_id = self.node_circles[i]
+            self.canvas.coords(c_id, x-r, y-r, x+r, y+r)
+            self.canvas.coords(t_id, x, y)
+            self.canvas.itemconfig(t_id, text=self.node_labels[i] if r >= 10 else "")
+            if i in self.node_notes:
+                self.canvas.coords(self.node_notes[i], x, y - r - 8)
+        for (i, j), line_id in self.edge_lines.items():
+            points, mid = self._edge_points(i, j)
+            self.canvas.coords(line_id, *points)
+            if (i, j) in self.weight_labels:
+                self.canvas.coords(self.weight_labels[(i, j)], *mid)
+        if self.halo_node is not None:
+            self._halo_node(self.halo_node)
+
+    def draw_graph_initial(self):
+        """Place the nodes (coordinates if the generator has them, else a circle) and draw."""
+        n = self.num_nodes
+        self.layout.set_graph(self.adjacency_indexed)
+        self.node_positions, self.node_radius = self._node_placement()
+
+        # Edges (one line per pair when undirected)
+        show_weights = self.WEIGHTED and n <= self.WEIGHT_LABEL_NODES
+        for i in range(n):
+            for j, weight in self.graph[i]:
+                if not self.DIRECTED and (j, i) in self.edge_lines:
+                    self.edge_lines[(i, j)] = self.edge_lines[(j, i)]
+                    continue
+                line_id, mid = self._draw_edge(i, j)
+                self.edge_lines[(i, j)] = line_id
+                self.edge_colors[(i, j)] = "black"
+                if show_weights:
+                    self.weight_labels[(i, j)] = self.canvas.create_text(
+                        mid[0], mid[1], text=str(weight), fill="blue",
+                        font=("Arial", 9, "bold"), tags="weights")
+
+        # Nodes (gray)
+        r = self.node_radius
+        for i, (x, y) in self.node_positions.items():
+            c_id = self.canvas.create_oval(x-r, y-r, x+r, y+r, fill="gray", outline="black", width=2)
+            label = self.node_labels[i] if i < len(self.node_labels) else str(i)
+            t_id = self.canvas.create_text(x, y, text=label if r >= 10 else "",
+                                           font=("Arial", 10, "bold"))
+            self.node_circles[i] = (c_id, t_id)
+        self.canvas.tag_raise("weights")
+
+    def _draw_edge(self, i, j):
+        """Draw i->j (shifted aside if j->i exists too); return (line_id, label position)."""
+        points, mid = self._edge_points(i, j)
+        line_id = self.canvas.create_line(
+            *points, fill="black", width=2,
+            arrow=tk.LAST if self.DIRECTED else None
+        )
+        return line_id, mid
+
+    def _edge_points(self, i, j):
+        """((x1, y1, x2, y2), label position) of the line for i->j between the node rims."""
+        x1, y1 = self.node_positions[i]
+        x2, y2 = self.node_positions[j]
+        dx, dy = x2 - x1, y2 - y1
+        length = math.sqrt(dx*dx + dy*dy)
+        r = self.node_radius
+        if length > 0:
+            udx, udy = dx/length, dy/length
+            x1, y1 = x1 + udx*r, y1 + udy*r
+            x2, y2 = x2 - udx*r, y2 - udy*r
+            if self.DIRECTED and any(k == i for k, _ in self.graph[j]):
+                # Both directions exist: keep the two arrows apart
+                off = 5
+                x1, y1, x2, y2 = x1 - udy*off, y1 + udx*off, x2 - udy*off, y2 + udx*off
+        mid = ((x1 + x2) / 2, (y1 + y2) / 2)
+        return (x1, y1, x2, y2), mid
+
+    ###########################################################################
+    # Coloring / Highlighting
+    ###########################################################################
+    def _color_node(self, idx, color):
+        if idx in self.node_circles:
+            c_id, _ = self.node_circles[idx]
+            self.canvas.itemconfig(c_id, fill=color)
+
+    def _halo_node(self, idx):
+        if self.node_halo is not None:
+            self.canvas.delete(self.node_halo)
+            self.node_halo = None
+            self.halo_node = None
+
+        if idx is None or idx not in self.node_positions:
+            return
+        self.halo_node = idx
+        x, y = self.node_positions[idx]
+        radius = self.node_radius + 6
+        self.node_halo = self.canvas.create_oval(
+            x - radius, y - radius, x + radius, y + radius,
+            outline="red", width=3, dash=(4, 2)
+        )
+
+    def _highlight_edge(self, i, j, color="red"):
+        """Highlight i->j for one step; the previous highlight goes back to its own color."""
+        if self.last_edge_highlight is not None:
+            old = self.last_edge_highlight
+            if old in self.edge_lines:
+                self.canvas.itemconfig(self.edge_lines[old], fill=self._edge_color(old), width=2)
+            self.last_edge_highlight = None
+
+        if (i, j) in self.edge_lines:
+            line_id = self.edge_lines[(i, j)]
+            self.canvas.itemconfig(line_id, fill=color, width=3)
+            self.canvas.tag_raise(line_id)
+            self.last_edge_highlight = (i, j)
+
+    def _edge_color(self, edge):
+        i, j = edge
+        return self.edge_colors.get((i, j)) or self.edge_colors.get((j, i), "black")
+
+    def _set_edge_color(self, i, j, color, width=2):
+        """Recolor i->j for good (e.g. tree edges), surviving later highlights."""
+        self.edge_colors[(i, j)] = color
+        if not self.DIRECTED:
+            self.edge_colors[(j, i)] = color
+        if (i, j) in self.edge_lines:
+            self.canvas.itemconfig(self.edge_lines[(i, j)], fill=color, width=width)
+
+    def _set_node_note(self, idx, text, color="purple"):
+        """Small text just above a node (its distance, key, ...)."""
+        if idx not in self.node_positions:
+            return
+        if idx in self.node_notes:
+            self.canvas.itemconfig(self.node_notes[idx], text=text, fill=color)
+            return
+        x, y = self.node_positions[idx]
+        self.node_notes[idx] = self.canvas.create_text(
+            x, y - self.node_radius - 8, text=text, fill=color, font=("Arial", 9, "bold")
+        )
+
+    def _log_step(self, msg):
+        self.step_var.set(msg)
+
+
+class WeightedGraphTab(GraphTab):
+    """GraphTab whose edges carry weights ("label:weight" in list mode)."""
+
+    TITLE = "Weighted Graph"
+    WEIGHTED = True
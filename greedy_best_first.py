@@ -0,0 +1,100 @@
+# greedy_best_first.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+from graph_tab import GraphTab
+import frontier
+import shortest_paths
+
+
+class GreedyBestFirstTab(GraphTab):
+    """
+    Greedy best-first search: always expand the frontier node that looks
+    closest to the goal by the heuristic alone (path cost is ignored). The
+    frontier can be switched to FIFO or LIFO, which turns the same loop into
+    breadth-first or depth-first search, so their expansion counts on one
+    graph can be compared. Heuristics need a "2-D grid" random graph.
+    """
+
+    TITLE = "Greedy Best First Search"
+    USES_GOAL = True
+
+    def build_options(self, frame):
+        ttk.Label(frame, text="Frontier:", style="Dark.TLabel").pack(side="left")
+        self.frontier_var = tk.StringVar(value=next(iter(frontier.FRONTIERS)))
+        ttk.Combobox(frame, textvariable=self.frontier_var, state="readonly", width=26,
+                     values=list(frontier.FRONTIERS)).pack(side="left", padx=5)
+
+        ttk.Label(frame, text="Heuristic:", style="Dark.TLabel").pack(side="left", padx=(10, 0))
+        heuristics = [h for h in shortest_paths.HEURISTICS if h != "Zero (Dijkstra)"]
+        self.heuristic_var = tk.StringVar(value=heuristics[0])
+        ttk.Combobox(frame, textvariable=self.heuristic_var, state="readonly", width=12,
+                     values=heuristics).pack(side="left", padx=5)
+        self.counts = None
+        self.parent = {}
+        self.start = self.goal = None
+
+    def make_steps(self, start, goal):
+        queue = frontier.FRONTIERS[self.frontier_var.get()]()
+        key = None
+        if isinstance(queue, frontier.PriorityFrontier):
+            coords = self.node_coords
+            if coords is None or len(coords) != self.num_nodes:
+                messagebox.showerror("No Coordinates",
+                                     "The heuristic needs node positions: generate a '2-D grid' "
+                                     "random graph, or pick a FIFO/LIFO frontier.")
+                return None
+            key = frontier.heuristic_key(coords, goal, self.heuristic_var.get())
+
+        self.start, self.goal = start, goal
+        self.parent = {}
+        self.counts = {"expanded": 0}
+        return frontier.search_steps(self.adjacency_indexed, start, goal, queue,
+                                     self.parent, self.counts, key)
+
+    def draw_graph_initial(self):
+        super().draw_graph_initial()
+        self._color_node(self.goal, "gold")
+
+    def handle_event(self, event):
+        if event[0] == "discover":
+            _, v = event
+            if v != self.goal:
+                self._color_node(v, "khaki")
+            self._log_step(f"Add {self.node_labels[v]} to the frontier.")
+        elif event[0] == "visit":
+            _, u = event
+            super().handle_event(event)
+            self._log_step(f"Expand {self.node_labels[u]}.")
+        elif event[0] == "found":
+            pass
+        else:
+            super().handle_event(event)
+
+    def on_complete(self):
+        if self.goal not in self.parent:
+            self._log_step(f"Goal {self.node_labels[self.goal]} is unreachable.")
+            return
+        path = shortest_paths.path_to(self.parent, self.start, self.goal)
+        for (i, j), line_id in self.edge_lines.items():
+            self.canvas.itemconfig(line_id, fill="lightgray", width=1)
+        for a, b in zip(path, path[1:]):
+            self._set_edge_color(a, b, "green", width=3)
+            self._color_node(a, "gold")
+        self._color_node(self.goal, "gold")
+        self._log_step(f"Goal found! Path of {len(path) - 1} edges after "
+                       f"{self.counts['expanded']} expansions.")
+
+    def stats_text(self):
+        if self.counts is None or "frontier" not in self.counts:
+            return ""
+        pushes = self.counts["frontier"]["pushes"]
+        return f"{self.frontier_var.get()} — expanded: {self.counts['expanded']}, pushes: {pushes}"
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Greedy Best First Search")
+    tab = GreedyBestFirstTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from workload_picker import WorkloadPicker
 
 class InsertionSortTab(ttk.Frame):
     def __init__(self, parent):
@@ -27,6 +28,9 @@ class InsertionSortTab(ttk.Frame):
                                           text="Generate Input Fields",
                                           command=self.generate_input_fields)
         self.generate_button.grid(row=0, column=2, padx=5, pady=5)
+        # Seeded input distributions (uses the number of elements above)
+        self.workload_picker = WorkloadPicker(self.input_frame, on_fill=self.fill_workload)
+        self.workload_picker.grid(row=1, column=0, columnspan=3, pady=5)
 
         # --- Middle Section: Array Elements Input ---
         self.array_frame = ttk.Frame(self)
@@ -91,6 +95,13 @@ class InsertionSortTab(ttk.Frame):
                                        command=self.start_sort)
         self.start_button.grid(row=2, column=0, columnspan=num_elements, pady=10)
 
+    def fill_workload(self):
+        """Generate the input fields and fill them from the chosen workload."""
+        self.generate_input_fields()
+        values = self.workload_picker.values(len(self.entries))
+        for entry, value in zip(self.entries, values):
+            entry.insert(0, str(value))
+
     def start_sort(self):
         """Gather numbers and start the insertion sort visualization."""
         try:
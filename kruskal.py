@@ -0,0 +1,84 @@
+# kruskal.py
+import tkinter as tk
+from graph_tab import WeightedGraphTab
+from graph_arrays import EdgeArrays
+import mst
+
+
+class KruskalTab(WeightedGraphTab):
+    """
+    Kruskal's algorithm on the weighted edge editor (edges used both ways).
+    The edges are sorted once in bulk, then each one either joins two trees
+    or is rejected by the union-find as closing a cycle. The counters show
+    how short the find paths stay with path compression and union by rank.
+    """
+
+    TITLE = "Kruskal's Algorithm"
+    DIRECTED = False
+    USES_START = False
+
+    def build_options(self, frame):
+        self.counts = None
+        self.tree = []
+        self.sort_method = ""
+
+    def make_steps(self, start, goal):
+        self.tree = []
+        self.counts = {"edges scanned": 0}
+        edges = EdgeArrays.from_weighted(self.graph, undirected=True)
+        return mst.kruskal_steps(edges, self.tree, self.counts)
+
+    def handle_event(self, event):
+        if event[0] == "sorted":
+            _, self.sort_method = event
+            self._log_step(f"Sorted every edge by weight ({self.sort_method}).")
+        elif event[0] == "edge":
+            _, u, v = event
+            self._highlight_edge(u, v, "red")
+            self._log_step(f"Next cheapest edge: {self.node_labels[u]} – {self.node_labels[v]}.")
+        elif event[0] == "tree_edge":
+            _, u, v, w = event
+            self._set_edge_color(u, v, "green", width=3)
+            self._highlight_edge(None, None)
+            self._color_node(u, "lightgreen")
+            self._color_node(v, "lightgreen")
+            self._log_step(f"{self.node_labels[u]} and {self.node_labels[v]} are in different "
+                           f"trees: join them (weight {w}).")
+        elif event[0] == "cycle_edge":
+            _, u, v, w = event
+            self._set_edge_color(u, v, "lightgray", width=1)
+            self._highlight_edge(None, None)
+            self._log_step(f"{self.node_labels[u]} and {self.node_labels[v]} are already "
+                           f"connected: skip (would close a cycle).")
+        else:
+            super().handle_event(event)
+
+    def on_complete(self):
+        tree_pairs = {(min(u, v), max(u, v)) for u, v, _ in self.tree}
+        for (i, j), line_id in self.edge_lines.items():
+            if (min(i, j), max(i, j)) not in tree_pairs:
+                self.canvas.itemconfig(line_id, fill="lightgray", width=1)
+        for idx in range(self.num_nodes):
+            self._color_node(idx, "darkgreen")
+        total = sum(w for _, _, w in self.tree)
+        components = self.num_nodes - len(self.tree)
+        forest = f" ({components} components, so a spanning forest)" if components > 1 else ""
+        self._log_step(f"Kruskal complete! {len(self.tree)} edges, total weight {total}{forest}.")
+
+    def stats_text(self):
+        if self.counts is None or "union-find" not in self.counts:
+            return ""
+        flat = mst.flatten_counts(self.counts)
+        average = flat["find path total"] / max(1, flat["finds"])
+        return (f"{self.sort_method} — edges scanned: {flat['edges scanned']}, "
+                f"finds: {flat['finds']}, unions: {flat['unions']}, "
+                f"average find path: {average:.2f}, longest: {flat['longest find path']}")
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Kruskal's Algorithm")
+    tab = KruskalTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
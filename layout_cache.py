@@ -0,0 +1,177 @@
+# layout_cache.py
+"""
+Computed graph layouts, kept per graph structure so a big graph is laid
+out once, not on every Start click, canvas resize or tab switch.
+
+A layout is stored normalized (force_layout.normalize), so it only
+depends on the shape of the box it was computed for, not its size:
+key = (graph_digest(adjacency), size_class(width, height)), where the
+size class is the box's width:height ratio rounded to half powers of two.
+Resizing within a class just rescales the stored coordinates; a resize
+into another class looks that class up (or lays the graph out again for
+it, since a wide box wants a wide layout).
+
+Set GRAPH_LAYOUT_CACHE to a directory to keep layouts on disk between
+sessions too (one small JSON file per key):
+
+    GRAPH_LAYOUT_CACHE=~/.cache/graph-layouts python main.py
+"""
+import hashlib
+import json
+import math
+import os
+from collections import OrderedDict
+
+from force_layout import BackgroundLayout, edge_pairs
+
+
+def graph_digest(adjacency):
+    """Hash of the node count and the undirected edge set: everything a layout depends on."""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(str(len(adjacency)).encode())
+    for pair in edge_pairs(adjacency):
+        h.update(b"%d,%d;" % pair)
+    return h.hexdigest()
+
+
+def size_class(width, height):
+    """Aspect ratio of a width x height box, rounded to a half power of two in [1/4, 4]."""
+    if width <= 0 or height <= 0:
+        return 1.0
+    steps = round(2 * math.log2(width / height))
+    return 2 ** (max(-4, min(4, steps)) / 2)
+
+
+class LayoutCache:
+    """
+    LRU of at most capacity layouts in memory, backed by JSON files in
+    directory when one is given. Unreadable or stale files count as misses;
+    a failed write just leaves the layout in memory.
+    """
+
+    def __init__(self, capacity=16, directory=None):
+        self.capacity = capacity
+        self.directory = os.path.expanduser(directory) if directory else None
+        self.entries = OrderedDict()    # (digest, size class) -> [(x, y)]
+        self.counts = {"hits": 0, "disk hits": 0, "misses": 0}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _path(self, key):
+        digest, aspect = key
+        return os.path.join(self.directory, f"{digest}-{aspect:.4f}.json")
+
+    def get(self, key):
+        coords = self.entries.get(key)
+        if coords is not None:
+            self.entries.move_to_end(key)
+            self.counts["hits"] += 1
+            return coords
+        if self.directory is not None:
+            try:
+                with open(self._path(key)) as f:
+                    data = json.load(f)
+                coords = [(x, y) for x, y in data["coords"]]
+            except (OSError, ValueError, KeyError, TypeError):
+                coords = None
+            if coords is not None:
+                self.counts["disk hits"] += 1
+                self._remember(key, coords)
+                return coords
+        self.counts["misses"] += 1
+        return None
+
+    def put(self, key, coords):
+        self._remember(key, coords)
+        if self.directory is None:
+            return
+        path = self._path(key)
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(path + ".tmp", "w") as f:
+                json.dump({"digest": key[0], "aspect": key[1], "coords": coords}, f)
+            os.replace(path + ".tmp", path)
+        except OSError:
+            pass
+
+    def _remember(self, key, coords):
+        self.entries[key] = coords
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.capacity:
+            self.entries.popitem(last=False)
+
+
+# One cache for every tab, so the BFS and DFS tabs share a graph's layout
+SHARED = LayoutCache(directory=os.environ.get("GRAPH_LAYOUT_CACHE"))
+
+
+class LayoutSlot:
+    """
+    One tab's force-directed layout. set_graph() at draw time, then
+    coords(width, height) gives (normalized coords, aspect) for a box of
+    that size, or None while the layout is being computed on a worker
+    thread; on_ready() is called on the Tk thread once it is cached.
+
+    Only a new graph (reset()) forgets the drawing's layout. After single
+    edge edits the graph has a new digest, but the layout on screen is
+    reused for it rather than recomputed, so nodes do not jump.
+    """
+
+    def __init__(self, widget, on_ready, min_nodes=30, seconds=5.0, cache=SHARED):
+        self.widget = widget
+        self.on_ready = on_ready
+        self.min_nodes = min_nodes
+        self.seconds = seconds
+        self.cache = cache
+        self.adjacency = {}
+        self.digest = None
+        self.current = None     # (aspect, coords) last handed out, until reset()
+        self.job = None
+        self.job_key = None
+
+    def set_graph(self, adjacency):
+        self.adjacency = adjacency
+        self.digest = graph_digest(adjacency)
+
+    def reset(self):
+        self.current = None
+        self.cancel()
+
+    def cancel(self):
+        if self.job is not None:
+            self.job.cancel()
+        self.job = self.job_key = None
+
+    def coords(self, width, height):
+        n = len(self.adjacency)
+        if n < self.min_nodes or self.digest is None:
+            return None
+        key = (self.digest, size_class(width, height))
+        coords = self.cache.get(key)
+        if coords is None and self.current is not None and self.current[0] == key[1] \
+                and len(self.current[1]) == n:
+            coords = self.current[1]        # Same drawing, a few edges changed
+            self.cache.put(key, coords)
+        if coords is None:
+            self._start(key)
+            return None
+        self.current = (key[1], coords)
+        return coords, key[1]
+
+    def _start(self, key):
+        if self.job_key == key:
+            return
+        self.cancel()
+        self.job_key = key
+        self.job = BackgroundLayout(self.widget, dict(self.adjacency),
+                                    lambda coords: self._done(key, coords),
+                                    seed=0, seconds=self.seconds, aspect=key[1])
+
+    def _done(self, key, coords):
+        if key != self.job_key:
+            return
+        self.job = self.job_key = None
+        self.cache.put(key, coords)
+        if key[0] == self.digest:
+            self.on_ready()
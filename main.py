@@ -8,6 +8,14 @@ import merge_sort     # New merge sort module.
 import quick_sort     # New quick sort module.
 import BFS            # New BFS module.
 import DFS            # New DFS module.
+import maze_search    # BFS/DFS on implicit maze grids.
+import dijkstra       # Dijkstra's algorithm module.
+import bellman_ford   # Bellman-Ford module.
+import a_star         # A* search module.
+import prim           # Prim's algorithm module.
+import kruskal        # Kruskal's algorithm module.
+import topological_sort  # Topological sort module.
+import greedy_best_first  # Greedy best-first search module.
 
 # Create the main application window.
 root = tk.Tk()
@@ -84,39 +92,32 @@ traversal_notebook.add(bfs_tab, text="Breadth First Search")
 dfs_tab = DFS.DepthFirstSearchTab(traversal_notebook)
 traversal_notebook.add(dfs_tab, text="Depth First Search")
 
-# Add placeholder tabs for Shortest Path algorithms
-shortest_path_algorithms = [
-    "Dijkstra's Algorithm", 
-    "Bellman-Ford Algorithm", 
-    "A* Search"
-]
-for algo in shortest_path_algorithms:
-    frame = ttk.Frame(shortest_path_notebook, style='TFrame')
-    label = tk.Label(frame, text=f"{algo} visualization not implemented yet.", font=("Arial", 14), bg=bg_color)
-    label.pack(expand=True, padx=20, pady=20)
-    shortest_path_notebook.add(frame, text=algo.split()[0])  # Use first word as tab title
-
-# Add placeholder tabs for Minimum Spanning Tree algorithms
-mst_algorithms = [
-    "Prim's Algorithm", 
-    "Kruskal's Algorithm"
-]
-for algo in mst_algorithms:
-    frame = ttk.Frame(mst_notebook, style='TFrame')
-    label = tk.Label(frame, text=f"{algo} visualization not implemented yet.", font=("Arial", 14), bg=bg_color)
-    label.pack(expand=True, padx=20, pady=20)
-    mst_notebook.add(frame, text=algo.split("'")[0])  # Use name before apostrophe
-
-# Add placeholder tabs for other graph algorithms
-other_algorithms = [
-    "Topological Sort", 
-    "Greedy Best First Search"
-]
-for algo in other_algorithms:
-    frame = ttk.Frame(other_notebook, style='TFrame')
-    label = tk.Label(frame, text=f"{algo} visualization not implemented yet.", font=("Arial", 14), bg=bg_color)
-    label.pack(expand=True, padx=20, pady=20)
-    other_notebook.add(frame, text=algo.split()[0])  # Use first word as tab title
+maze_tab = maze_search.MazeSearchTab(traversal_notebook)
+traversal_notebook.add(maze_tab, text="Maze")
+
+# Create and add the Shortest Path tabs
+dijkstra_tab = dijkstra.DijkstraTab(shortest_path_notebook)
+shortest_path_notebook.add(dijkstra_tab, text="Dijkstra's")
+
+bellman_ford_tab = bellman_ford.BellmanFordTab(shortest_path_notebook)
+shortest_path_notebook.add(bellman_ford_tab, text="Bellman-Ford")
+
+a_star_tab = a_star.AStarTab(shortest_path_notebook)
+shortest_path_notebook.add(a_star_tab, text="A*")
+
+# Create and add the Minimum Spanning Tree tabs
+prim_tab = prim.PrimTab(mst_notebook)
+mst_notebook.add(prim_tab, text="Prim")
+
+kruskal_tab = kruskal.KruskalTab(mst_notebook)
+mst_notebook.add(kruskal_tab, text="Kruskal")
+
+# Create and add the other graph algorithm tabs
+topological_tab = topological_sort.TopologicalSortTab(other_notebook)
+other_notebook.add(topological_tab, text="Topological")
+
+greedy_tab = greedy_best_first.GreedyBestFirstTab(other_notebook)
+other_notebook.add(greedy_tab, text="Greedy")
 
 # Add watermark label at the bottom-right of the window.
 watermark = tk.Label(root, text="finn clancy 2025", font=("Arial", 8), fg="#a0a0a0")
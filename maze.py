@@ -0,0 +1,261 @@
+# maze.py
+"""
+Implicit grid graphs: a raster of open cells and walls, where a cell's
+neighbours are worked out from the wall bitmap when they are asked for
+instead of being stored. A 2001 x 2001 maze is 4M cells in one 4 MB
+bytearray, not 4M adjacency lists:
+
+    python maze.py --rows 2001 --cols 2001 --seed 1
+
+The searches are frontier.search_steps (the loop the BFS, DFS and greedy
+best-first tabs share) with the grid standing in for an adjacency dict and
+its marks and parents kept in flat arrays, so their expansion counts line
+up with A* (shortest_paths) on the same maze.
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from array import array
+
+import frontier
+import shortest_paths
+
+# Cell marks: the wall bitmap, then the search's progress over the open cells
+OPEN, WALL, SEEN, DONE, PATH = 0, 1, 2, 3, 4
+
+
+class GridGraph:
+    """
+    rows x cols raster; cell (r, c) is node r*cols + c and walls[v] is 1 for
+    a wall. Open cells are joined to their open 4-neighbours, which are
+    always listed in ascending index order (up, left, right, down), the same
+    order the traversal tabs sort their neighbours into.
+    """
+
+    def __init__(self, rows, cols, walls=None):
+        self.rows = rows
+        self.cols = cols
+        self.walls = walls if walls is not None else bytearray(rows * cols)
+
+    def __len__(self):
+        return self.rows * self.cols
+
+    def step(self, u, d):
+        """Neighbour of u in direction d (0 up, 1 left, 2 right, 3 down), or -1."""
+        cols = self.cols
+        if d == 0:
+            v = u - cols if u >= cols else -1
+        elif d == 1:
+            v = u - 1 if u % cols else -1
+        elif d == 2:
+            v = u + 1 if (u + 1) % cols else -1
+        else:
+            v = u + cols if u + cols < len(self) else -1
+        if v >= 0 and self.walls[v]:
+            return -1
+        return v
+
+    def neighbours(self, u):
+        return [v for v in (self.step(u, d) for d in range(4)) if v >= 0]
+
+    def __getitem__(self, u):
+        """grid[u] is u's neighbour list, so a GridGraph can stand in for an adjacency dict."""
+        return self.neighbours(u)
+
+    def cell(self, r, c):
+        return r * self.cols + c
+
+    def coords(self, v):
+        return divmod(v, self.cols)
+
+
+def maze(rows, cols, seed=None, loops=0.0):
+    """
+    Seeded perfect maze by randomized depth-first carving (recursive
+    backtracker, with an explicit stack). Rooms sit on odd (row, col)
+    positions with walls in between, so odd sizes give a full border; an
+    even size leaves one extra wall row/column. loops knocks out that
+    fraction of the remaining inner walls, so there is more than one way
+    through (BFS and DFS then find different paths).
+    """
+    rng = random.Random(seed)
+    walls = bytearray(b"\x01") * (rows * cols)
+    grid = GridGraph(rows, cols, walls)
+    if rows < 3 or cols < 3:
+        return grid
+
+    start = grid.cell(1, 1)
+    walls[start] = 0
+    stack = [start]
+    two = (-2 * cols, -2, 2, 2 * cols)
+    while stack:
+        u = stack[-1]
+        r, c = divmod(u, cols)
+        options = []
+        for d, step in enumerate(two):
+            if d == 0 and r < 3 or d == 1 and c < 3 or d == 2 and c + 2 >= cols - 1 \
+                    or d == 3 and r + 2 >= rows - 1:
+                continue
+            if walls[u + step]:
+                options.append(step)
+        if not options:
+            stack.pop()
+            continue
+        step = rng.choice(options)
+        walls[u + step // 2] = 0
+        walls[u + step] = 0
+        stack.append(u + step)
+
+    if loops > 0:
+        # Inner walls between two rooms: one odd and one even coordinate
+        between = [grid.cell(r, c)
+                   for r in range(1, rows - 1) for c in range(1, cols - 1)
+                   if (r + c) % 2 and walls[grid.cell(r, c)]
+                   and (r % 2 and c + 1 < cols - 1 or c % 2 and r + 1 < rows - 1)]
+        for v in rng.sample(between, int(len(between) * loops)):
+            walls[v] = 0
+    return grid
+
+
+###############################################################################
+# Searches (frontier.search_steps over the grid)
+###############################################################################
+class CellMarks:
+    """
+    search_steps' seen set kept in a marks bytearray (a copy of the walls):
+    any cell that is not OPEN counts as seen, and add() marks a cell SEEN.
+    """
+
+    def __init__(self, marks):
+        self.marks = marks
+
+    def __contains__(self, v):
+        return self.marks[v] != OPEN
+
+    def add(self, v):
+        self.marks[v] = SEEN
+
+
+class CellParents:
+    """search_steps' parent map as one array('l') slot per cell: -1 unreached, a start is its own parent."""
+
+    def __init__(self, n):
+        self.cells = array("l", [-1]) * n
+
+    def __getitem__(self, v):
+        return self.cells[v]
+
+    def __setitem__(self, v, u):
+        self.cells[v] = v if u is None else u
+
+
+class GridCoords:
+    """coords[v] = (column, row) of cell v, the (x, y) the heuristics measure with."""
+
+    def __init__(self, grid):
+        self.cols = grid.cols
+
+    def __getitem__(self, v):
+        r, c = divmod(v, self.cols)
+        return c, r
+
+
+def grid_search_steps(grid, marks, start, goal, parent, counts, frontier_name, heuristic="Manhattan"):
+    """
+    frontier.search_steps over the implicit grid with the named frontier,
+    marks as its seen set (SEEN when pushed, DONE when completed) and
+    parent a CellParents. Events and counts are search_steps' own, so
+    expansion counts compare directly with the graph tabs' searches.
+    """
+    queue = frontier.FRONTIERS[frontier_name]()
+    key = None
+    if isinstance(queue, frontier.PriorityFrontier):
+        key = frontier.heuristic_key(GridCoords(grid), goal, heuristic)
+    for event in frontier.search_steps(grid, start, goal, queue, parent, counts, key,
+                                       seen=CellMarks(marks)):
+        if event[0] == "completed":
+            marks[event[1]] = DONE
+        yield event
+
+
+TRAVERSALS = {
+    "Breadth-first": "FIFO (breadth-first)",
+    "Depth-first": "LIFO (depth-first)",
+    "Greedy best-first": "Priority (greedy best-first)",
+}
+
+
+def grid_path(parent, start, goal):
+    """Cells from start to goal by parent pointers; [] if goal was never reached."""
+    if parent[goal] < 0:
+        return []
+    path = [goal]
+    while path[-1] != start:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def solve(grid, start, goal, traversal):
+    """Run one search to the end; returns (path, marks, counts)."""
+    marks = bytearray(grid.walls)
+    parent = CellParents(len(grid))
+    counts = {"expanded": 0}
+    for _ in grid_search_steps(grid, marks, start, goal, parent, counts, TRAVERSALS[traversal]):
+        pass
+    return grid_path(parent, start, goal), marks, counts
+
+
+class UnitWeights:
+    """grid[u] as (v, 1) pairs: the weighted graph a_star_steps reads."""
+
+    def __init__(self, grid):
+        self.grid = grid
+
+    def __len__(self):
+        return len(self.grid)
+
+    def __getitem__(self, u):
+        return [(v, 1) for v in self.grid.neighbours(u)]
+
+
+def solve_a_star(grid, start, goal, heuristic="Manhattan", tie_break="Prefer larger g"):
+    """A* with unit steps (so the heuristic needs no scaling); returns (path, counts)."""
+    n = len(grid)
+    dist = [math.inf] * n
+    parent = [None] * n
+    counts = {"expanded": 0, "pushes": 0, "re-opens": 0}
+    for _ in shortest_paths.a_star_steps(UnitWeights(grid), GridCoords(grid), start, goal, dist,
+                                         parent, counts, heuristic, tie_break, scale=1):
+        pass
+    path = shortest_paths.path_to(parent, start, goal) if dist[goal] < math.inf else []
+    return path, counts
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Search a large seeded maze without building its adjacency.")
+    parser.add_argument("--rows", type=int, default=2001)
+    parser.add_argument("--cols", type=int, default=2001)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--loops", type=float, default=0.0, help="fraction of inner walls to remove")
+    args = parser.parse_args()
+
+    began = time.perf_counter()
+    grid = maze(args.rows, args.cols, args.seed, args.loops)
+    print(f"{args.rows}x{args.cols} maze: {sys.getsizeof(grid.walls) / 1e6:.1f} MB wall bitmap "
+          f"({time.perf_counter() - began:.1f} s to carve)")
+    start = grid.cell(1, 1)
+    goal = grid.cell(args.rows - 2 - (args.rows % 2 == 0), args.cols - 2 - (args.cols % 2 == 0))
+    for name in TRAVERSALS:
+        began = time.perf_counter()
+        path, _, counts = solve(grid, start, goal, name)
+        seconds = time.perf_counter() - began
+        print(f"{name:<20}{seconds:>7.2f}s  expanded={counts['expanded']:<9}"
+              f"pushes={counts['frontier']['pushes']:<9}path {len(path) - 1} steps")
+    began = time.perf_counter()
+    path, counts = solve_a_star(grid, start, goal)
+    seconds = time.perf_counter() - began
+    print(f"{'A* (Manhattan)':<20}{seconds:>7.2f}s  expanded={counts['expanded']:<9}"
+          f"pushes={counts['pushes']:<9}path {len(path) - 1} steps")
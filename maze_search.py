@@ -0,0 +1,372 @@
+# maze_search.py
+import tkinter as tk
+from tkinter import ttk, messagebox
+import time
+import maze
+
+
+class MazeSearchTab(ttk.Frame):
+    """
+    BFS, DFS and greedy best-first search on a seeded maze that is never turned into an adjacency
+    list: the maze is a wall bitmap (maze.GridGraph) and each cell's
+    neighbours are worked out as the search reaches it. The maze is drawn
+    as a raster image, one block of pixels per cell, and a search step only
+    recolors the cells it touched. Mazes bigger than MAX_ANIMATED_CELLS are
+    searched without animation and drawn once at the end.
+    Left click sets the start cell, right click the goal.
+    """
+
+    TITLE = "Maze Search"
+    MAX_ANIMATED_CELLS = 250000
+    VIEW_WIDTH = 700
+    VIEW_HEIGHT = 500
+    # Cell mark -> color, for the raster and for single-cell updates
+    COLORS = {
+        maze.OPEN: (255, 255, 255),
+        maze.WALL: (66, 66, 66),
+        maze.SEEN: (144, 238, 144),     # lightgreen: queued / on the stack
+        maze.DONE: (0, 100, 0),         # darkgreen: fully expanded
+        maze.PATH: (255, 0, 0),
+    }
+    START_COLOR = "#1e90ff"
+    GOAL_COLOR = "#ffd700"
+    # name -> (delay in ms, events per tick)
+    SPEEDS = {"Slow": (300, 1), "Medium": (50, 20), "Fast": (15, 500)}
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        #######################################################################
+        # Style / Dark background for frames/labels
+        #######################################################################
+        style = ttk.Style()
+        style.configure("Dark.TFrame", background="#424242")
+        style.configure("Dark.TLabel", background="#424242", foreground="white")
+        style.configure("Dark.TButton", background="#424242", foreground="white")
+
+        self.configure(style="Dark.TFrame")
+
+        #######################################################################
+        # Heading
+        #######################################################################
+        self.heading = tk.Label(
+            self, text=self.TITLE, font=("Arial", 24, "bold"),
+            bg="#424242", fg="white"
+        )
+        self.heading.pack(pady=10, fill="x")
+
+        #######################################################################
+        # Main container: left (maze inputs), right (animation)
+        #######################################################################
+        self.main_frame = ttk.Frame(self, style="Dark.TFrame")
+        self.main_frame.pack(expand=True, fill="both")
+
+        self.main_frame.columnconfigure(0, weight=3)  # ~30%
+        self.main_frame.columnconfigure(1, weight=7)  # ~70%
+        self.main_frame.rowconfigure(0, weight=1)
+
+        self.left_frame = ttk.Frame(self.main_frame, style="Dark.TFrame")
+        self.left_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=10)
+
+        self.right_frame = ttk.Frame(self.main_frame, style="Dark.TFrame")
+        self.right_frame.grid(row=0, column=1, sticky="nsew", padx=10, pady=10)
+
+        #######################################################################
+        # Data structures
+        #######################################################################
+        self.grid = None            # maze.GridGraph (wall bitmap)
+        self.marks = None           # bytearray: walls + search progress per cell
+        self.parent = None
+        self.counts = None
+        self.start_cell = None
+        self.goal_cell = None
+        self.path = []
+
+        # Animation
+        self.current_delay, self.events_per_tick = self.SPEEDS["Medium"]
+        self.paused = False
+        self.step_generator = None
+
+        # Raster drawing
+        self.zoom = 1               # Pixels per cell side
+        self.image = None
+
+        self._build_left_inputs()
+        self._build_right_area()
+
+    ###########################################################################
+    # LEFT: maze inputs
+    ###########################################################################
+    def _build_left_inputs(self):
+        input_top = ttk.Frame(self.left_frame, style="Dark.TFrame")
+        input_top.pack(anchor="nw", fill="x", pady=5)
+
+        self.rows_entry = self._labelled_entry(input_top, 0, "Rows:", "41")
+        self.cols_entry = self._labelled_entry(input_top, 1, "Columns:", "61")
+        self.seed_entry = self._labelled_entry(input_top, 2, "Seed:", "1")
+        self.loops_entry = self._labelled_entry(input_top, 3, "Extra openings (%):", "0")
+
+        ttk.Button(input_top, text="Generate Maze", command=self.generate_maze,
+                   style="Dark.TButton").grid(row=4, column=0, columnspan=2, padx=5, pady=5)
+
+        tk.Label(self.left_frame, justify="left", anchor="w", bg="#424242", fg="white",
+                 font=("Arial", 10),
+                 text="Walls are dark gray, open cells white.\n"
+                      "Light green: reached, dark green: expanded,\n"
+                      "red: the path found. Blue is the start, gold the goal.\n\n"
+                      "Left click a cell to move the start,\n"
+                      "right click to move the goal.\n\n"
+                      "Extra openings knock out that share of the\n"
+                      "inner walls, so there is more than one way\n"
+                      "through and BFS and DFS find different paths.")\
+            .pack(anchor="nw", pady=10)
+
+    def _labelled_entry(self, frame, row, text, default):
+        ttk.Label(frame, text=text, style="Dark.TLabel")\
+            .grid(row=row, column=0, padx=5, pady=5, sticky="e")
+        entry = ttk.Entry(frame, width=8)
+        entry.grid(row=row, column=1, padx=5, pady=5, sticky="w")
+        entry.insert(0, default)
+        return entry
+
+    def _read_int(self, entry, default, low):
+        try:
+            return max(low, int(entry.get()))
+        except ValueError:
+            entry.delete(0, tk.END)
+            entry.insert(0, str(default))
+            return default
+
+    def generate_maze(self):
+        rows = self._read_int(self.rows_entry, 41, 3)
+        cols = self._read_int(self.cols_entry, 61, 3)
+        try:
+            loops = min(100.0, max(0.0, float(self.loops_entry.get()))) / 100
+        except ValueError:
+            loops = 0.0
+        seed = self.seed_entry.get().strip()
+        try:
+            seed = int(seed)
+        except ValueError:
+            pass  # Any string is a valid (reproducible) seed too
+
+        self.step_generator = None
+        began = time.perf_counter()
+        self.grid = maze.maze(rows, cols, seed, loops)
+        seconds = time.perf_counter() - began
+        self.start_cell = self.grid.cell(1, 1)
+        self.goal_cell = self.grid.cell(rows - 2 - (rows % 2 == 0), cols - 2 - (cols % 2 == 0))
+        self._reset_search()
+        self.step_var.set(f"Carved a {rows}x{cols} maze in {seconds:.2f} s "
+                          f"({len(self.grid.walls) / 1e6:.1f} MB wall bitmap, no adjacency lists).")
+
+    ###########################################################################
+    # RIGHT: controls + raster canvas
+    ###########################################################################
+    def _build_right_area(self):
+        self.right_frame.columnconfigure(0, weight=1)
+
+        # row0: traversal + Start
+        top_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
+        top_frame.grid(row=0, column=0, sticky="w", pady=5)
+
+        ttk.Label(top_frame, text="Search:", style="Dark.TLabel").pack(side="left")
+        self.traversal_var = tk.StringVar(value=next(iter(maze.TRAVERSALS)))
+        ttk.Combobox(top_frame, textvariable=self.traversal_var, state="readonly", width=18,
+                     values=list(maze.TRAVERSALS)).pack(side="left", padx=5)
+        ttk.Button(top_frame, text="Start", command=self.start_search, style="Dark.TButton")\
+            .pack(side="left", padx=5)
+        ttk.Button(top_frame, text="Run to End", command=self.run_to_end, style="Dark.TButton")\
+            .pack(side="left", padx=5)
+
+        # row1: speed & pause
+        control_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
+        control_frame.grid(row=1, column=0, sticky="w", pady=5)
+
+        for name in self.SPEEDS:
+            ttk.Button(control_frame, text=name, command=lambda name=name: self.set_speed(name),
+                       style="Dark.TButton").pack(side='left', padx=5)
+
+        self.pause_play_button = ttk.Button(control_frame, text="Pause", command=self.toggle_pause,
+                                            style="Dark.TButton")
+        self.pause_play_button.pack(side='left', padx=5)
+
+        # row2: latest step + counters
+        self.step_var = tk.StringVar(value="")
+        ttk.Label(self.right_frame, textvariable=self.step_var, style="Dark.TLabel")\
+            .grid(row=2, column=0, sticky="w", padx=5)
+        self.stats_var = tk.StringVar(value="")
+        ttk.Label(self.right_frame, textvariable=self.stats_var, style="Dark.TLabel")\
+            .grid(row=3, column=0, sticky="w", padx=5)
+
+        # row4: raster canvas (scrolls when the maze is bigger than the view)
+        canvas_frame = ttk.Frame(self.right_frame, style="Dark.TFrame")
+        canvas_frame.grid(row=4, column=0, sticky="nsew", padx=5, pady=5)
+        self.right_frame.rowconfigure(4, weight=1)
+
+        self.canvas = tk.Canvas(canvas_frame, bg="#424242", width=self.VIEW_WIDTH,
+                                height=self.VIEW_HEIGHT, highlightthickness=0)
+        vbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        hbar = ttk.Scrollbar(canvas_frame, orient="horizontal", command=self.canvas.xview)
+        self.canvas.configure(yscrollcommand=vbar.set, xscrollcommand=hbar.set)
+        self.canvas.grid(row=0, column=0, sticky="nsew")
+        vbar.grid(row=0, column=1, sticky="ns")
+        hbar.grid(row=1, column=0, sticky="ew")
+        canvas_frame.rowconfigure(0, weight=1)
+        canvas_frame.columnconfigure(0, weight=1)
+
+        self.canvas.bind("<Button-1>", lambda e: self._pick_cell(e, "start"))
+        self.canvas.bind("<Button-3>", lambda e: self._pick_cell(e, "goal"))
+
+    def set_speed(self, name):
+        self.current_delay, self.events_per_tick = self.SPEEDS[name]
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self.pause_play_button.config(text="Play" if self.paused else "Pause")
+        if not self.paused:
+            self.visualize_step()
+
+    def _pick_cell(self, event, which):
+        if self.grid is None:
+            return
+        r = int(self.canvas.canvasy(event.y)) // self.zoom
+        c = int(self.canvas.canvasx(event.x)) // self.zoom
+        if not (0 <= r < self.grid.rows and 0 <= c < self.grid.cols):
+            return
+        v = self.grid.cell(r, c)
+        if self.grid.walls[v]:
+            return
+        if which == "start":
+            self.start_cell = v
+        else:
+            self.goal_cell = v
+        self.step_generator = None
+        self._reset_search()
+
+    ###########################################################################
+    # Search
+    ###########################################################################
+    def _reset_search(self):
+        """Fresh marks (a copy of the wall bitmap) and a freshly drawn raster."""
+        self.marks = bytearray(self.grid.walls)
+        self.parent = maze.CellParents(len(self.grid))
+        self.counts = {"expanded": 0}
+        self.path = []
+        self.stats_var.set("")
+        self.draw_raster()
+
+    def start_search(self):
+        if self.grid is None:
+            messagebox.showinfo("No Maze", "Generate a maze first.")
+            return
+        self.step_generator = None
+        self._reset_search()
+        self.step_generator = maze.grid_search_steps(
+            self.grid, self.marks, self.start_cell, self.goal_cell, self.parent, self.counts,
+            maze.TRAVERSALS[self.traversal_var.get()])
+        if len(self.grid) > self.MAX_ANIMATED_CELLS:
+            self.run_to_end()    # Too big to animate: search, then draw once
+            return
+        self.after(self.current_delay, self.visualize_step)
+
+    def run_to_end(self):
+        """Finish the current search without drawing each step, then redraw once."""
+        if self.step_generator is None:
+            return
+        steps, self.step_generator = self.step_generator, None
+        began = time.perf_counter()
+        for event in steps:
+            if event[0] == "found":
+                self.path = maze.grid_path(self.parent, self.start_cell, self.goal_cell)
+        seconds = time.perf_counter() - began
+        self.on_complete()
+        self.draw_raster()
+        self.step_var.set(f"{self.step_var.get()}  (ran without animation in {seconds:.2f} s)")
+
+    def visualize_step(self):
+        if self.paused or not self.step_generator:
+            return
+        try:
+            for _ in range(self.events_per_tick):
+                self.handle_event(next(self.step_generator))
+            self.stats_var.set(self.stats_text())
+        except StopIteration:
+            self.step_generator = None
+            self.on_complete()
+            self.draw_raster()
+            return
+
+        self.after(self.current_delay, self.visualize_step)
+
+    def handle_event(self, event):
+        if event[0] == "discover":
+            _, v = event
+            self._paint_cell(v)
+            self.step_var.set(f"Reached cell {self.grid.coords(v)}.")
+        elif event[0] == "visit":
+            _, u = event
+            self._paint_cell(u)
+            self.step_var.set(f"Expand cell {self.grid.coords(u)}.")
+        elif event[0] == "completed":
+            _, u = event
+            self._paint_cell(u)
+            self.step_var.set(f"Cell {self.grid.coords(u)} has no more open neighbours to try.")
+        elif event[0] == "found":
+            self.path = maze.grid_path(self.parent, self.start_cell, self.goal_cell)
+
+    def on_complete(self):
+        for v in self.path:
+            self.marks[v] = maze.PATH
+        if self.path:
+            self.step_var.set(f"{self.traversal_var.get()} search reached the goal: "
+                              f"path of {len(self.path) - 1} steps.")
+        else:
+            self.step_var.set(f"{self.traversal_var.get()} search finished: the goal is walled off.")
+        self.stats_var.set(self.stats_text())
+
+    def stats_text(self):
+        if self.counts is None or "frontier" not in self.counts:
+            return ""
+        return (f"expanded: {self.counts['expanded']}, pushes: {self.counts['frontier']['pushes']} "
+                f"(of {len(self.grid)} cells)")
+
+    ###########################################################################
+    # Raster drawing
+    ###########################################################################
+    def draw_raster(self):
+        """Redraw the whole maze from self.marks as one PPM image."""
+        rows, cols = self.grid.rows, self.grid.cols
+        self.zoom = max(1, min(self.VIEW_WIDTH // cols, self.VIEW_HEIGHT // rows))
+        # One byte per cell becomes three: the red, green and blue planes
+        pixels = bytearray(3 * rows * cols)
+        for channel in range(3):
+            table = bytes(self.COLORS.get(mark, (0, 0, 0))[channel] for mark in range(256))
+            pixels[channel::3] = self.marks.translate(table)
+        image = tk.PhotoImage(data=b"P6 %d %d 255\n" % (cols, rows) + bytes(pixels), format="PPM")
+        self.image = image.zoom(self.zoom) if self.zoom > 1 else image
+
+        self.canvas.delete("all")
+        self.canvas.create_image(0, 0, anchor="nw", image=self.image)
+        self.canvas.configure(scrollregion=(0, 0, cols * self.zoom, rows * self.zoom))
+        self._paint_cell(self.start_cell, self.START_COLOR)
+        self._paint_cell(self.goal_cell, self.GOAL_COLOR)
+
+    def _paint_cell(self, v, color=None):
+        """Recolor one cell of the raster (by its mark unless a color is given)."""
+        if color is None:
+            if v in (self.start_cell, self.goal_cell):
+                return
+            color = "#%02x%02x%02x" % self.COLORS[self.marks[v]]
+        r, c = self.grid.coords(v)
+        z = self.zoom
+        self.image.put(color, to=(c * z, r * z, c * z + z, r * z + z))
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Maze Search")
+    tab = MazeSearchTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
@@ -1,5 +1,6 @@
 import tkinter as tk
 from tkinter import ttk
+from workload_picker import WorkloadPicker
 import colorsys  # For generating bright, distinct colors.
 import math      # For logarithm computations
 from collections import defaultdict
@@ -37,6 +38,9 @@ class MergeSortTab(ttk.Frame):
         self.generate_button = ttk.Button(self.input_frame, text="Generate Input Fields",
                                           command=self.generate_input_fields)
         self.generate_button.grid(row=0, column=2, padx=5, pady=5)
+        # Seeded input distributions (uses the number of elements above)
+        self.workload_picker = WorkloadPicker(self.input_frame, on_fill=self.fill_workload)
+        self.workload_picker.grid(row=1, column=0, columnspan=3, pady=5)
 
         # --- Array Elements Input ---
         self.array_frame = ttk.Frame(self)
@@ -89,6 +93,13 @@ class MergeSortTab(ttk.Frame):
         self.start_button = ttk.Button(self.array_frame, text="Start Merge Sort", command=self.start_sort)
         self.start_button.grid(row=2, column=0, columnspan=num_elements, pady=10)
 
+    def fill_workload(self):
+        """Generate the input fields and fill them from the chosen workload."""
+        self.generate_input_fields()
+        values = self.workload_picker.values(len(self.entries))
+        for entry, value in zip(self.entries, values):
+            entry.insert(0, str(value))
+
     def start_sort(self):
         """Read inputs, start merge sort, and visualize."""
         try:
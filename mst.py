@@ -0,0 +1,289 @@
+# mst.py
+"""
+Minimum spanning tree algorithms shared by the MST tabs and headless runs.
+
+Graphs are undirected and use the weighted adjacency form of the graph tabs,
+with every edge listed from both ends:
+    graph[u] -> list of (v, weight)
+A disconnected graph gets a minimum spanning forest. Besides the common
+("visit", u) / ("edge", u, v) / ("completed", u) events the generators
+yield ("tree_edge", u, v, w) for every edge added to the tree.
+
+    python mst.py --n 1500 --p 0.5 --seed 1
+    python mst.py --algorithm kruskal --n 200000 --edges 1000000
+"""
+import argparse
+import random
+import time
+from array import array
+
+import graph_generators
+from graph_arrays import EdgeArrays, np
+from priority_queues import IndexedBinaryHeap, LazyHeapQueue
+
+
+###############################################################################
+# Prim
+###############################################################################
+def prim_lazy_steps(graph, tree, counts, start=0):
+    """
+    Lazy Prim: every edge leaving the tree goes on a heap; edges whose far
+    end joined the tree in the meantime are skipped when popped. O(E log E).
+    Each added edge is appended to tree as (u, v, w).
+    """
+    n = len(graph)
+    in_tree = [False] * n
+    heap = LazyHeapQueue()
+    counts["heap"] = heap.counts
+    for root in [start] + list(range(n)):
+        if in_tree[root]:
+            continue
+        in_tree[root] = True
+        yield ("visit", root)
+        frontier = [root]
+        while frontier:
+            u = frontier.pop()
+            for v, w in graph[u]:
+                yield ("edge", u, v)
+                if not in_tree[v]:
+                    heap.update((u, v), w)
+                    yield ("candidate", u, v, w)
+            yield ("completed", u)
+            while heap:
+                (a, b), w = heap.pop()
+                if in_tree[b]:
+                    counts["skipped edges"] += 1
+                    continue
+                in_tree[b] = True
+                tree.append((a, b, w))
+                yield ("tree_edge", a, b, w)
+                yield ("visit", b)
+                frontier.append(b)
+                break
+
+
+def prim_eager_steps(graph, tree, counts, start=0):
+    """
+    Eager Prim: one heap entry per vertex outside the tree, keyed by its
+    cheapest edge into the tree and lowered in place (decrease-key).
+    O(E log V), and the heap never holds more than V entries.
+    """
+    n = len(graph)
+    in_tree = [False] * n
+    best_edge = [None] * n    # v -> (u, w): cheapest known edge from the tree to v
+    heap = IndexedBinaryHeap()
+    counts["heap"] = heap.counts
+    for root in [start] + list(range(n)):
+        if in_tree[root]:
+            continue
+        heap.update(root, 0)
+        while heap:
+            u, _ = heap.pop()
+            in_tree[u] = True
+            if best_edge[u] is not None:
+                a, w = best_edge[u]
+                tree.append((a, u, w))
+                yield ("tree_edge", a, u, w)
+            yield ("visit", u)
+            for v, w in graph[u]:
+                yield ("edge", u, v)
+                if not in_tree[v] and (best_edge[v] is None or w < best_edge[v][1]):
+                    best_edge[v] = (u, w)
+                    heap.update(v, w)
+                    yield ("candidate", u, v, w)
+            yield ("completed", u)
+
+
+PRIM_VARIANTS = {
+    "Lazy (heapq of edges)": prim_lazy_steps,
+    "Eager (indexed heap, decrease-key)": prim_eager_steps,
+}
+
+
+def prim(graph, variant="Eager (indexed heap, decrease-key)", start=0):
+    """Run one Prim variant to the end; returns (tree edges, total weight, counts)."""
+    tree = []
+    counts = {"skipped edges": 0}
+    for _ in PRIM_VARIANTS[variant](graph, tree, counts, start):
+        pass
+    return tree, sum(w for _, _, w in tree), counts
+
+
+###############################################################################
+# Kruskal
+###############################################################################
+class UnionFind:
+    """
+    Disjoint sets over 0..n-1 in two flat arrays, with path compression and
+    union by rank. Every find records how many parent links it followed, so
+    the near-constant cost per operation can be shown rather than assumed.
+    """
+
+    def __init__(self, n):
+        self.parent = array("l", range(n))
+        self.rank = array("b", bytes(n))   # Ranks stay below log2(n) < 127
+        self.counts = {"finds": 0, "find path total": 0, "longest find path": 0, "unions": 0}
+
+    def find(self, x):
+        parent = self.parent
+        root = x
+        hops = 0
+        while parent[root] != root:
+            root = parent[root]
+            hops += 1
+        while parent[x] != root:     # Compress: point the whole path at the root
+            parent[x], x = root, parent[x]
+        counts = self.counts
+        counts["finds"] += 1
+        counts["find path total"] += hops
+        if hops > counts["longest find path"]:
+            counts["longest find path"] = hops
+        return root
+
+    def union(self, a, b):
+        """Join the sets of a and b; False if they were already one set."""
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return False
+        rank = self.rank
+        if rank[ra] < rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if rank[ra] == rank[rb]:
+            rank[ra] += 1
+        self.counts["unions"] += 1
+        return True
+
+
+def sort_edges(edges):
+    """
+    Indexes of the edges by weight, sorted once in bulk: NumPy argsort when
+    NumPy is installed, otherwise sorted() over the weight column. Returns
+    (order as array('l'), method name).
+    """
+    if np is not None:
+        weight = np.frombuffer(edges.weight, dtype="f8" if edges.weight.typecode == "d" else "i8")
+        order = np.argsort(weight, kind="stable").astype(f"i{array('l').itemsize}")
+        return array("l", order.tobytes()), "NumPy argsort"
+    return array("l", sorted(range(len(edges)), key=edges.weight.__getitem__)), "sorted()"
+
+
+def kruskal_steps(edges, tree, counts):
+    """
+    Kruskal over EdgeArrays (each undirected edge once). Yields ("sorted",
+    method) after the bulk sort, then ("edge", u, v) for each edge in weight
+    order followed by ("tree_edge", u, v, w) or ("cycle_edge", u, v, w).
+    Stops as soon as the tree has n - 1 edges.
+    """
+    n = edges.n
+    src, dst, weight = edges.src, edges.dst, edges.weight
+    order, method = sort_edges(edges)
+    uf = UnionFind(n)
+    counts["union-find"] = uf.counts
+    yield ("sorted", method)
+    for e in order:
+        if len(tree) == n - 1:
+            return
+        u, v, w = src[e], dst[e], weight[e]
+        counts["edges scanned"] += 1
+        yield ("edge", u, v)
+        if uf.union(u, v):
+            tree.append((u, v, w))
+            yield ("tree_edge", u, v, w)
+        else:
+            yield ("cycle_edge", u, v, w)
+
+
+def kruskal_arrays(edges):
+    """Run Kruskal to the end on EdgeArrays; returns (tree edges, total weight, counts)."""
+    tree = []
+    counts = {"edges scanned": 0}
+    for event in kruskal_steps(edges, tree, counts):
+        if event[0] == "sorted":
+            counts["sort"] = event[1]
+    return tree, sum(w for _, _, w in tree), counts
+
+
+def kruskal(graph):
+    """Kruskal on an undirected weighted adjacency dict."""
+    return kruskal_arrays(EdgeArrays.from_weighted(graph, undirected=True))
+
+
+def random_edge_arrays(n, m, seed=None, max_weight=1000):
+    """m random weighted edges on n nodes straight into EdgeArrays (no adjacency dicts)."""
+    rng = random.Random(seed)
+    src, dst = array("l"), array("l")
+    weight = array("q")
+    for _ in range(m):
+        u = rng.randrange(n)
+        v = rng.randrange(n - 1)
+        src.append(u)
+        dst.append(v if v < u else v + 1)   # No self loops
+        weight.append(rng.randint(1, max_weight))
+    return EdgeArrays(n, src, dst, weight)
+
+
+def undirected(adjacency, weights):
+    """Weighted undirected graph from a generator's adjacency and random_weights()."""
+    pairs = {}
+    for u, nbrs in adjacency.items():
+        for v in nbrs:
+            if u != v:
+                key = (min(u, v), max(u, v))
+                pairs[key] = min(weights[(u, v)], pairs.get(key, weights[(u, v)]))
+    graph = {u: [] for u in adjacency}
+    for (u, v), w in sorted(pairs.items()):
+        graph[u].append((v, w))
+        graph[v].append((u, w))
+    return graph
+
+
+def flatten_counts(counts):
+    """An algorithm's own counters and its heap's / union-find's counters in one dict."""
+    flat = {k: v for k, v in counts.items() if k not in ("heap", "union-find")}
+    flat.update(counts.get("heap", {}))
+    flat.update(counts.get("union-find", {}))
+    return flat
+
+
+def _compare_prim(args):
+    adjacency = graph_generators.erdos_renyi(args.n, args.p, args.seed, directed=False)
+    graph = undirected(adjacency, graph_generators.random_weights(adjacency, args.seed, 1, args.max_weight))
+    print(f"G({args.n}, {args.p}): {sum(len(nbrs) for nbrs in graph.values()) // 2} edges")
+    for variant in PRIM_VARIANTS:
+        start = time.perf_counter()
+        tree, total, counts = prim(graph, variant)
+        seconds = time.perf_counter() - start
+        ops = ", ".join(f"{k}={v}" for k, v in flatten_counts(counts).items())
+        print(f"{variant:<36}{seconds:>7.2f}s  weight={total}  {ops}")
+
+
+def _run_kruskal(args):
+    edges = random_edge_arrays(args.n, args.edges, args.seed, args.max_weight)
+    print(f"{args.n} nodes, {len(edges)} random edges")
+    start = time.perf_counter()
+    tree, total, counts = kruskal_arrays(edges)
+    seconds = time.perf_counter() - start
+    flat = flatten_counts(counts)
+    average = flat["find path total"] / max(1, flat["finds"])
+    print(f"Kruskal ({flat['sort']}) {seconds:.2f}s  tree edges={len(tree)}  weight={total}")
+    print(f"  edges scanned={flat['edges scanned']}  finds={flat['finds']}  unions={flat['unions']}  "
+          f"average find path={average:.3f}  longest find path={flat['longest find path']}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the MST algorithms on random graphs.")
+    parser.add_argument("--algorithm", choices=("prim", "kruskal"), default="prim",
+                        help="prim compares its two variants on a dense G(n,p); "
+                             "kruskal runs on --edges random edges")
+    parser.add_argument("--n", type=int, default=1500)
+    parser.add_argument("--p", type=float, default=0.5, help="edge probability for prim")
+    parser.add_argument("--edges", type=int, default=1000000, help="edge count for kruskal")
+    parser.add_argument("--max-weight", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.algorithm == "prim":
+        _compare_prim(args)
+    else:
+        _run_kruskal(args)
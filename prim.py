@@ -0,0 +1,93 @@
+# prim.py
+import tkinter as tk
+from tkinter import ttk
+import time
+from graph_tab import WeightedGraphTab
+import mst
+
+
+class PrimTab(WeightedGraphTab):
+    """
+    Prim's algorithm on the weighted edge editor, with every edge used both
+    ways. "Compare Both" runs the lazy (heap of edges) and eager (indexed
+    heap with decrease-key) variants on the current graph without animation
+    and shows their heap work side by side.
+    """
+
+    TITLE = "Prim's Algorithm"
+    DIRECTED = False
+
+    def build_options(self, frame):
+        ttk.Label(frame, text="Variant:", style="Dark.TLabel").pack(side="left")
+        self.variant_var = tk.StringVar(value=next(iter(mst.PRIM_VARIANTS)))
+        ttk.Combobox(frame, textvariable=self.variant_var, state="readonly", width=32,
+                     values=list(mst.PRIM_VARIANTS)).pack(side="left", padx=5)
+        ttk.Button(frame, text="Compare Both", command=self.compare_variants, style="Dark.TButton")\
+            .pack(side="left", padx=5)
+        self.counts = None
+        self.tree = []
+
+    def make_steps(self, start, goal):
+        self.tree = []
+        self.counts = {"skipped edges": 0}
+        return mst.PRIM_VARIANTS[self.variant_var.get()](self.graph, self.tree, self.counts, start)
+
+    def handle_event(self, event):
+        if event[0] == "visit":
+            _, u = event
+            self._color_node(u, "lightgreen")
+            self._halo_node(None)
+            self._log_step(f"Add {self.node_labels[u]} to the tree.")
+        elif event[0] == "candidate":
+            _, u, v, w = event
+            self._set_node_note(v, str(w))
+            self._color_node(v, "khaki")
+            self._log_step(f"Edge {self.node_labels[u]} – {self.node_labels[v]} (weight {w}) "
+                           f"goes on the heap.")
+        elif event[0] == "tree_edge":
+            _, u, v, w = event
+            self._set_edge_color(u, v, "green", width=3)
+            self._log_step(f"Cheapest edge out of the tree: {self.node_labels[u]} – "
+                           f"{self.node_labels[v]} (weight {w}).")
+        else:
+            super().handle_event(event)
+
+    def on_complete(self):
+        tree_pairs = {(min(u, v), max(u, v)) for u, v, _ in self.tree}
+        for (i, j), line_id in self.edge_lines.items():
+            if (min(i, j), max(i, j)) not in tree_pairs:
+                self.canvas.itemconfig(line_id, fill="lightgray", width=1)
+        for idx in range(self.num_nodes):
+            self._color_node(idx, "darkgreen")
+        total = sum(w for _, _, w in self.tree)
+        components = self.num_nodes - len(self.tree)
+        forest = f" ({components} components, so a spanning forest)" if components > 1 else ""
+        self._log_step(f"Prim complete! {len(self.tree)} edges, total weight {total}{forest}.")
+
+    def stats_text(self):
+        if self.counts is None:
+            return ""
+        counts = ", ".join(f"{k}: {v}" for k, v in mst.flatten_counts(self.counts).items())
+        return f"{self.variant_var.get()} — {counts}"
+
+    def compare_variants(self):
+        """Run both variants headless on the current graph and list their counters."""
+        if not self.build_indexed_adjacency() or self.num_nodes < 1:
+            return
+        lines = []
+        for variant in mst.PRIM_VARIANTS:
+            began = time.perf_counter()
+            _, total, counts = mst.prim(self.graph, variant)
+            seconds = time.perf_counter() - began
+            ops = ", ".join(f"{k}: {v}" for k, v in mst.flatten_counts(counts).items())
+            lines.append(f"{variant} — {seconds:.3f} s, weight {total}, {ops}")
+        self.stats_var.set("\n".join(lines))
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Prim's Algorithm")
+    tab = PrimTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
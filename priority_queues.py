@@ -0,0 +1,183 @@
+# priority_queues.py
+"""
+Min-priority queues for the weighted graph tabs (Dijkstra, Prim, A*, ...).
+
+All engines share one interface so an algorithm can swap them freely:
+    q.update(item, priority)   insert, or lower the priority of a queued item
+    q.pop() -> (item, priority) smallest priority first
+    bool(q) / len(q)           anything left?
+and count their work in ``q.counts`` (pushes, pops, decrease-keys, ...).
+"""
+import heapq
+
+
+class LazyHeapQueue:
+    """
+    heapq with lazy deletion: a lower priority is simply pushed again and the
+    old entry is skipped ("stale") when it reaches the top.
+    """
+
+    def __init__(self):
+        self.heap = []
+        self.best = {}        # item -> best priority pushed so far (while queued)
+        self.tiebreak = 0     # Keeps entries comparable without comparing items
+        self.counts = {"push": 0, "pop": 0, "stale pop": 0}
+
+    def update(self, item, priority):
+        if item in self.best and self.best[item] <= priority:
+            return
+        self.best[item] = priority
+        self.tiebreak += 1
+        heapq.heappush(self.heap, (priority, self.tiebreak, item))
+        self.counts["push"] += 1
+
+    def pop(self):
+        while self.heap:
+            priority, _, item = heapq.heappop(self.heap)
+            if self.best.get(item) == priority:
+                del self.best[item]
+                self.counts["pop"] += 1
+                return item, priority
+            self.counts["stale pop"] += 1
+        raise IndexError("pop from an empty priority queue")
+
+    def __len__(self):
+        return len(self.best)
+
+
+class IndexedBinaryHeap:
+    """
+    Binary heap that knows where every item sits, so a lower priority is a
+    real decrease-key (sift up in place) and no stale entries are created.
+    """
+
+    def __init__(self):
+        self.items = []       # heap order
+        self.keys = []        # priority of items[i]
+        self.position = {}    # item -> index in items
+        self.counts = {"push": 0, "pop": 0, "decrease-key": 0, "swap": 0}
+
+    def update(self, item, priority):
+        if item in self.position:
+            i = self.position[item]
+            if priority >= self.keys[i]:
+                return
+            self.keys[i] = priority
+            self.counts["decrease-key"] += 1
+            self._sift_up(i)
+            return
+        self.items.append(item)
+        self.keys.append(priority)
+        self.position[item] = len(self.items) - 1
+        self.counts["push"] += 1
+        self._sift_up(len(self.items) - 1)
+
+    def pop(self):
+        if not self.items:
+            raise IndexError("pop from an empty priority queue")
+        item, priority = self.items[0], self.keys[0]
+        last_item, last_key = self.items.pop(), self.keys.pop()
+        del self.position[item]
+        if self.items:
+            self.items[0], self.keys[0] = last_item, last_key
+            self.position[last_item] = 0
+            self._sift_down(0)
+        self.counts["pop"] += 1
+        return item, priority
+
+    def __len__(self):
+        return len(self.items)
+
+    def _swap(self, i, j):
+        items, keys = self.items, self.keys
+        items[i], items[j] = items[j], items[i]
+        keys[i], keys[j] = keys[j], keys[i]
+        self.position[items[i]] = i
+        self.position[items[j]] = j
+        self.counts["swap"] += 1
+
+    def _sift_up(self, i):
+        keys = self.keys
+        while i > 0:
+            parent = (i - 1) // 2
+            if keys[i] < keys[parent]:
+                self._swap(i, parent)
+                i = parent
+            else:
+                return
+
+    def _sift_down(self, i):
+        keys = self.keys
+        n = len(keys)
+        while True:
+            child = 2 * i + 1
+            if child >= n:
+                return
+            if child + 1 < n and keys[child + 1] < keys[child]:
+                child += 1
+            if keys[child] < keys[i]:
+                self._swap(i, child)
+                i = child
+            else:
+                return
+
+
+class BucketQueue:
+    """
+    Dial's bucket queue for small non-negative integer priorities that never
+    go below the last one popped (true for Dijkstra). With edge weights of at
+    most max_weight, max_weight + 1 circular buckets are enough. Lowered
+    priorities leave a stale entry behind, like the lazy heap.
+    """
+
+    def __init__(self, max_weight):
+        self.size = max_weight + 1
+        self.buckets = [[] for _ in range(self.size)]
+        self.best = {}
+        self.cursor = 0       # Smallest priority that can still be in the queue
+        self.counts = {"push": 0, "pop": 0, "stale pop": 0, "bucket scan": 0}
+
+    def update(self, item, priority):
+        if priority != int(priority) or priority < self.cursor:
+            raise ValueError("bucket queue needs integer priorities >= the last one popped")
+        if priority - self.cursor >= self.size:
+            raise ValueError(f"priority {priority} is more than {self.size - 1} past the last pop")
+        if item in self.best and self.best[item] <= priority:
+            return
+        self.best[item] = priority
+        self.buckets[int(priority) % self.size].append((item, priority))
+        self.counts["push"] += 1
+
+    def pop(self):
+        if not self.best:
+            raise IndexError("pop from an empty priority queue")
+        while True:
+            bucket = self.buckets[self.cursor % self.size]
+            while bucket:
+                item, priority = bucket.pop()
+                if self.best.get(item) == priority:
+                    del self.best[item]
+                    self.counts["pop"] += 1
+                    return item, priority
+                self.counts["stale pop"] += 1
+            self.cursor += 1
+            self.counts["bucket scan"] += 1
+
+    def __len__(self):
+        return len(self.best)
+
+
+QUEUE_ENGINES = ("heapq (lazy deletion)", "Indexed binary heap", "Bucket queue (Dial)")
+
+
+def make_queue(name, max_weight=None):
+    """Build the named queue engine (the bucket queue needs the largest edge weight)."""
+    if name == "heapq (lazy deletion)":
+        return LazyHeapQueue()
+    if name == "Indexed binary heap":
+        return IndexedBinaryHeap()
+    if name == "Bucket queue (Dial)":
+        if max_weight is None:
+            raise ValueError("the bucket queue needs the largest edge weight")
+        return BucketQueue(int(max_weight))
+    raise KeyError(name)
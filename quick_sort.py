@@ -1,7 +1,14 @@
 import tkinter as tk
 from tkinter import ttk
+import math
+from workload_picker import WorkloadPicker
+import workloads
 
 class QuickSortTab(ttk.Frame):
+    # Introsort insertion-sorts ranges smaller than this (kept small so short
+    # arrays still show some partitions)
+    INSERTION_CUTOFF = 8
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -18,13 +25,20 @@ class QuickSortTab(ttk.Frame):
         #######################################################################
         self.entries = []
         self.data = []
-        # Each snapshot now includes sorted_indexes: (array_snapshot, pivot_index, comment, low, high, subarr, sorted_indexes)
+        # Each snapshot now includes sorted_indexes and the row kind:
+        # (array_snapshot, pivot_index, comment, low, high, subarr, sorted_indexes, kind)
+        # kind is "partition", "heapsort" or "insertion" (introsort fallbacks), or None
         self.partitions = []
         self.current_partition_index = 0
         self.drawn_rows = 0
         self.current_delay = 1000
         self.paused = False
         self.reveal_delay = 1200
+        # The headless engine turns this off: partitions then only count steps
+        # instead of storing a full array copy per snapshot.
+        self.record_snapshots = True
+        # Introsort: heapsort past 2*log2(n) recursion depth, insertion sort on small ranges
+        self.introsort = False
 
         #######################################################################
         #  Input Section
@@ -38,6 +52,9 @@ class QuickSortTab(ttk.Frame):
         self.num_entry.grid(row=0, column=1, padx=5, pady=5)
         ttk.Button(self.input_frame, text="Generate Fields", command=self.generate_input_fields)\
             .grid(row=0, column=2, padx=5, pady=5)
+        # Seeded input distributions (uses the number of elements above)
+        self.workload_picker = WorkloadPicker(self.input_frame, on_fill=self.fill_workload)
+        self.workload_picker.grid(row=1, column=0, columnspan=3, pady=5)
 
         #######################################################################
         #  Array Input Frame
@@ -61,6 +78,11 @@ class QuickSortTab(ttk.Frame):
         self.pause_play_button = ttk.Button(self.speed_frame, text="Pause", command=self.toggle_pause)
         self.pause_play_button.grid(row=1, column=0, columnspan=3, padx=5, pady=5)
 
+        self.introsort_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(self.speed_frame, text="Introsort (heapsort past depth 2·log2 n, insertion sort on small ranges)",
+                        variable=self.introsort_var)\
+            .grid(row=2, column=0, columnspan=3, padx=5, pady=5)
+
         #######################################################################
         #  Visualization Canvas
         #######################################################################
@@ -97,32 +119,28 @@ class QuickSortTab(ttk.Frame):
         ttk.Button(button_frame, text="Start Quick Sort", command=self.start_sort)\
             .grid(row=0, column=1, padx=5, pady=5)
 
+    def fill_workload(self):
+        """Generate the input fields and fill them from the chosen workload."""
+        self.generate_input_fields()
+        values = self.workload_picker.values(len(self.entries))
+        for entry, value in zip(self.entries, values):
+            entry.insert(0, str(value))
+
     def shuffle_array(self):
-        """Shuffle the values in the input fields."""
-        import random
-        
+        """Shuffle the values in the input fields (seeded by the workload picker)."""
         # Check if there are any entries
         if not self.entries:
             return
-        
-        try:
-            # Get all the values from entries
-            values = [e.get() for e in self.entries]
-            
-            # Shuffle the values
-            random.shuffle(values)
-            
-            # Update the entries with shuffled values
-            for entry, value in zip(self.entries, values):
-                entry.delete(0, tk.END)
-                entry.insert(0, value)
-            
-            # Show a preview of the shuffle
-            self.preview_shuffle(values)
-            
-        except Exception as e:
-            # Handle any errors
-            print(f"Error shuffling: {e}")
+
+        values = workloads.shuffle([e.get() for e in self.entries], self.workload_picker.seed())
+
+        # Update the entries with shuffled values
+        for entry, value in zip(self.entries, values):
+            entry.delete(0, tk.END)
+            entry.insert(0, value)
+
+        # Show a preview of the shuffle
+        self.preview_shuffle(values)
 
     def preview_shuffle(self, values):
         """Show a preview of the shuffled array."""
@@ -183,17 +201,18 @@ class QuickSortTab(ttk.Frame):
         self.drawn_rows = 0
         self.current_partition_index = 0
         # Initial snapshot with empty sorted_indexes
-        self.partitions.append((self.data[:], None, "Initial array", 0, len(self.data)-1, [], set()))
+        self.partitions.append((self.data[:], None, "Initial array", 0, len(self.data)-1, [], set(), None))
         
         # Create a global set to track all sorted indices
         self.all_sorted_indices = set()
         
-        # Start QuickSort with an empty set of sorted indexes
-        self.quick_sort_inplace(0, len(self.data)-1, set())
+        # Start QuickSort (or introsort) with an empty set of sorted indexes
+        self.introsort = self.introsort_var.get()
+        self.sort_all()
         
         # Final snapshot with all indices as sorted
         all_indices = set(range(len(self.data)))
-        self.partitions.append((self.data[:], None, "Sorted array", 0, len(self.data)-1, [], all_indices))
+        self.partitions.append((self.data[:], None, "Sorted array", 0, len(self.data)-1, [], all_indices, None))
         
         # Dynamically resize the canvas based on the number of partitions
         self.adjust_canvas_height()
@@ -219,6 +238,15 @@ class QuickSortTab(ttk.Frame):
     ###########################################################################
     #  Quicksort
     ###########################################################################
+    def sort_all(self):
+        """Sort self.data with plain quicksort or, if self.introsort is set, introsort."""
+        if self.introsort:
+            n = len(self.data)
+            depth_limit = 2 * int(math.log2(n)) if n > 0 else 0
+            self.introsort_inplace(0, n - 1, depth_limit)
+        else:
+            self.quick_sort_inplace(0, len(self.data) - 1, set())
+
     def quick_sort_inplace(self, low, high, sorted_indexes):
         if low < high:
             pivot_pos = self.partition(low, high, sorted_indexes)
@@ -253,6 +281,13 @@ class QuickSortTab(ttk.Frame):
         # Finally move pivot into its correct place
         self.data[store_index], self.data[high] = self.data[high], self.data[store_index]
 
+        # Mark ONLY the pivot as sorted
+        self.all_sorted_indices.add(store_index)
+
+        if not self.record_snapshots:
+            self.partitions.append(None)
+            return store_index
+
         # Build subarray for snapshot
         subarr = (self.data[low:store_index]
                     + [self.data[store_index]]
@@ -261,9 +296,6 @@ class QuickSortTab(ttk.Frame):
         for x in range(low, high+1):
             if x != store_index:
                 arr_snap[x] = None
-
-        # Mark ONLY the pivot as sorted
-        self.all_sorted_indices.add(store_index)
         
         # Remove special case checks - only track pivots
         
@@ -286,10 +318,93 @@ class QuickSortTab(ttk.Frame):
             low,
             high,
             subarr,
-            self.all_sorted_indices.copy()  # Only contains pivots now
+            self.all_sorted_indices.copy(),  # Only contains pivots now
+            "partition"
         ))
         return store_index
 
+    ###########################################################################
+    #  Introsort
+    ###########################################################################
+    def introsort_inplace(self, low, high, depth_limit):
+        """
+        Quicksort that gives up on bad pivots: once depth_limit partitions have
+        been stacked on this range it is heapsorted, and ranges smaller than
+        INSERTION_CUTOFF are insertion sorted. Worst case O(n log n).
+        """
+        size = high - low + 1
+        if size <= 1:
+            return
+        if size < self.INSERTION_CUTOFF:
+            self.insertion_sort_range(low, high)
+            self.fallback_snapshot(low, high, "insertion",
+                                   f"Insertion sort\nsize {size} < {self.INSERTION_CUTOFF}")
+            return
+        if depth_limit == 0:
+            self.heapsort_range(low, high)
+            self.fallback_snapshot(low, high, "heapsort",
+                                   "Heapsort\ndepth limit hit")
+            return
+
+        pivot_pos = self.partition(low, high, self.all_sorted_indices)
+        self.introsort_inplace(low, pivot_pos - 1, depth_limit - 1)
+        self.introsort_inplace(pivot_pos + 1, high, depth_limit - 1)
+
+    def insertion_sort_range(self, low, high):
+        data = self.data
+        for i in range(low + 1, high + 1):
+            key = data[i]
+            j = i - 1
+            while j >= low and key < data[j]:
+                data[j + 1] = data[j]
+                j -= 1
+            data[j + 1] = key
+
+    def heapsort_range(self, low, high):
+        data = self.data
+        size = high - low + 1
+
+        def sift_down(root, end):
+            # Max-heap over data[low..low+end), children of i are 2i+1 / 2i+2
+            while True:
+                child = 2 * root + 1
+                if child >= end:
+                    return
+                if child + 1 < end and data[low + child] < data[low + child + 1]:
+                    child += 1
+                if data[low + root] < data[low + child]:
+                    data[low + root], data[low + child] = data[low + child], data[low + root]
+                    root = child
+                else:
+                    return
+
+        for start in range(size // 2 - 1, -1, -1):
+            sift_down(start, size)
+        for end in range(size - 1, 0, -1):
+            data[low], data[low + end] = data[low + end], data[low]
+            sift_down(0, end)
+
+    def fallback_snapshot(self, low, high, kind, comment):
+        """Record a whole range finished by a fallback sort as its own row."""
+        self.all_sorted_indices.update(range(low, high + 1))
+        if not self.record_snapshots:
+            self.partitions.append(None)
+            return
+        subarr = self.data[low:high+1]
+        arr_snap = self.data[:]
+        for x in range(low, high+1):
+            arr_snap[x] = None
+        self.partitions.append((
+            arr_snap,
+            None,
+            comment,
+            low,
+            high,
+            subarr,
+            self.all_sorted_indices.copy(),
+            kind
+        ))
+
     def median_of_three_subarray(self, low, high):
         """
         Return the index (in the global 'self.data') of the median
@@ -317,13 +432,13 @@ class QuickSortTab(ttk.Frame):
         if self.paused or self.current_partition_index >= len(self.partitions):
             return
         
-        snap, pivot_i, comment, low, high, subarr, sorted_indexes = self.partitions[self.current_partition_index]
+        snap, pivot_i, comment, low, high, subarr, sorted_indexes, kind = self.partitions[self.current_partition_index]
         self.current_partition_index += 1
         row_index = self.drawn_rows
         self.drawn_rows += 1
         
         # Draw the base row
-        self.draw_row(row_index, snap, pivot_i, comment, low, high, subarr, sorted_indexes)
+        self.draw_row(row_index, snap, pivot_i, comment, low, high, subarr, sorted_indexes, kind)
         
         # Setup the reveals but track them so we can pause mid-animation
         self.pending_reveals = []
@@ -376,7 +491,7 @@ class QuickSortTab(ttk.Frame):
         # Update canvas height
         self.canvas.config(height=canvas_height)
 
-    def draw_row(self, row_index, array_snapshot, pivot_i, comment, low, high, subarr, sorted_indexes):
+    def draw_row(self, row_index, array_snapshot, pivot_i, comment, low, high, subarr, sorted_indexes, kind=None):
         ch = int(self.canvas["height"])
         cw = int(self.canvas["width"])
         total_rows = len(self.partitions)
@@ -422,16 +537,24 @@ class QuickSortTab(ttk.Frame):
             box_width = 5
 
         # Highlight the subarray [low..high] with a rectangle
-        if pivot_i is not None:
+        # (dashed orange/blue when an introsort fallback finished the range)
+        fallback_colors = {"heapsort": "orange", "insertion": "blue"}
+        if pivot_i is not None or kind in fallback_colors:
             rectangle_pad = 4  # Slightly smaller padding
             sub_left = left_margin + low * (box_width + box_gap) - rectangle_pad
             sub_right = left_margin + high * (box_width + box_gap) + box_width + rectangle_pad
             sub_top = y_start - rectangle_pad
             sub_bottom = y_start + row_height + rectangle_pad
-            self.canvas.create_rectangle(
-                sub_left, sub_top, sub_right, sub_bottom,
-                outline="black", width=2  # Make the outline slightly thinner
-            )
+            if kind in fallback_colors:
+                self.canvas.create_rectangle(
+                    sub_left, sub_top, sub_right, sub_bottom,
+                    outline=fallback_colors[kind], width=3, dash=(6, 3)
+                )
+            else:
+                self.canvas.create_rectangle(
+                    sub_left, sub_top, sub_right, sub_bottom,
+                    outline="black", width=2  # Make the outline slightly thinner
+                )
 
         # Render the array boxes
         self.row_boxes = []
@@ -0,0 +1,501 @@
+# shortest_paths.py
+"""
+Shortest-path algorithms shared by the Shortest Path tabs and headless runs.
+
+Graphs use the weighted adjacency form of the graph tabs:
+    graph[u] -> list of (v, weight)   (directed edges u -> v)
+The *_steps generators yield the same event vocabulary as the BFS/DFS tabs
+("visit", "edge", "completed") plus "relax" when a distance improves.
+
+    python shortest_paths.py --rows 316 --cols 316 --seed 1
+    python shortest_paths.py --algorithm bellman-ford --rows 100 --cols 100
+    python shortest_paths.py --algorithm a-star --rows 316 --cols 316
+    python shortest_paths.py --algorithm a-star --maze --rows 301 --cols 301
+    python shortest_paths.py --algorithm floyd-warshall --rows 30 --cols 30
+"""
+import argparse
+import math
+import time
+from collections import deque
+
+import graph_generators
+from graph_arrays import CSR, EdgeArrays, np
+from priority_queues import QUEUE_ENGINES, LazyHeapQueue, make_queue
+
+
+def max_edge_weight(graph):
+    return max((w for nbrs in graph.values() for _, w in nbrs), default=0)
+
+
+###############################################################################
+# Dijkstra
+###############################################################################
+def dijkstra_steps(graph, source, queue, dist, parent):
+    """
+    Dijkstra with any engine from priority_queues. Fills dist/parent (dicts
+    or lists indexed by node) in place and yields:
+      ("visit", u)           u popped, its distance is final
+      ("edge", u, v)         edge u -> v examined
+      ("relax", u, v, d)     v's distance lowered to d through u
+      ("completed", u)       all of u's edges examined
+    """
+    dist[source] = 0
+    queue.update(source, 0)
+    settled = set()
+    while queue:
+        u, d = queue.pop()
+        if u in settled:
+            continue
+        settled.add(u)
+        yield ("visit", u)
+        for v, w in graph[u]:
+            yield ("edge", u, v)
+            nd = d + w
+            if v not in settled and nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                queue.update(v, nd)
+                yield ("relax", u, v, nd)
+        yield ("completed", u)
+
+
+def dijkstra(graph, source, engine="heapq (lazy deletion)"):
+    """Run Dijkstra to the end; returns (dist, parent, queue operation counts)."""
+    if any(w < 0 for nbrs in graph.values() for _, w in nbrs):
+        raise ValueError("Dijkstra needs non-negative edge weights")
+    queue = make_queue(engine, max_edge_weight(graph))
+    dist = {u: math.inf for u in graph}
+    parent = {u: None for u in graph}
+    for _ in dijkstra_steps(graph, source, queue, dist, parent):
+        pass
+    return dist, parent, queue.counts
+
+
+###############################################################################
+# Bellman-Ford (on the shared edge arrays)
+###############################################################################
+def _find_cycle(parent, v, n):
+    """
+    Walk parent pointers from v (which sits on or below a negative cycle);
+    return the cycle, or None if the walk reaches a root instead.
+    """
+    for _ in range(n):
+        v = parent[v]
+        if v is None:
+            return None
+    cycle = [v]
+    u = parent[v]
+    while u != v:
+        cycle.append(u)
+        u = parent[u]
+    cycle.reverse()
+    return cycle
+
+
+def bellman_ford_steps(edges, source, dist, parent, counts):
+    """
+    Pass loop over EdgeArrays that stops as soon as a pass changes nothing.
+    Yields ("pass", k) at the start of each pass, ("edge", u, v) and
+    ("relax", u, v, d) as in Dijkstra, and ("negative_cycle", nodes) if the
+    n-th pass still improves something.
+    """
+    n = edges.n
+    src, dst, weight = edges.src, edges.dst, edges.weight
+    dist[source] = 0
+    for k in range(1, n + 1):
+        counts["passes"] += 1
+        yield ("pass", k)
+        changed = None
+        for e in range(len(src)):
+            u = src[e]
+            if dist[u] == math.inf:
+                continue
+            v = dst[e]
+            counts["edge checks"] += 1
+            yield ("edge", u, v)
+            nd = dist[u] + weight[e]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                changed = v
+                counts["relaxations"] += 1
+                yield ("relax", u, v, nd)
+        if changed is None:
+            return
+    yield ("negative_cycle", _find_cycle(parent, changed, n))
+
+
+def spfa_steps(csr, source, dist, parent, counts):
+    """
+    Queue-based Bellman-Ford (SPFA): only nodes whose distance just dropped
+    are scanned again. A node whose current path has n edges means a
+    negative cycle (the cycle is reported once the parent pointers close it).
+    Yields ("visit", u) when u is taken off the queue, then the usual
+    "edge"/"relax"/"completed" events and possibly ("negative_cycle", nodes).
+    """
+    n = csr.n
+    offsets, targets, weights = csr.offsets, csr.targets, csr.weights
+    length = [0] * n     # Edges on each node's current path from the source
+    queued = [False] * n
+    dist[source] = 0
+    queue = deque([source])
+    queued[source] = True
+    while queue:
+        u = queue.popleft()
+        queued[u] = False
+        counts["queue pops"] += 1
+        yield ("visit", u)
+        for k in range(offsets[u], offsets[u + 1]):
+            v = targets[k]
+            counts["edge checks"] += 1
+            yield ("edge", u, v)
+            nd = dist[u] + weights[k]
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                counts["relaxations"] += 1
+                yield ("relax", u, v, nd)
+                length[v] = length[u] + 1
+                if length[v] >= n:
+                    cycle = _find_cycle(parent, v, n)
+                    if cycle is not None:
+                        yield ("negative_cycle", cycle)
+                        return
+                if not queued[v]:
+                    queued[v] = True
+                    queue.append(v)
+        yield ("completed", u)
+
+
+def bellman_ford_numpy_steps(edges, source, dist, parent, counts, detail=True):
+    """
+    Each pass relaxes every edge at once with NumPy (from the distances of
+    the previous pass). Yields ("pass", k), then, with detail=True, one
+    ("relax", u, v, d) per node the pass improved. dist/parent are filled
+    in as the passes go when detail=True, otherwise once at the end.
+    """
+    if np is None:
+        raise ImportError("the vectorized Bellman-Ford needs NumPy")
+    n = edges.n
+    src, dst, weight = edges.as_numpy()
+    d = np.full(n, np.inf)
+    p = np.full(n, -1, dtype=np.int64)
+    d[source] = 0
+    cycle = None
+    for k in range(1, n + 1):
+        counts["passes"] += 1
+        counts["edge checks"] += len(src)
+        yield ("pass", k)
+        candidate = d[src] + weight
+        better = candidate < d[dst]
+        if not better.any():
+            break
+        idx = np.flatnonzero(better)
+        # Best candidate per target node: sort by (target, candidate), keep the first of each target
+        order = idx[np.lexsort((candidate[idx], dst[idx]))]
+        targets, first = np.unique(dst[order], return_index=True)
+        winners = order[first]
+        d[targets] = candidate[winners]
+        p[targets] = src[winners]
+        counts["relaxations"] += len(targets)
+        if detail:
+            for v, e in zip(targets.tolist(), winners.tolist()):
+                dist[v] = d[v].item()
+                parent[v] = int(src[e])
+                yield ("relax", parent[v], v, dist[v])
+        if k == n:
+            cycle = int(targets[0])
+    _copy_back(d, p, dist, parent)
+    if cycle is not None:
+        yield ("negative_cycle", _find_cycle(parent, cycle, n))
+
+
+def _copy_back(d, p, dist, parent):
+    """Write NumPy results into the caller's dist/parent, keeping integer distances integers."""
+    integral = bool(np.all(np.isinf(d) | (d == np.floor(d))))
+    for v, (dv, pv) in enumerate(zip(d.tolist(), p.tolist())):
+        dist[v] = int(dv) if integral and dv != math.inf else dv
+        parent[v] = pv if pv >= 0 else None
+
+
+BELLMAN_FORD_MODES = ("Early-exit passes", "SPFA queue", "NumPy vectorized passes")
+
+
+def bellman_ford_stepper(graph, source, mode, dist, parent, counts, detail=True):
+    """Build the step generator for one mode from a weighted adjacency dict."""
+    if mode == "Early-exit passes":
+        return bellman_ford_steps(EdgeArrays.from_weighted(graph), source, dist, parent, counts)
+    if mode == "SPFA queue":
+        return spfa_steps(CSR.from_weighted(graph), source, dist, parent, counts)
+    if mode == "NumPy vectorized passes":
+        return bellman_ford_numpy_steps(EdgeArrays.from_weighted(graph), source, dist, parent,
+                                        counts, detail)
+    raise KeyError(mode)
+
+
+def bellman_ford(graph, source, mode="Early-exit passes"):
+    """
+    Run one Bellman-Ford mode to the end. Returns (dist, parent, counts,
+    cycle) where cycle is a list of nodes on a negative cycle, or None.
+    """
+    n = len(graph)
+    dist = [math.inf] * n
+    parent = [None] * n
+    counts = {"passes": 0, "queue pops": 0, "edge checks": 0, "relaxations": 0}
+    cycle = None
+    for event in bellman_ford_stepper(graph, source, mode, dist, parent, counts, detail=False):
+        if event[0] == "negative_cycle":
+            cycle = event[1]
+    return dist, parent, counts, cycle
+
+
+###############################################################################
+# A* (graphs whose nodes have (x, y) coordinates)
+###############################################################################
+HEURISTICS = {
+    "Manhattan": lambda dx, dy: dx + dy,
+    "Euclidean": math.hypot,
+    "Octile": lambda dx, dy: max(dx, dy) + (math.sqrt(2) - 1) * min(dx, dy),
+    "Zero (Dijkstra)": lambda dx, dy: 0,
+}
+
+# Order among frontier entries with equal f = g + h
+TIE_BREAKS = ("Prefer larger g", "Prefer smaller g", "First in, first out", "Last in, first out")
+
+
+def heuristic_scale(graph, coords, heuristic):
+    """
+    Largest s with s * h(u, v) <= weight(u, v) on every edge, so s * h never
+    overestimates (h is a metric, so the bound carries along any path).
+    """
+    h = HEURISTICS[heuristic]
+    scale = math.inf
+    for u, nbrs in graph.items():
+        xu, yu = coords[u]
+        for v, w in nbrs:
+            xv, yv = coords[v]
+            length = h(abs(xu - xv), abs(yu - yv))
+            if length > 0:
+                scale = min(scale, w / length)
+    return 0 if scale == math.inf else max(0, scale)
+
+
+def a_star_steps(graph, coords, source, goal, dist, parent, counts,
+                 heuristic="Manhattan", tie_break="Prefer larger g", scale=None):
+    """
+    A* from source to goal. Besides the Dijkstra events it yields
+    ("reopen", v) when a closed node is reached more cheaply (only possible
+    with an inconsistent heuristic) and ("found", goal) when the goal is
+    expanded. counts gets "expanded", "pushes" and "re-opens".
+    """
+    h = HEURISTICS[heuristic]
+    if scale is None:
+        scale = heuristic_scale(graph, coords, heuristic)
+    gx, gy = coords[goal]
+
+    def estimate(v):
+        x, y = coords[v]
+        return scale * h(abs(x - gx), abs(y - gy))
+
+    def priority(v, g, order):
+        f = g + estimate(v)
+        if tie_break == "Prefer larger g":
+            return (f, -g, order)
+        if tie_break == "Prefer smaller g":
+            return (f, g, order)
+        if tie_break == "Last in, first out":
+            return (f, -order)
+        return (f, order)
+
+    queue = LazyHeapQueue()
+    closed = set()
+    order = 0
+    dist[source] = 0
+    queue.update(source, priority(source, 0, order))
+    counts["pushes"] += 1
+    while queue:
+        u, _ = queue.pop()
+        closed.add(u)
+        counts["expanded"] += 1
+        yield ("visit", u)
+        if u == goal:
+            yield ("found", u)
+            return
+        for v, w in graph[u]:
+            yield ("edge", u, v)
+            nd = dist[u] + w
+            if nd < dist[v]:
+                dist[v] = nd
+                parent[v] = u
+                yield ("relax", u, v, nd)
+                if v in closed:
+                    closed.discard(v)
+                    counts["re-opens"] += 1
+                    yield ("reopen", v)
+                order += 1
+                queue.update(v, priority(v, nd, order))
+                counts["pushes"] += 1
+        yield ("completed", u)
+
+
+def a_star(graph, coords, source, goal, heuristic="Manhattan", tie_break="Prefer larger g"):
+    """Run A* to the goal; returns (path cost or inf, path as a node list, counts)."""
+    n = len(graph)
+    dist = [math.inf] * n
+    parent = [None] * n
+    counts = {"expanded": 0, "pushes": 0, "re-opens": 0}
+    for _ in a_star_steps(graph, coords, source, goal, dist, parent, counts, heuristic, tie_break):
+        pass
+    return dist[goal], path_to(parent, source, goal), counts
+
+
+###############################################################################
+# All pairs: Floyd–Warshall (NumPy)
+###############################################################################
+def floyd_warshall(graph):
+    """
+    All-pairs shortest distances for a weighted graph (negative edges
+    allowed) as an n x n NumPy matrix: one vectorized min-plus update of the
+    whole matrix per intermediate node k. Integer weights come back as an
+    int32 matrix (int64 if the sums could overflow) with that type's largest
+    value meaning "no path"; other weights as float64 with inf.
+    Returns (matrix, no_path, negative_cycle): with a negative cycle the
+    distances through it are not meaningful.
+    """
+    if np is None:
+        raise ImportError("NumPy is not installed")
+    n = len(graph)
+    d = np.full((n, n), np.inf)
+    np.fill_diagonal(d, 0.0)
+    weights = []
+    for u in range(n):
+        for v, w in graph[u]:
+            d[u, v] = min(d[u, v], w)
+            weights.append(w)
+    for k in range(n):
+        np.minimum(d, d[:, k, None] + d[None, k, :], out=d)
+    negative_cycle = bool(n) and bool((np.diagonal(d) < 0).any())
+
+    if not all(isinstance(w, int) for w in weights):
+        return d, math.inf, negative_cycle
+    bound = max((abs(w) for w in weights), default=0) * max(n - 1, 1)
+    dtype = np.int32 if bound < np.iinfo(np.int32).max else np.int64
+    no_path = np.iinfo(dtype).max
+    matrix = np.where(np.isinf(d), no_path, np.nan_to_num(d)).astype(dtype)
+    return matrix, no_path, negative_cycle
+
+
+def path_to(parent, source, goal):
+    """Follow parent pointers back from goal; [] if goal was never reached."""
+    if goal != source and parent[goal] is None:
+        return []
+    path = [goal]
+    while path[-1] != source:
+        path.append(parent[path[-1]])
+    path.reverse()
+    return path
+
+
+def road_grid(rows, cols, seed=None, max_weight=9):
+    """Road-style test graph: an undirected grid with integer weights 1..max_weight."""
+    adjacency = graph_generators.grid_2d(rows, cols)
+    weights = graph_generators.random_weights(adjacency, seed, 1, max_weight)
+    return {u: [(v, weights[(u, v)]) for v in nbrs] for u, nbrs in adjacency.items()}
+
+
+def _compare_dijkstra(graph):
+    reference = None
+    for engine in QUEUE_ENGINES:
+        start = time.perf_counter()
+        dist, _, counts = dijkstra(graph, 0, engine)
+        seconds = time.perf_counter() - start
+        if reference is None:
+            reference = dist
+        same = "" if dist == reference else "  DISTANCES DIFFER"
+        ops = ", ".join(f"{k}={v}" for k, v in counts.items())
+        print(f"{engine:<24}{seconds:>8.2f}s  {ops}{same}")
+
+
+def _compare_bellman_ford(graph):
+    reference = None
+    for mode in BELLMAN_FORD_MODES:
+        if mode == "NumPy vectorized passes" and np is None:
+            print(f"{mode:<24}  skipped (NumPy is not installed)")
+            continue
+        start = time.perf_counter()
+        dist, _, counts, cycle = bellman_ford(graph, 0, mode)
+        seconds = time.perf_counter() - start
+        if reference is None:
+            reference = dist
+        same = "" if dist == reference else "  DISTANCES DIFFER"
+        ops = ", ".join(f"{k}={v}" for k, v in counts.items() if v)
+        note = f"  negative cycle through {len(cycle)} nodes" if cycle else ""
+        print(f"{mode:<24}{seconds:>8.2f}s  {ops}{same}{note}")
+
+
+def _compare_floyd_warshall(graph):
+    start = time.perf_counter()
+    matrix, no_path, _ = floyd_warshall(graph)
+    seconds = time.perf_counter() - start
+    print(f"{'Floyd–Warshall':<24}{seconds:>8.2f}s  {matrix.dtype} matrix, {matrix.nbytes / 1e6:.1f} MB")
+    start = time.perf_counter()
+    same = True
+    for source in range(len(graph)):
+        dist, _, _ = dijkstra(graph, source)
+        same &= all(matrix[source, v] == (no_path if dist[v] == math.inf else dist[v])
+                    for v in range(len(graph)))
+    seconds = time.perf_counter() - start
+    print(f"{'Dijkstra from every node':<24}{seconds:>8.2f}s  "
+          f"{'same distances' if same else 'DISTANCES DIFFER'}")
+
+
+def _compare_a_star(graph, coords, source, goal):
+    for tie_break in TIE_BREAKS[:2]:
+        for heuristic in HEURISTICS:
+            start = time.perf_counter()
+            cost, path, counts = a_star(graph, coords, source, goal, heuristic, tie_break)
+            seconds = time.perf_counter() - start
+            ops = ", ".join(f"{k}={v}" for k, v in counts.items())
+            print(f"{heuristic:<16}{tie_break:<18}{seconds:>7.2f}s  cost={cost}  {ops}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare shortest-path variants on a road-style grid.")
+    parser.add_argument("--algorithm", choices=("dijkstra", "bellman-ford", "a-star", "floyd-warshall"),
+                        default="dijkstra",
+                        help="dijkstra compares the queue engines, bellman-ford the pass modes, "
+                             "a-star the heuristics (corner to corner), floyd-warshall the all-pairs "
+                             "matrix against Dijkstra from every node")
+    parser.add_argument("--rows", type=int, default=316)
+    parser.add_argument("--cols", type=int, default=316)
+    parser.add_argument("--max-weight", type=int, default=None,
+                        help="edge weights are 1..max-weight (default 9; 1 for a-star, since the "
+                             "heuristics are scaled down to the cheapest weight per unit of distance "
+                             "and so cannot beat Dijkstra on random weights)")
+    parser.add_argument("--maze", action="store_true",
+                        help="a-star only: search a seeded unit-step maze (maze.py, 10%% of inner "
+                             "walls knocked out) instead of the grid")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.maze:
+        import maze     # maze -> frontier -> this module
+        grid = maze.maze(args.rows, args.cols, args.seed, loops=0.1)
+        graph = {u: [(v, 1) for v in grid[u]] for u in range(len(grid))}
+        source = grid.cell(1, 1)
+        goal = grid.cell(args.rows - 2 - (args.rows % 2 == 0), args.cols - 2 - (args.cols % 2 == 0))
+        print(f"maze {args.rows}x{args.cols}: {len(graph) - sum(grid.walls)} open cells")
+    else:
+        max_weight = args.max_weight or (1 if args.algorithm == "a-star" else 9)
+        graph = road_grid(args.rows, args.cols, args.seed, max_weight)
+        source, goal = 0, len(graph) - 1
+        print(f"grid {args.rows}x{args.cols}: {len(graph)} nodes, "
+              f"{sum(len(n) for n in graph.values())} directed edges, weights 1..{max_weight}")
+    if args.algorithm == "dijkstra":
+        _compare_dijkstra(graph)
+    elif args.algorithm == "bellman-ford":
+        _compare_bellman_ford(graph)
+    elif args.algorithm == "floyd-warshall":
+        _compare_floyd_warshall(graph)
+    else:
+        _compare_a_star(graph, graph_generators.grid_coords(args.rows, args.cols), source, goal)
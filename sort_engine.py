@@ -0,0 +1,158 @@
+# sort_engine.py
+"""
+Headless sort engine: runs each sorting tab's own step generator with no
+widgets, so one seeded workload can be counted and timed across every tab.
+
+    python sort_engine.py --n 300 --distribution "Nearly sorted" --seed 1
+"""
+import argparse
+import sys
+import time
+
+import workloads
+from bubble_sort import BubbleSortTab
+from selection_sort import SelectionSortTab
+from insertion_sort import InsertionSortTab
+from merge_sort import MergeSortTab
+from quick_sort import QuickSortTab
+
+
+class _Counted:
+    """Wraps one input value and counts every comparison made on it."""
+    __slots__ = ("value",)
+    comparisons = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __lt__(self, other):
+        _Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other):
+        _Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other):
+        _Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other):
+        _Counted.comparisons += 1
+        return self.value >= other.value
+
+    def __eq__(self, other):
+        _Counted.comparisons += 1
+        return self.value == other.value
+
+    def __hash__(self):
+        return hash(self.value)
+
+    def __repr__(self):
+        return repr(self.value)
+
+
+def _bare(tab_class):
+    """A tab with no widgets; the algorithm methods only use plain attributes."""
+    return tab_class.__new__(tab_class)
+
+
+def _drain(steps):
+    """Run a step generator to the end; return (number of steps, last step)."""
+    count, last = 0, None
+    for last in steps:
+        count += 1
+    return count, last
+
+
+###############################################################################
+# One runner per tab: data -> (steps the tab would animate, sorted data)
+###############################################################################
+def _bubble(data):
+    steps, _ = _drain(_bare(BubbleSortTab).bubble_sort(data))
+    return steps, data
+
+
+def _selection(data):
+    steps, _ = _drain(_bare(SelectionSortTab).selection_sort(data))
+    return steps, data
+
+
+def _insertion(data):
+    steps, _ = _drain(_bare(InsertionSortTab).insertion_sort(data))
+    return steps, data
+
+
+def _merge(data):
+    steps, last = _drain(_bare(MergeSortTab).merge_sort_generator(data))
+    return steps, (last["final"] if last else data)
+
+
+def _quick(data, introsort=False):
+    tab = _bare(QuickSortTab)
+    tab.data = data
+    tab.partitions = []
+    tab.all_sorted_indices = set()
+    tab.record_snapshots = False
+    # Bad pivots can recurse once per element
+    sys.setrecursionlimit(max(sys.getrecursionlimit(), 2 * len(data) + 1000))
+    tab.introsort = introsort
+    tab.sort_all()
+    return len(tab.partitions), tab.data
+
+
+def _introsort(data):
+    return _quick(data, introsort=True)
+
+
+ALGORITHMS = {
+    "Bubble Sort": _bubble,
+    "Selection Sort": _selection,
+    "Insertion Sort": _insertion,
+    "Merge Sort": _merge,
+    "Quick Sort": _quick,
+    "Introsort": _introsort,
+}
+
+
+def run(algorithm, data):
+    """
+    Sort a copy of data with one tab's algorithm. Returns a dict with the
+    number of animation steps, value comparisons and wall-clock seconds.
+    """
+    values = [_Counted(v) for v in data]
+    _Counted.comparisons = 0
+    start = time.perf_counter()
+    steps, result = ALGORITHMS[algorithm](values)
+    seconds = time.perf_counter() - start
+    result = [v.value for v in result]
+    return {
+        "algorithm": algorithm,
+        "n": len(data),
+        "steps": steps,
+        "comparisons": _Counted.comparisons,
+        "seconds": seconds,
+        "sorted": result == sorted(data),
+    }
+
+
+def benchmark(n, distribution, seed=None, algorithms=None):
+    """Run every (or the chosen) algorithm on the same seeded workload."""
+    data = workloads.generate(distribution, n, seed)
+    return [run(name, data) for name in (algorithms or ALGORITHMS)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the sorting tabs on a seeded workload.")
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--distribution", default="Uniform", choices=list(workloads.DISTRIBUTIONS))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--algorithm", action="append", choices=list(ALGORITHMS),
+                        help="may be repeated; default is every tab")
+    args = parser.parse_args()
+
+    print(f"{args.distribution}, n={args.n}, seed={args.seed}")
+    print(f"{'algorithm':<16}{'steps':>10}{'comparisons':>14}{'seconds':>10}")
+    for r in benchmark(args.n, args.distribution, args.seed, args.algorithm):
+        flag = "" if r["sorted"] else "  NOT SORTED"
+        print(f"{r['algorithm']:<16}{r['steps']:>10}{r['comparisons']:>14}{r['seconds']:>10.3f}{flag}")
@@ -0,0 +1,112 @@
+# topological_sort.py
+import tkinter as tk
+from graph_tab import GraphTab
+from graph_arrays import CSR
+import kahn
+
+
+class TopologicalSortTab(GraphTab):
+    """
+    Kahn's algorithm on the same adjacency input as the BFS tab. Every node
+    with no remaining incoming edge is released together as one frontier
+    (level); the nodes are drawn in columns by level and the output order
+    grows along the bottom. A cycle stops the sort and is drawn in red.
+    """
+
+    TITLE = "Topological Sort"
+    USES_START = False
+
+    def build_options(self, frame):
+        self.counts = None
+        self.levels = []          # Output so far, one list per frontier
+        self.level_of = {}        # node -> level, for the layered layout
+        self.cycle = None
+        self.order_text = None
+
+    def make_steps(self, start, goal):
+        csr = CSR.from_adjacency(self.adjacency_indexed)
+        # Levels up front, for the layout only
+        self.level_of = {}
+        for k, frontier in enumerate(kahn.kahn_levels(csr, kahn.in_degrees(csr))):
+            for v in frontier:
+                self.level_of[v] = k
+        self.levels = []
+        self.cycle = None
+        self.order_text = None
+        self.counts = {"levels": 0, "widest level": 0, "output": 0}
+        return kahn.kahn_steps(csr, kahn.in_degrees(csr), self.counts)
+
+    def layout_coords(self):
+        if len(self.level_of) != self.num_nodes:
+            return super().layout_coords()   # Cyclic: no layering
+        rows = {}
+        coords = []
+        for v in range(self.num_nodes):
+            level = self.level_of[v]
+            coords.append((level, rows.get(level, 0)))
+            rows[level] = rows.get(level, 0) + 1
+        return coords
+
+    def draw_graph_initial(self):
+        super().draw_graph_initial()
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+        self.order_text = self.canvas.create_text(
+            10, h - 10, anchor="sw", width=w - 20, text="Order:",
+            font=("Arial", 10, "bold"), fill="black"
+        )
+
+    def handle_event(self, event):
+        if event[0] == "frontier":
+            _, k, nodes = event
+            self.levels.append([])
+            for v in nodes:
+                self._color_node(v, "khaki")
+            labels = ", ".join(self.node_labels[v] for v in nodes)
+            self._log_step(f"Level {k}: no incoming edges left for {labels}.")
+        elif event[0] == "visit":
+            _, u = event
+            self.levels[-1].append(self.node_labels[u])
+            self._color_node(u, "lightgreen")
+            self._halo_node(None)
+            self._update_order()
+            self._log_step(f"Output {self.node_labels[u]} and remove its edges.")
+        elif event[0] == "indegree":
+            _, v, d = event
+            self._set_node_note(v, f"in: {d}")
+        elif event[0] == "cycle":
+            _, nodes = event
+            self.cycle = nodes
+            for a, b in zip(nodes, nodes[1:] + nodes[:1]):
+                self._set_edge_color(a, b, "red", width=3)
+                self._color_node(a, "red")
+        else:
+            super().handle_event(event)
+
+    def _update_order(self):
+        if self.order_text is not None:
+            order = " | ".join(" ".join(level) for level in self.levels)
+            self.canvas.itemconfig(self.order_text, text=f"Order: {order}")
+
+    def on_complete(self):
+        if self.cycle is not None:
+            labels = " → ".join(self.node_labels[v] for v in self.cycle + self.cycle[:1])
+            self._log_step(f"Cycle {labels}: {self.num_nodes - self.counts['output']} nodes "
+                           f"can never be output, so there is no topological order.")
+            return
+        self._log_step(f"Topological sort complete! {self.counts['output']} nodes in "
+                       f"{self.counts['levels']} levels.")
+
+    def stats_text(self):
+        if self.counts is None:
+            return ""
+        return ", ".join(f"{k}: {v}" for k, v in self.counts.items())
+
+
+# Test
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Topological Sort")
+    tab = TopologicalSortTab(root)
+    tab.pack(expand=True, fill="both")
+    root.mainloop()
@@ -0,0 +1,63 @@
+# trace_cache.py
+"""
+LRU cache of recorded traversal traces for the BFS and DFS tabs.
+
+A trace is every event one run of a step generator yielded, plus the
+final state the tab needs to replay it (distances, ...). Replaying a
+trace draws exactly what the original run drew, without walking the
+graph or sorting any neighbour lists again.
+
+Keys start with the editor's graph digest (SparseEdgeEditor.digest()),
+so a trace is only replayed on the graph and labels it was recorded on;
+the tabs also clear their cache as soon as the editor reports an edit.
+"""
+from collections import OrderedDict
+
+
+class Trace:
+    def __init__(self, events, state=None):
+        self.events = tuple(events)
+        self.state = state or {}
+
+
+class TraceCache:
+    """
+    At most capacity traces and max_events events in total; the least
+    recently used trace goes first. A single trace longer than max_events
+    is not kept at all.
+    """
+
+    def __init__(self, capacity=32, max_events=500000):
+        self.capacity = capacity
+        self.max_events = max_events
+        self.entries = OrderedDict()    # key -> Trace, least recently used first
+        self.events_held = 0
+        self.counts = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key):
+        trace = self.entries.get(key)
+        if trace is None:
+            self.counts["misses"] += 1
+            return None
+        self.entries.move_to_end(key)
+        self.counts["hits"] += 1
+        return trace
+
+    def put(self, key, trace):
+        if key in self.entries:
+            self.events_held -= len(self.entries.pop(key).events)
+        if len(trace.events) > self.max_events:
+            return
+        self.entries[key] = trace
+        self.events_held += len(trace.events)
+        while len(self.entries) > self.capacity or self.events_held > self.max_events:
+            _, old = self.entries.popitem(last=False)
+            self.events_held -= len(old.events)
+            self.counts["evictions"] += 1
+
+    def clear(self):
+        self.entries.clear()
+        self.events_held = 0
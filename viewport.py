@@ -0,0 +1,450 @@
+# viewport.py
+"""
+Zoom, pan and viewport culling for the graph canvases.
+
+A CulledScene holds the graph's ovals, lines and texts in world
+coordinates (the positions the tab laid the graph out at) and only keeps
+a real canvas item for the ones inside the visible part of the world.
+Which items those are comes from a GridIndex: a uniform grid of
+cell x cell squares, each listing the items that touch it (a node's
+bounding box, every cell an edge's segment crosses). Items that scroll
+out of view are hidden and go back to a per-kind pool, and items that
+scroll in take one from the pool, so a pan costs a few coords/itemconfig
+calls instead of creating and deleting canvas items.
+
+Level of detail: the graph never has more than item_budget canvas items,
+shown and pooled together (pooled items past the budget are deleted),
+less whatever the overlays have reserved of it.
+Zoomed in, every edge in view is its own arrow.
+Zoomed out (or with more edges in view than the budget leaves room for),
+ordinary edges are bundled instead: the view is cut into BUNDLE_PX
+squares and all edges running between the same two squares become one
+line from the middle of their ends to the middle of their other ends,
+thicker the more edges it stands for and in their most common color.
+Emphasized edges (drawn EMPHASIS_WIDTH or wider: the current edge, tree
+edges, paths) stay individual arrows, and node labels are dropped below
+LABEL_SCALE or when they would not fit.
+
+The scene mirrors the canvas calls the tabs already make (create_oval,
+create_line, create_text, coords, itemconfig, tag_raise, tag_lower,
+delete), with its own ids, so drawing code only swaps self.canvas for
+self.scene on graph items. Overlays (arrays, labels) stay on the real
+canvas at fixed screen positions.
+"""
+import math
+from collections import Counter
+
+
+class GridIndex:
+    """Sparse uniform grid: (col, row) -> set of keys touching that cell."""
+
+    def __init__(self, cell=64.0):
+        self.cell = cell
+        self.cells = {}
+        self.where = {}     # key -> cells it is listed in
+
+    def __len__(self):
+        return len(self.where)
+
+    def _box_cells(self, x0, y0, x1, y1):
+        c = self.cell
+        return [(i, j)
+                for i in range(math.floor(min(x0, x1) / c), math.floor(max(x0, x1) / c) + 1)
+                for j in range(math.floor(min(y0, y1) / c), math.floor(max(y0, y1) / c) + 1)]
+
+    def _segment_cells(self, x0, y0, x1, y1):
+        """Cells the segment passes through, walked one cell boundary at a time (Amanatides–Woo)."""
+        c = self.cell
+        i, j = math.floor(x0 / c), math.floor(y0 / c)
+        end_i, end_j = math.floor(x1 / c), math.floor(y1 / c)
+        dx, dy = x1 - x0, y1 - y0
+        step_i = 1 if dx > 0 else -1
+        step_j = 1 if dy > 0 else -1
+        # Distance along the segment (0..1) to the next vertical / horizontal cell boundary
+        next_x = ((i + (step_i > 0)) * c - x0) / dx if dx else math.inf
+        next_y = ((j + (step_j > 0)) * c - y0) / dy if dy else math.inf
+        delta_x = c / abs(dx) if dx else math.inf
+        delta_y = c / abs(dy) if dy else math.inf
+        cells = [(i, j)]
+        for _ in range(abs(end_i - i) + abs(end_j - j)):
+            if next_x < next_y:
+                i += step_i
+                next_x += delta_x
+            else:
+                j += step_j
+                next_y += delta_y
+            cells.append((i, j))
+        return cells
+
+    def insert(self, key, kind, coords):
+        """kind "line": coords is a polyline; anything else: a bounding box (or a point)."""
+        if kind == "line":
+            touched = set()
+            for k in range(0, len(coords) - 2, 2):
+                touched.update(self._segment_cells(*coords[k:k + 4]))
+        elif len(coords) == 2:
+            touched = set(self._box_cells(coords[0], coords[1], coords[0], coords[1]))
+        else:
+            touched = set(self._box_cells(*coords[:4]))
+        self.where[key] = touched
+        for cell in touched:
+            self.cells.setdefault(cell, set()).add(key)
+
+    def remove(self, key):
+        for cell in self.where.pop(key, ()):
+            keys = self.cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self.cells[cell]
+
+    def query(self, x0, y0, x1, y1):
+        """Keys listed in any cell the box touches (cell-accurate, so a few just outside)."""
+        found = set()
+        c = self.cell
+        cols = range(math.floor(x0 / c), math.floor(x1 / c) + 1)
+        rows = range(math.floor(y0 / c), math.floor(y1 / c) + 1)
+        if len(cols) * len(rows) > len(self.cells):
+            # Zoomed far out: cheaper to walk the occupied cells than the box
+            for (i, j), keys in self.cells.items():
+                if i in cols and j in rows:
+                    found |= keys
+            return found
+        for i in cols:
+            for j in rows:
+                keys = self.cells.get((i, j))
+                if keys:
+                    found |= keys
+        return found
+
+
+class _Item:
+    __slots__ = ("kind", "coords", "options", "z")
+
+    def __init__(self, kind, coords, options, z):
+        self.kind = kind
+        self.coords = coords
+        self.options = options
+        self.z = z
+
+
+class CulledScene:
+    """
+    World items on canvas, materialized only while they intersect the view
+    and fit in item_budget. screen = world * scale + (offset_x, offset_y).
+    overlay_tags are raised above the graph whenever items are restacked.
+
+    Creating, moving or restyling items only schedules a refresh() for when
+    Tk is idle, so a batch of calls is laid out once.
+    """
+
+    MIN_SCALE = 0.02
+    MAX_SCALE = 20.0
+    # Below this scale edges are bundled, and node labels left out
+    DETAIL_SCALE = 0.5
+    LABEL_SCALE = 0.5
+    # Edges drawn at least this wide are never bundled
+    EMPHASIS_WIDTH = 3
+    # Side of the screen squares edges are bundled between, in pixels
+    BUNDLE_PX = 40
+    # A recycled item is reset to these before taking its new options
+    DEFAULTS = {
+        "oval": {"fill": "", "outline": "black", "width": 1, "dash": ""},
+        "line": {"fill": "black", "width": 1, "arrow": "none", "dash": ""},
+        "text": {"text": "", "fill": "black", "anchor": "center"},
+    }
+
+    def __init__(self, canvas, cell=64.0, overlay_tags=(), item_budget=3000):
+        self.canvas = canvas
+        self.overlay_tags = overlay_tags
+        self.item_budget = item_budget
+        self.reserved = {}      # overlay tag -> canvas items it uses out of item_budget
+        self.index = GridIndex(cell)
+        self.items = {}         # scene id -> _Item
+        self.live = {}          # scene id -> canvas item id, for the materialized ones
+        self.bundles = {}       # (square, square) -> [canvas item id, screen coords, options]
+        self._pool = {kind: [] for kind in self.DEFAULTS}
+        self._next_id = 1
+        self._top = 0
+        self._bottom = 0
+        self._unstacked = False     # Something was materialized out of z order
+        self._scheduled = False
+        self.scale = 1.0
+        self.offset_x = self.offset_y = 0.0
+        self.counts = {"created": 0, "reused": 0, "recycled": 0, "deleted": 0}
+
+    def __len__(self):
+        return len(self.items)
+
+    ###########################################################################
+    # Canvas-like interface (world coordinates, scene ids)
+    ###########################################################################
+    def create_oval(self, *coords, **options):
+        return self._add("oval", coords, options)
+
+    def create_line(self, *coords, **options):
+        return self._add("line", coords, options)
+
+    def create_text(self, *coords, **options):
+        return self._add("text", coords, options)
+
+    def coords(self, sid, *coords):
+        item = self.items[sid]
+        item.coords = coords
+        self.index.remove(sid)
+        self.index.insert(sid, item.kind, coords)
+        if sid in self.live:
+            self.canvas.coords(self.live[sid], *self._to_screen(coords))
+        self._schedule()
+
+    def itemconfig(self, sid, **options):
+        item = self.items.get(sid)
+        if item is None:
+            return
+        item.options.update(options)
+        if sid in self.live:
+            self.canvas.itemconfig(self.live[sid], **options)
+        if item.kind == "line" and self.bundles:
+            self._schedule()    # A bundle's color, or whether the edge is emphasized
+
+    def tag_raise(self, sid):
+        if sid in self.items:
+            self._top += 1
+            self.items[sid].z = self._top
+            if sid in self.live:
+                self.canvas.tag_raise(self.live[sid])
+
+    def tag_lower(self, sid):
+        if sid in self.items:
+            self._bottom -= 1
+            self.items[sid].z = self._bottom
+            if sid in self.live:
+                self.canvas.tag_lower(self.live[sid])
+
+    def delete(self, sid):
+        if sid not in self.items:
+            return
+        if sid in self.live:
+            self._recycle(sid)
+        self.index.remove(sid)
+        del self.items[sid]
+        self._schedule()
+
+    def clear(self):
+        """Forget every item; the caller has already deleted the canvas ("all")."""
+        self.items.clear()
+        self.live.clear()
+        self.bundles.clear()
+        self.index = GridIndex(self.index.cell)
+        for pool in self._pool.values():
+            pool.clear()
+
+    def reserve(self, tag, count):
+        """Set count items of item_budget aside for the overlay drawn under tag."""
+        self.reserved[tag] = count
+        self._schedule()
+
+    def _budget(self):
+        return max(0, self.item_budget - sum(self.reserved.values()))
+
+    ###########################################################################
+    # View
+    ###########################################################################
+    def view_rect(self):
+        w = self.canvas.winfo_width() or 700
+        h = self.canvas.winfo_height() or 500
+        return ((0 - self.offset_x) / self.scale, (0 - self.offset_y) / self.scale,
+                (w - self.offset_x) / self.scale, (h - self.offset_y) / self.scale)
+
+    def to_world(self, sx, sy):
+        return (sx - self.offset_x) / self.scale, (sy - self.offset_y) / self.scale
+
+    def zoom(self, factor, sx, sy):
+        """Zoom by factor, keeping the world point under screen (sx, sy) where it is."""
+        scale = min(self.MAX_SCALE, max(self.MIN_SCALE, self.scale * factor))
+        wx, wy = self.to_world(sx, sy)
+        self.scale = scale
+        self.offset_x = sx - wx * scale
+        self.offset_y = sy - wy * scale
+        self.refresh()
+
+    def pan(self, dx, dy):
+        self.offset_x += dx
+        self.offset_y += dy
+        self.refresh()
+
+    def reset_view(self):
+        self.scale = 1.0
+        self.offset_x = self.offset_y = 0.0
+        self.refresh()
+
+    def refresh(self):
+        """Bring the canvas in line with the view: recycle, reuse, move, rebundle."""
+        self._scheduled = False
+        shown, bundles = self._choose(self.index.query(*self.view_rect()))
+        # Free everything that goes before taking anything, so pools are used first
+        for key in [key for key in self.bundles if key not in bundles]:
+            cid = self.bundles.pop(key)[0]
+            self.canvas.itemconfig(cid, state="hidden")
+            self._pool["line"].append(cid)
+        for sid in [sid for sid in self.live if sid not in shown]:
+            self._recycle(sid)
+        for sid in shown:
+            if sid in self.live:
+                self.canvas.coords(self.live[sid], *self._to_screen(self.items[sid].coords))
+            else:
+                self._materialize(sid)
+                self._unstacked = True
+        self._draw_bundles(bundles)
+        self._trim_pools()
+        if self._unstacked:
+            self._restack()
+
+    ###########################################################################
+    # Internals
+    ###########################################################################
+    def _add(self, kind, coords, options):
+        sid = self._next_id
+        self._next_id += 1
+        self._top += 1
+        self.items[sid] = _Item(kind, coords, dict(options), self._top)
+        self.index.insert(sid, kind, coords)
+        self._schedule()
+        return sid
+
+    def _schedule(self):
+        if not self._scheduled:
+            self._scheduled = True
+            self.canvas.after_idle(self.refresh)
+
+    def _to_screen(self, coords):
+        s, ox, oy = self.scale, self.offset_x, self.offset_y
+        return [c * s + (oy if k % 2 else ox) for k, c in enumerate(coords)]
+
+    def _choose(self, visible):
+        """
+        Split the budget over what is in view, in order: nodes (topmost
+        first), emphasized edges, the other edges (one by one if they all
+        fit and we are zoomed in, else as bundles), then labels.
+        Returns (scene ids to materialize, {key: (screen coords, options)}).
+        """
+        ovals, texts, emphasized, edges = [], [], [], []
+        for sid in visible:
+            item = self.items[sid]
+            if item.kind == "line":
+                wide = item.options.get("width", 1) >= self.EMPHASIS_WIDTH
+                (emphasized if wide else edges).append(sid)
+            else:
+                (ovals if item.kind == "oval" else texts).append(sid)
+
+        room = self._budget()
+        shown = set()
+        for group in (ovals, emphasized):
+            if len(group) > room:
+                group = sorted(group, key=lambda sid: self.items[sid].z)[len(group) - room:]
+            shown.update(group)
+            room -= len(group)
+
+        bundles = {}
+        if self.scale >= self.DETAIL_SCALE and len(edges) <= room:
+            shown.update(edges)
+            room -= len(edges)
+        elif edges and room > 0:
+            bundles = self._bundle(edges, room)
+            room -= len(bundles)
+
+        if self.scale >= self.LABEL_SCALE and len(texts) <= room:
+            shown.update(texts)
+        return shown, bundles
+
+    def _bundle(self, edges, room):
+        """Group edges by the pair of screen squares their ends fall in, coarser until they fit in room."""
+        square = self.BUNDLE_PX / self.scale
+        for _ in range(8):
+            groups = {}
+            for sid in edges:
+                c = self.items[sid].coords
+                a = (math.floor(c[0] / square), math.floor(c[1] / square))
+                b = (math.floor(c[-2] / square), math.floor(c[-1] / square))
+                if a == b:
+                    continue    # Both ends under the same few pixels
+                ends = (c[0], c[1], c[-2], c[-1]) if a < b else (c[-2], c[-1], c[0], c[1])
+                groups.setdefault((a, b) if a < b else (b, a), []).append((sid, ends))
+            if len(groups) <= room:
+                break
+            square *= 2
+        if len(groups) > room:
+            # Still too many: keep the heaviest bundles
+            groups = dict(sorted(groups.items(), key=lambda kv: len(kv[1]))[len(groups) - room:])
+
+        bundles = {}
+        for key, members in groups.items():
+            k = len(members)
+            middle = [sum(ends[q] for _, ends in members) / k for q in range(4)]
+            color = Counter(self.items[sid].options.get("fill", "black") for sid, _ in members)
+            options = {"fill": color.most_common(1)[0][0], "width": min(1 + math.log2(k), 8),
+                       "arrow": "none"}
+            bundles[key] = (self._to_screen(middle), options)
+        return bundles
+
+    def _draw_bundles(self, bundles):
+        """Reuse the drawn bundle line for a key that is still there; touch only what changed."""
+        for key, (screen, options) in bundles.items():
+            drawn = self.bundles.get(key)
+            if drawn is None:
+                cid = self._take("line", screen, options)
+                self.bundles[key] = [cid, screen, options]
+                self._unstacked = True
+                continue
+            cid, old_screen, old_options = drawn
+            if screen != old_screen:
+                self.canvas.coords(cid, *screen)
+                drawn[1] = screen
+            if options != old_options:
+                self.canvas.itemconfig(cid, **options)
+                drawn[2] = options
+
+    def _materialize(self, sid):
+        item = self.items[sid]
+        self.live[sid] = self._take(item.kind, self._to_screen(item.coords), item.options)
+
+    def _take(self, kind, screen, options):
+        """A canvas item of this kind drawn as asked: a pooled one if there is one."""
+        pool = self._pool[kind]
+        if pool:
+            cid = pool.pop()
+            self.canvas.coords(cid, *screen)
+            self.canvas.itemconfig(cid, state="normal", **{**self.DEFAULTS[kind], **options})
+            self.counts["reused"] += 1
+        else:
+            cid = getattr(self.canvas, f"create_{kind}")(*screen, **options)
+            self.counts["created"] += 1
+        return cid
+
+    def _recycle(self, sid):
+        cid = self.live.pop(sid)
+        self.canvas.itemconfig(cid, state="hidden")
+        self._pool[self.items[sid].kind].append(cid)
+        self.counts["recycled"] += 1
+
+    def _trim_pools(self):
+        """Delete pooled items until shown + pooled fits in item_budget."""
+        excess = len(self.live) + len(self.bundles) - self._budget()
+        excess += sum(len(pool) for pool in self._pool.values())
+        for pool in sorted(self._pool.values(), key=len, reverse=True):
+            if excess <= 0 or not pool:
+                break
+            k = min(excess, len(pool))
+            doomed = pool[-k:]
+            del pool[-k:]
+            self.canvas.delete(*doomed)
+            self.counts["deleted"] += len(doomed)
+            excess -= len(doomed)
+
+    def _restack(self):
+        self._unstacked = False
+        for drawn in self.bundles.values():
+            self.canvas.tag_raise(drawn[0])
+        for sid in sorted(self.live, key=lambda sid: self.items[sid].z):
+            self.canvas.tag_raise(self.live[sid])
+        for tag in self.overlay_tags:
+            self.canvas.tag_raise(tag)
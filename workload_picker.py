@@ -0,0 +1,51 @@
+# workload_picker.py
+import tkinter as tk
+from tkinter import ttk
+import workloads
+
+
+class WorkloadPicker(ttk.Frame):
+    """
+    "Workload: [distribution] Seed: [..] [Fill Random Input]" row for the sort tabs.
+    The button calls ``on_fill`` with no arguments; the tab then asks
+    ``values(n)`` for the numbers to put in its fields.
+    """
+
+    def __init__(self, parent, on_fill):
+        super().__init__(parent)
+
+        ttk.Label(self, text="Workload:").grid(row=0, column=0, padx=5, pady=5)
+        self.distribution_var = tk.StringVar(value=next(iter(workloads.DISTRIBUTIONS)))
+        ttk.Combobox(self, textvariable=self.distribution_var, state="readonly", width=14,
+                     values=list(workloads.DISTRIBUTIONS))\
+            .grid(row=0, column=1, padx=5, pady=5)
+
+        ttk.Label(self, text="Seed:").grid(row=0, column=2, padx=5, pady=5)
+        self.seed_entry = ttk.Entry(self, width=6)
+        self.seed_entry.grid(row=0, column=3, padx=5, pady=5)
+        self.seed_entry.insert(0, "1")
+
+        ttk.Button(self, text="Fill Random Input", command=on_fill)\
+            .grid(row=0, column=4, padx=5, pady=5)
+
+        # Flag worst-case generators so nobody mistakes them for typical data
+        self.adversarial_label = ttk.Label(self, text="", foreground="red")
+        self.adversarial_label.grid(row=1, column=0, columnspan=5)
+        self.distribution_var.trace_add("write", self._on_distribution_change)
+
+    def _on_distribution_change(self, *args):
+        adversarial = self.distribution_var.get() in workloads.ADVERSARIAL
+        self.adversarial_label.config(
+            text="Adversarial input: built to drive median-of-three quick sort quadratic"
+            if adversarial else ""
+        )
+
+    def seed(self):
+        text = self.seed_entry.get().strip()
+        try:
+            return int(text)
+        except ValueError:
+            return text  # Any string is a valid (reproducible) seed too
+
+    def values(self, n):
+        return workloads.generate(self.distribution_var.get(), n, self.seed())
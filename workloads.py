@@ -0,0 +1,190 @@
+# workloads.py
+"""
+Seeded input distributions for the sorting tabs and the headless sort engine.
+
+Each distribution takes (n, rng) and returns a list of n ints. Always go
+through generate() with a seed so the same inputs can be fed to every tab
+and runs can be compared.
+"""
+import random
+
+
+def uniform(n, rng):
+    """Independent values in 1..max(n, 99)."""
+    high = max(n, 99)
+    return [rng.randint(1, high) for _ in range(n)]
+
+
+def nearly_sorted(n, rng, k=None):
+    """1..n in order, then k random swaps (default: about 5% of n)."""
+    data = list(range(1, n + 1))
+    if n < 2:
+        return data
+    if k is None:
+        k = max(1, n // 20)
+    for _ in range(k):
+        i = rng.randrange(n)
+        j = rng.randrange(n)
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def reversed_order(n, rng):
+    """n..1."""
+    return list(range(n, 0, -1))
+
+
+def sawtooth(n, rng, teeth=None):
+    """Repeated ascending runs (default: about sqrt(n) runs)."""
+    if teeth is None:
+        teeth = max(1, int(n ** 0.5))
+    period = max(1, -(-n // teeth))  # ceil(n / teeth)
+    return [i % period + 1 for i in range(n)]
+
+
+def few_unique(n, rng, k=5):
+    """Only k distinct values, in random order."""
+    return [rng.randint(1, k) for _ in range(n)]
+
+
+def organ_pipe(n, rng):
+    """Ascending to the middle, then descending: 1 2 3 .. 3 2 1."""
+    half = (n + 1) // 2
+    return list(range(1, half + 1)) + list(range(n - half, 0, -1))
+
+
+def gaussian(n, rng):
+    """Normally distributed around n/2 (sigma n/6), clipped to 1..n."""
+    mu, sigma = n / 2, max(1.0, n / 6)
+    return [min(max(1, round(rng.gauss(mu, sigma))), max(n, 1)) for _ in range(n)]
+
+
+###############################################################################
+# Adversarial inputs
+###############################################################################
+def median_of_three_killer(n, rng=None):
+    """
+    Worst case for QuickSortTab: pivot = median of first/middle/last, swapped
+    to the end, then a Lomuto partition with '<'.
+
+    Replays that scheme on positions instead of values. Each round gives the
+    first slot of the range the smallest unused value and the middle slot the
+    next one, so the median (the pivot) is the second smallest element and the
+    partition only peels two elements off the range: about n²/4 comparisons.
+    Every other element is larger than the pivot, so the partition moves
+    nothing but the pivot itself and each round is replayed in O(1).
+    """
+    slots = list(range(n))   # slots[i] = original position currently at index i
+    values = [0] * n
+    next_value = 1
+    low, high = 0, n - 1
+    while high - low + 1 >= 3:
+        mid = low + (high - low + 1) // 2
+        values[slots[low]] = next_value
+        values[slots[mid]] = next_value + 1
+        next_value += 2
+        # Pivot to the end, then into its final place just after the smallest
+        slots[mid], slots[high] = slots[high], slots[mid]
+        slots[low + 1], slots[high] = slots[high], slots[low + 1]
+        low += 2
+    for i in range(low, high + 1):
+        values[slots[i]] = next_value
+        next_value += 1
+    return values
+
+
+class _Gas:
+    """One element seen by mcilroy_adversary; compares through the adversary."""
+    __slots__ = ("index", "adversary")
+
+    def __init__(self, index, adversary):
+        self.index = index
+        self.adversary = adversary
+
+    def __lt__(self, other):
+        return self.adversary.compare(self.index, other.index) < 0
+
+    def __le__(self, other):
+        return self.adversary.compare(self.index, other.index) <= 0
+
+    def __gt__(self, other):
+        return self.adversary.compare(self.index, other.index) > 0
+
+    def __ge__(self, other):
+        return self.adversary.compare(self.index, other.index) >= 0
+
+
+class _McIlroy:
+    """
+    McIlroy's "killer adversary": every value starts as "gas" (larger than any
+    solid value). When two gas values are compared, one is frozen to the next
+    solid value, preferring the element that looks like the pivot candidate.
+    """
+
+    def __init__(self, n):
+        self.gas = n + 1
+        self.values = [self.gas] * n
+        self.solid = 0
+        self.candidate = None
+
+    def freeze(self, i):
+        self.solid += 1
+        self.values[i] = self.solid
+
+    def compare(self, x, y):
+        if self.values[x] == self.gas and self.values[y] == self.gas:
+            self.freeze(x if x == self.candidate else y)
+        if self.values[x] == self.gas:
+            self.candidate = x
+        elif self.values[y] == self.gas:
+            self.candidate = y
+        return self.values[x] - self.values[y]
+
+
+def mcilroy_adversary(n, sort):
+    """
+    Build a bad input for any comparison sort. ``sort`` must sort a list in
+    place (or return the sorted list) using only <, <=, > and >=.
+    """
+    adversary = _McIlroy(n)
+    sort([_Gas(i, adversary) for i in range(n)])
+    # Anything never compared is still gas; give those the largest values
+    for i in range(n):
+        if adversary.values[i] == adversary.gas:
+            adversary.freeze(i)
+    return adversary.values
+
+
+def _quick_sort_adversary(n, rng):
+    # Imported here: sort_engine imports the tabs, which import this module.
+    import sort_engine
+    return mcilroy_adversary(n, sort_engine.ALGORITHMS["Quick Sort"])
+
+
+DISTRIBUTIONS = {
+    "Uniform": uniform,
+    "Nearly sorted": nearly_sorted,
+    "Reversed": reversed_order,
+    "Sawtooth": sawtooth,
+    "Few unique": few_unique,
+    "Organ pipe": organ_pipe,
+    "Gaussian": gaussian,
+    "Median-of-3 killer": median_of_three_killer,
+    "McIlroy adversary": _quick_sort_adversary,
+}
+
+# Inputs built to hit a worst case rather than to look like real data
+ADVERSARIAL = ("Median-of-3 killer", "McIlroy adversary")
+
+
+def generate(name, n, seed=None, **params):
+    """Build n values from the named distribution; extra params go to the builder."""
+    rng = random.Random(seed)
+    return DISTRIBUTIONS[name](n, rng, **params)
+
+
+def shuffle(values, seed=None):
+    """Return a shuffled copy of values (seeded, so the shuffle can be replayed)."""
+    shuffled = list(values)
+    random.Random(seed).shuffle(shuffled)
+    return shuffled